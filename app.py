@@ -1,17 +1,253 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
 from flask_cors import CORS
+import click
 import requests
 import json
-from datetime import datetime, timedelta
+import os
+import atexit
+import tempfile
+import gzip
+import queue
+import asyncio
+import bisect
+import functools
+import hashlib
+from datetime import datetime, timedelta, timezone
 import random
 import re
+import sqlite3
 import schedule
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote, unquote, urlparse
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Optional: responses are negotiated as gzip-only without it
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # Optional: the async fetch engine runs requests on worker threads without it
 
 app = Flask(__name__)
 CORS(app)
 
+class SourceUnavailableError(requests.exceptions.ConnectionError):
+    """Raised instead of calling an upstream source whose circuit breaker is open"""
+
+class SourceRateLimitedError(SourceUnavailableError):
+    """Raised instead of calling a host that is out of request tokens or inside a Retry-After window"""
+
+    def __init__(self, message, retry_after=0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class SharedCacheStore:
+    """SQLite snapshot store shared between a refresher process and web workers.
+
+    Every publish bumps one store-wide version, so readers can check for new
+    data with a single cheap query and then load only the keys that changed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()  # One connection per thread
+        conn = self.connect()
+        conn.execute('CREATE TABLE IF NOT EXISTS snapshots (key TEXT PRIMARY KEY, version INTEGER, payload TEXT, updated_at REAL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS store_meta (id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER)')
+        conn.execute('CREATE TABLE IF NOT EXISTS refresh_requests (name TEXT PRIMARY KEY, requested_at REAL)')
+        conn.execute('INSERT OR IGNORE INTO store_meta (id, version) VALUES (1, 0)')
+
+    def connect(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+        return conn
+
+    def get_version(self):
+        row = self.connect().execute('SELECT version FROM store_meta WHERE id = 1').fetchone()
+        return row[0] if row else 0
+
+    def publish(self, snapshots):
+        """Write {key: json payload} under a new store version"""
+        conn = self.connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            version = conn.execute('SELECT version FROM store_meta WHERE id = 1').fetchone()[0] + 1
+            now = time.time()
+            conn.executemany(
+                'INSERT OR REPLACE INTO snapshots (key, version, payload, updated_at) VALUES (?, ?, ?, ?)',
+                [(key, version, payload, now) for key, payload in snapshots.items()])
+            conn.execute('UPDATE store_meta SET version = ? WHERE id = 1', (version,))
+            conn.execute('COMMIT')
+            return version
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def read_since(self, version):
+        """Get {key: payload} for snapshots newer than version, and the newest version seen"""
+        rows = self.connect().execute(
+            'SELECT key, version, payload FROM snapshots WHERE version > ?', (version,)).fetchall()
+        latest = max([row[1] for row in rows], default=version)
+        return {key: payload for key, _, payload in rows}, latest
+
+    def request_refresh(self, name):
+        """Ask the refresher to fetch something (a week, a daily refresh, ...)"""
+        self.connect().execute('INSERT OR REPLACE INTO refresh_requests (name, requested_at) VALUES (?, ?)',
+                               (name, time.time()))
+
+    def take_refresh_requests(self):
+        conn = self.connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            names = [row[0] for row in conn.execute('SELECT name FROM refresh_requests ORDER BY requested_at')]
+            conn.execute('DELETE FROM refresh_requests')
+            conn.execute('COMMIT')
+            return names
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+class AsyncFetchEngine:
+    """Runs batches of upstream GETs concurrently on a single asyncio event loop thread.
+
+    fetch_all() is the synchronous facade Flask code calls. Requests are capped
+    per host, paced by the tracker's token buckets and guarded by its circuit
+    breakers; whatever is unfinished at the deadline is cancelled. Transport is
+    aiohttp when installed, otherwise the tracker's pooled requests session on
+    worker threads. Results are requests.Response objects either way, so the
+    existing parse_* code consumes them unchanged.
+    """
+
+    def __init__(self, tracker, per_host_limit=6, max_workers=16):
+        self.tracker = tracker
+        self.per_host_limit = per_host_limit
+        self.max_workers = max_workers
+        self.loop = None
+        self.thread = None
+        self.start_lock = threading.Lock()
+        self.host_semaphores = {}  # host -> asyncio.Semaphore (only touched on the loop thread)
+        self.session = None  # aiohttp.ClientSession, created on the loop thread
+        self.executor = None
+
+    def start(self):
+        """Start the event loop thread once"""
+        with self.start_lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.loop = asyncio.new_event_loop()
+            if aiohttp is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fetch')
+            self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+            self.thread.start()
+
+    def fetch_all(self, urls, deadline=10, **kwargs):
+        """Fetch URLs concurrently; returns {url: Response or exception} for everything that finished in time"""
+        if not urls:
+            return {}
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(self.gather(list(urls), deadline, kwargs), self.loop)
+        try:
+            return future.result(deadline + 1)
+        except Exception as e:
+            future.cancel()
+            print(f"⚠️ Async fetch batch failed: {e}")
+            return {}
+
+    async def gather(self, urls, deadline, kwargs):
+        """Run one batch as a unit: every task finishes or is cancelled before this returns"""
+        tasks = {url: asyncio.ensure_future(self.fetch(url, kwargs, self.loop.time() + deadline)) for url in urls}
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        return {url: task.exception() or task.result() for url, task in tasks.items()
+                if task in done and not task.cancelled()}
+
+    async def fetch(self, url, kwargs, deadline_at):
+        """One GET under its host's semaphore, waiting (within the deadline) for a rate-limit token"""
+        host = urlparse(url).netloc
+        semaphore = self.host_semaphores.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+        async with semaphore:
+            # Waits happen here on the loop, never on a request thread; a few tokens stay
+            # in reserve so the caller's own (non-waiting) requests right after a prefetch go through
+            reserve = self.tracker.prefetch_token_reserve
+            wait = self.tracker.acquire_host_slot(host, reserve)
+            while wait:
+                if self.loop.time() + wait > deadline_at:
+                    raise SourceRateLimitedError(f"Rate limited for {host}, retry in {wait:.1f}s", retry_after=wait)
+                await asyncio.sleep(wait)
+                wait = self.tracker.acquire_host_slot(host, reserve)
+
+            if aiohttp is None:
+                call = functools.partial(self.tracker.http_request, 'GET', url, token_acquired=True, **kwargs)
+                return await self.loop.run_in_executor(self.executor, call)
+            return await self.fetch_aiohttp(url, kwargs)
+
+    def close(self):
+        """Close the aiohttp session and stop the loop (registered to run at exit)"""
+        if self.loop is None or not self.loop.is_running():
+            return
+        if self.session is not None:
+            future = asyncio.run_coroutine_threadsafe(self.session.close(), self.loop)
+            try:
+                future.result(5)
+            except Exception as e:
+                print(f"⚠️ Closing the async HTTP session failed: {e}")
+            self.session = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        if not self.loop.is_running():
+            self.loop.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    async def fetch_aiohttp(self, url, kwargs):
+        """GET with aiohttp, recorded against the source's breaker like http_request"""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit_per_host=self.per_host_limit, keepalive_timeout=30)
+            self.session = aiohttp.ClientSession(connector=connector)
+
+        host, source = self.tracker.begin_upstream_request(url, token_acquired=True)
+        connect_timeout, read_timeout = self.tracker.get_http_timeout(kwargs.get('timeout'))
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        start = time.monotonic()
+        try:
+            async with self.session.get(url, headers=kwargs.get('headers'), params=kwargs.get('params'),
+                                        timeout=timeout) as upstream:
+                response = requests.Response()
+                response.status_code = upstream.status
+                response.reason = upstream.reason
+                response.headers = requests.structures.CaseInsensitiveDict(upstream.headers)
+                response.url = str(upstream.url)
+                response.encoding = upstream.charset
+                response._content = await upstream.read()
+        except asyncio.CancelledError:
+            # Deadline hit: still settle the breaker (a half-open probe must not stay in flight)
+            self.tracker.record_source_result(source, False, time.monotonic() - start, 'Cancelled')
+            raise
+        except asyncio.TimeoutError as e:
+            self.tracker.record_source_result(source, False, time.monotonic() - start, 'Timeout')
+            raise requests.exceptions.Timeout(str(e) or f"Timed out fetching {url}")
+        except aiohttp.ClientError as e:
+            self.tracker.record_source_result(source, False, time.monotonic() - start, type(e).__name__)
+            raise requests.exceptions.ConnectionError(str(e))
+
+        self.tracker.finish_upstream_request(host, source, response, start)
+        return response
+
 class NFLGameTracker:
     def __init__(self):
         self.base_url = "http://site.api.espn.com/apis/site/v2/sports/football/nfl"
@@ -45,11 +281,20 @@ class NFLGameTracker:
             'NFC West': ['ARI', 'LAR', 'SF', 'SEA']
         }
         
-        # Injury data cache for ESPN integration
-        self.injury_cache = {}
-        self.injury_cache_time = None
-        self.news_cache = {}
-        self.news_cache_time = None
+        # Injury data for ESPN integration: one league-wide report carries every team's injuries
+        # (team reports live in team_enrichment_cache under 'injuries', with per-team TTLs)
+        self.league_injuries_url = f"{self.base_url}/injuries"
+        self.injury_ref_cache = {}  # injury ref -> (resolved at, item fingerprint, parsed injury)
+        # Items whose listing changed are re-resolved on the next league fetch; unchanged ones
+        # are reused until this TTL (it bounds staleness for items listed only by $ref)
+        self.injury_ref_ttl = 2 * 3600
+        self.news_cache = {}  # {'news_items': rolling article store, newest first}
+        self.news_cache_time = None  # Last ingestion
+        self.news_refresh_interval = 300  # Seconds between ingestion passes
+        self.news_store_limit = 200  # Articles kept in the rolling store
+        self.news_retention_days = 14
+        self.news_site_url = f"{self.base_url}/news"
+        self.news_rss_url = "https://www.espn.com/nfl/rss.xml"
 
         # Line movement tracking for Phase 2
         self.historical_odds = {}  # Store historical odds data
@@ -67,8 +312,232 @@ class NFLGameTracker:
         # Strict mode: disable all mock/sample data in responses
         self.strict_real_data = True
 
-        # Load persistent cache on startup
+        # Enrichment sections applied to parsed games, in dependency order
+        self.enrichment_sections = ['betting', 'weather', 'injuries', 'analytics', 'news',
+                                    'probabilities', 'advanced_metrics', 'divisional', 'confidence']
+        self.weekly_cache_sections = {}  # Sections applied to each cached week (missing = all)
+
+        # Response views for /api/games: top-level game fields per view (None = every field)
+        self.game_views = {
+            'scores': ['id', 'date', 'status', 'venue', 'home_team', 'away_team', 'home_score', 'away_score'],
+            'picks': ['id', 'date', 'status', 'home_team', 'away_team', 'spread', 'favorite',
+                      'probabilities', 'eliminator'],
+            'full': None
+        }
+
+        # Top-level game fields every fetch path builds (enrichment fields come from field_sections)
+        self.base_game_fields = ['id', 'date', 'status', 'venue', 'venue_id', 'home_team', 'away_team',
+                                 'home_score', 'away_score']
+
+        # Enrichment sections each game field depends on
+        self.field_sections = {
+            'spread': ['betting'],
+            'favorite': ['betting'],
+            'over_under': ['betting'],
+            'home_moneyline': ['betting'],
+            'away_moneyline': ['betting'],
+            'betting': ['betting'],
+            'weather': ['weather'],
+            'injuries': ['injuries'],
+            'analytics': ['analytics'],
+            'news': ['news'],
+            'probabilities': ['betting', 'probabilities'],
+            'advanced_metrics': ['advanced_metrics'],
+            'divisional': ['divisional'],
+            'confidence': ['confidence'],
+            'eliminator': ['betting', 'weather', 'injuries', 'analytics', 'probabilities']
+        }
+
+        # Inputs each enrichment section is derived from; a section is recomputed on
+        # refresh only when one of its inputs changed for that game
+        self.section_inputs = {
+            'weather': ['venue', 'venue_id', 'date'],
+            'injuries': ['home_team.id', 'away_team.id'],
+            'analytics': ['home_team.id', 'away_team.id'],
+            'news': ['home_team.id', 'away_team.id'],
+            'probabilities': ['spread', 'favorite', 'over_under', 'home_moneyline', 'away_moneyline'],
+            'advanced_metrics': ['home_team.abbr', 'away_team.abbr'],
+            'divisional': ['home_team.abbr', 'away_team.abbr'],
+            'confidence': ['date', 'home_team.abbr', 'away_team.abbr', 'home_team.record', 'away_team.record']
+        }
+        # Sections whose upstream data changes while their inputs don't: a refresh re-enriches
+        # them once they are older than this (enrichment time is kept in each game's enriched_at)
+        self.section_ttls = {
+            'weather': 3 * 3600,  # forecasts move as kickoff approaches
+            'injuries': 30 * 60,  # served from the per-team injury cache, so cheap to re-run
+            'news': 30 * 60
+        }
+        self.game_diff_fields = ['status', 'home_score', 'away_score'] + sorted(
+            {field for fields in self.section_inputs.values() for field in fields})
+        self.week_change_logs = {}  # week_key -> recent change log entries
+        self.change_log_limit = 200
+        self.change_log_seq = 0
+
+        # Per-game content hashes by section; week hashes are built from them Merkle-style
+        self.game_hash_sections = {
+            'schedule': ['id', 'date', 'venue', 'home_team.id', 'home_team.abbr', 'home_team.record',
+                         'away_team.id', 'away_team.abbr', 'away_team.record'],
+            'score': ['status', 'home_score', 'away_score'],
+            'odds': ['spread', 'favorite', 'over_under', 'home_moneyline', 'away_moneyline', 'betting'],
+            'weather': ['weather'],
+            'injuries': ['injuries'],
+            'derived': ['analytics', 'news', 'probabilities', 'advanced_metrics', 'divisional', 'confidence']
+        }
+        self.weekly_game_hashes = {}  # week_key -> {game_id: {section: hash}}
+        self.analysis_cache = {}  # game_id -> (game hash, scoring version, eliminator analysis)
+
+        # Current week detection is memoized so each request doesn't hit ESPN
+        self.current_week_cache = None
+        self.current_week_cache_time = None
+        self.current_week_ttl = 600  # 10 minutes
+
+        # Team-level enrichment (stats, injuries) reused across games and weeks
+        self.team_enrichment_cache = {}  # (kind, team_id) -> (fetched_at, value)
+        self.team_enrichment_ttl = 1800  # 30 minutes
+
+        # Shared budget for concurrent upstream week fetches (batch endpoints)
+        self.upstream_fetch_limit = 4
+        self.upstream_fetch_semaphore = threading.BoundedSemaphore(self.upstream_fetch_limit)
+        self.cache_file_lock = threading.Lock()
+
+        # Concurrency model: shared caches are published as new objects by reference
+        # swap (readers take one reference and never see a half-built value); these
+        # locks serialize the writers
+        self.weekly_cache_lock = threading.RLock()  # publishing week data, hashes and metadata
+        self.week_writer_locks = {}  # week_key -> lock held across a week's read-rebuild-publish
+        self.week_writer_locks_guard = threading.Lock()
+        self.injury_cache_lock = threading.Lock()  # single-flight league injury report fetch
+        self.news_ingest_lock = threading.Lock()  # single-flight news ingestion into the article store
+        self.odds_refresh_lock = threading.Lock()  # single-flight odds refresh
+        self.team_records_lock = threading.Lock()
+
+        # Weekly cache persistence: request paths only mark weeks dirty, one writer flushes them
+        self.cache_flush_interval = float(os.environ.get('CACHE_FLUSH_INTERVAL', 5))  # seconds
+        self.dirty_weeks = set()
+        self.dirty_weeks_lock = threading.Lock()
+        self.cache_dirty_event = threading.Event()
+        self.cache_writer_thread = None
+        atexit.register(self.flush_weekly_cache)
+
+        # Warm-start snapshot of the non-weekly caches (odds, lines, records, team data, news)
+        self.warm_snapshot_path = os.environ.get('WARM_SNAPSHOT_PATH', 'warm_snapshot.json')
+        self.warm_snapshot_interval = float(os.environ.get('WARM_SNAPSHOT_INTERVAL', 300))  # seconds
+        self.warm_snapshot_format = 1
+        self.warm_snapshot_fingerprint = None
+        atexit.register(self.write_warm_snapshot)
+
+        # Deployment mode: 'standalone' (one process does everything), 'refresher' (owns all
+        # upstream I/O and publishes snapshots) or 'web' (serves published snapshots only)
+        self.process_mode = os.environ.get('TRACKER_MODE', 'standalone').lower()
+        if self.process_mode not in ('standalone', 'refresher', 'web'):
+            print(f"⚠️ Unknown TRACKER_MODE '{self.process_mode}', running standalone")
+            self.process_mode = 'standalone'
+        self.shared_store = None
+        if self.process_mode != 'standalone':
+            self.shared_store = SharedCacheStore(os.environ.get('SHARED_STORE_PATH', 'tracker_store.sqlite3'))
+        self.shared_store_version = 0
+        self.shared_store_lock = threading.Lock()
+        self.shared_publish_interval = float(os.environ.get('SHARED_PUBLISH_INTERVAL', 5))  # seconds
+        self.published_fingerprints = {}  # snapshot key -> fingerprint last published
+
+        # Per-source circuit breakers and health (source = host + path with ids templated)
+        self.source_health = {}
+        self.source_health_lock = threading.Lock()
+        self.breaker_window = 20  # Recent calls kept per source
+        self.breaker_min_calls = 3  # Calls needed before the failure rate can open a breaker
+        self.breaker_failure_threshold = 0.5  # Failure rate that opens the breaker
+        self.breaker_cooldown = 300  # Seconds open before a half-open probe is let through
+
+        # Pooled HTTP client: one keep-alive session shared by every upstream fetch
+        self.http_pool_hosts = 16  # Distinct upstream hosts kept pooled
+        self.http_pool_size = 10  # Connections kept alive per host (covers concurrent enrichment)
+        self.http_connect_timeout = 3.05
+        self.http_read_timeout = 10  # Default when a caller doesn't pass its own timeout
+        self.http_session = self.create_http_session()
+
+        # Upstream pacing: per-host token buckets and Retry-After windows; failed week fetches retry in the background
+        self.host_rate_limit = (20, 60)  # Default (requests per second, burst) per host
+        self.host_rate_limits = {}  # host -> (requests per second, burst) overrides
+        self.host_limits = {}  # host -> {'tokens', 'updated', 'blocked_until'} (monotonic clock)
+        self.host_limits_lock = threading.Lock()
+        self.rate_limit_default_wait = 5  # Seconds a host is paused after a 429 without Retry-After
+        self.prefetch_token_reserve = 5  # Tokens per host the async prefetch leaves for direct calls
+        self.fetch_retries = {}  # week_key -> {'attempt', 'due', 'sections', 'running'}
+        self.fetch_retries_lock = threading.Lock()
+        self.fetch_retry_event = threading.Event()
+        self.fetch_retry_thread = None
+        self.fetch_retry_base = 2  # Seconds; the backoff ceiling doubles per attempt (full jitter)
+        self.fetch_retry_cap = 300
+        self.fetch_retry_max_attempts = 5
+        self.upstream_failures = threading.local()  # per-thread count of failed upstream calls
+
+        # Async fetch engine: per-team and per-venue fan-out is prefetched in one concurrent round trip
+        self.fetch_engine = AsyncFetchEngine(self, per_host_limit=self.http_pool_size)
+        atexit.register(self.fetch_engine.close)
+        self.prefetch_deadline = 10  # Seconds a prefetch batch may take before unfinished fetches are cancelled
+        self.prefetch_ttl = 60  # Seconds a prefetched response waits to be picked up by http_get
+        self.prefetched_responses = {}  # url -> (expires at, Response), consumed by http_get
+        self.prefetched_responses_lock = threading.Lock()
+
+        # On-disk HTTP cache: validators plus the parsed body per URL, revalidated with conditional GETs
+        self.http_cache_dir = os.environ.get('HTTP_CACHE_DIR', '.http_cache')
+        self.http_cache = {}  # cache key -> {url, etag, last_modified, body_hash, fetched_at, data}
+        self.http_cache_lock = threading.Lock()
+        # Seconds a cached body is served without revalidating, matched against the source key
+        self.http_cache_max_age = {'scoreboard': 10, 'standings': 600, 'nfl/news': 300, 'rss.xml': 300, 'wttr.in': 1800}
+        self.http_cache_max_age.update(json.loads(os.environ.get('HTTP_CACHE_MAX_AGE', '{}')))
+        # Oldest copy (seconds since fetched) served when a source fails; past this callers get None
+        self.http_cache_max_stale = {'scoreboard': 300, 'standings': 86400, 'nfl/news': 6 * 3600,
+                                     'rss.xml': 6 * 3600, 'wttr.in': 6 * 3600}
+        self.http_cache_max_stale.update(json.loads(os.environ.get('HTTP_CACHE_MAX_STALE', '{}')))
+        self.http_cache_default_max_stale = 3600
+        self.http_cache_persist_min_age = 60  # Sources revalidated more often than this stay in memory only
+        self.stale_sources = {}  # source -> fetched_at of the stale copy currently being served
+
+        # Kickoff weather per (venue, UTC hour); also the last known forecast when a fetch fails
+        self.weather_cache = {}
+        self.weather_cache_lock = threading.Lock()
+        self.weather_fetch_limit = 12  # distinct venue forecasts fetched per refresh
+
+        # Deferred startup: schedulers, pollers and cache warm-up start once, in the background
+        self.startup_lock = threading.Lock()
+        self.background_started = False
+        self.warmup_status = {'state': 'pending', 'steps': {}, 'attempts': 0, 'next_retry_at': None,
+                              'started_at': None, 'finished_at': None}
+        self.warmup_retry_base = 30  # seconds before the first retry of failed warm-up steps
+        self.warmup_retry_max = 900
+        self.warmup_retry_event = threading.Event()  # set to cut a warm-up backoff short
+
+        # Response versioning for conditional requests (ETag / If-None-Match)
+        self.scoring_version = '2025.1'  # Bump whenever eliminator scoring logic changes
+        self.odds_snapshot_version = 0  # Incremented on every new odds snapshot
+
+        # Live feed (Server-Sent Events): one poller fans out deltas to every subscriber
+        self.live_subscribers = set()  # queue.Queue per connected client
+        self.live_subscribers_lock = threading.Lock()
+        self.live_poller_thread = None
+        self.live_poll_interval = 30  # seconds between feed checks while clients are connected
+        self.live_queue_size = 100
+        self.live_event_id = 0
+        self.live_game_state = {}  # game_id -> last published score/status
+        self.live_odds_version = None
+        self.live_line_movements = {}  # odds game_id -> last published movements
+        self.live_injury_state = {}  # (team_abbr, player_name) -> status
+
+        # Adaptive scoreboard polling: cadence follows game state, final weeks aren't polled
+        self.poll_intervals = {'live': 20, 'pregame': 3600}  # seconds
+        self.live_poll_window = 5 * 3600  # A "pregame" game is polled live for this long after kickoff
+        self.idle_status_names = ('postponed', 'canceled', 'cancelled', 'suspended')
+        self.score_poll_due = {}  # week_key -> next scoreboard poll time
+        self.live_scoreboard = {}  # week_key -> last polled scores/status
+
+        # Load persistent caches on startup
         self.load_weekly_cache_from_file()
+        if self.upstream_allowed():
+            self.load_warm_snapshot()
+            # Only rewrite the snapshot once something in it actually changes
+            self.warm_snapshot_fingerprint = '|'.join(
+                f"{key}={value}" for key, value, _ in self.get_warm_snapshot_entries())
 
         # ESPN Team ID mapping for injury API
         self.espn_team_ids = {
@@ -82,40 +551,91 @@ class NFLGameTracker:
             'SEA': '26', 'TB': '27', 'TEN': '10', 'WAS': '28'
         }
 
-        # Stadium coordinates for weather API
-        self.venue_coordinates = {
-            'Arrowhead Stadium': (39.0489, -94.4839),
-            'Lambeau Field': (44.5013, -88.0622),
-            'Soldier Field': (41.8623, -87.6167),
-            'Ford Field': (42.3400, -83.0456),
-            'U.S. Bank Stadium': (44.9738, -93.2581),
-            'Lucas Oil Stadium': (39.7601, -86.1639),
-            'Heinz Field': (40.4468, -80.0158),
-            'M&T Bank Stadium': (39.2780, -76.6227),
-            'FirstEnergy Stadium': (41.5061, -81.6995),
-            'Paul Brown Stadium': (39.0955, -84.5160),
-            'Nissan Stadium': (36.1665, -86.7713),
-            'NRG Stadium': (29.6847, -95.4107),
-            'TIAA Bank Field': (30.3238, -81.6374),
-            'Highmark Stadium': (42.7738, -78.7868),
-            'Hard Rock Stadium': (25.9580, -80.2389),
-            'Gillette Stadium': (42.0909, -71.2643),
-            'MetLife Stadium': (40.8135, -74.0745),
-            'Lincoln Financial Field': (39.9008, -75.1675),
-            'FedExField': (38.9077, -76.8645),
-            'Bank of America Stadium': (35.2258, -80.8528),
-            'Mercedes-Benz Stadium': (33.7553, -84.4006),
-            'Raymond James Stadium': (27.9759, -82.5033),
-            'Mercedes-Benz Superdome': (29.9511, -90.0812),
-            'AT&T Stadium': (32.7473, -97.0945),
-            'State Farm Stadium': (33.5276, -112.2626),
-            'Levi\'s Stadium': (37.4030, -121.9698),
-            'SoFi Stadium': (33.9535, -118.3392),
-            'Allegiant Stadium': (36.0909, -115.1833),
-            'Empower Field at Mile High': (39.7439, -105.0201),
-            'Arrowhead Stadium': (39.0489, -94.4839)
+        # Team aliases (nicknames, cities, full names) -> abbreviation, for RSS parsing and news mentions
+        self.team_name_aliases = {
+            'Chiefs': 'KC', 'Kansas City': 'KC',
+            'Bills': 'BUF', 'Buffalo': 'BUF',
+            'Dolphins': 'MIA', 'Miami': 'MIA',
+            'Patriots': 'NE', 'New England': 'NE',
+            'Jets': 'NYJ', 'New York Jets': 'NYJ',
+            'Ravens': 'BAL', 'Baltimore': 'BAL',
+            'Bengals': 'CIN', 'Cincinnati': 'CIN',
+            'Browns': 'CLE', 'Cleveland': 'CLE',
+            'Steelers': 'PIT', 'Pittsburgh': 'PIT',
+            'Titans': 'TEN', 'Tennessee': 'TEN',
+            'Colts': 'IND', 'Indianapolis': 'IND',
+            'Jaguars': 'JAX', 'Jacksonville': 'JAX',
+            'Texans': 'HOU', 'Houston': 'HOU',
+            'Cowboys': 'DAL', 'Dallas': 'DAL',
+            'Giants': 'NYG', 'New York Giants': 'NYG',
+            'Eagles': 'PHI', 'Philadelphia': 'PHI',
+            'Commanders': 'WAS', 'Washington': 'WAS',
+            'Packers': 'GB', 'Green Bay': 'GB',
+            'Bears': 'CHI', 'Chicago': 'CHI',
+            'Lions': 'DET', 'Detroit': 'DET',
+            'Vikings': 'MIN', 'Minnesota': 'MIN',
+            'Falcons': 'ATL', 'Atlanta': 'ATL',
+            'Panthers': 'CAR', 'Carolina': 'CAR',
+            'Saints': 'NO', 'New Orleans': 'NO',
+            'Buccaneers': 'TB', 'Tampa Bay': 'TB', 'Bucs': 'TB',
+            '49ers': 'SF', 'San Francisco': 'SF',
+            'Rams': 'LAR', 'Los Angeles Rams': 'LAR',
+            'Seahawks': 'SEA', 'Seattle': 'SEA',
+            'Cardinals': 'ARI', 'Arizona': 'ARI',
+            'Chargers': 'LAC', 'Los Angeles Chargers': 'LAC',
+            'Raiders': 'LV', 'Las Vegas': 'LV',
+            'Broncos': 'DEN', 'Denver': 'DEN',
+            'Niners': 'SF', 'Pats': 'NE', 'Jags': 'JAX'
         }
-    
+
+        # Alternate abbreviations (ESPN scoreboards use WSH) -> the abbreviation used as key here
+        self.team_abbr_aliases = {'WSH': 'WAS', 'JAC': 'JAX'}
+
+        self.news_name_aliases = {alias.lower(): abbr for alias, abbr in self.team_name_aliases.items()}
+        # Abbreviations matched in news text (case-sensitive); "NO" is left out as an ordinary word
+        self.news_abbr_aliases = {abbr: abbr for abbr in self.espn_team_ids if abbr != 'NO'}
+        self.news_abbr_aliases.update(self.team_abbr_aliases)
+        self.news_index = {'source': None, 'articles': [], 'teams': {}}  # rebuilt when the news list changes
+
+        # Venue registry: coordinates, roof type and local timezone per stadium, looked up by
+        # normalized name/alias or by ESPN venue id (ids are learned from scoreboard data)
+        self.venue_registry = {}  # key -> venue
+        self.venue_names = {}  # normalized name or former name -> key
+        self.venue_ids = {}  # ESPN venue id -> key
+        for name, aliases, coordinates, roof, tz in [
+            ('GEHA Field at Arrowhead Stadium', ['Arrowhead Stadium'], (39.0489, -94.4839), 'open', 'America/Chicago'),
+            ('Lambeau Field', [], (44.5013, -88.0622), 'open', 'America/Chicago'),
+            ('Soldier Field', [], (41.8623, -87.6167), 'open', 'America/Chicago'),
+            ('Ford Field', [], (42.3400, -83.0456), 'dome', 'America/Detroit'),
+            ('U.S. Bank Stadium', [], (44.9738, -93.2581), 'dome', 'America/Chicago'),
+            ('Lucas Oil Stadium', [], (39.7601, -86.1639), 'retractable', 'America/Indiana/Indianapolis'),
+            ('Acrisure Stadium', ['Heinz Field'], (40.4468, -80.0158), 'open', 'America/New_York'),
+            ('M&T Bank Stadium', [], (39.2780, -76.6227), 'open', 'America/New_York'),
+            ('Huntington Bank Field', ['Cleveland Browns Stadium', 'FirstEnergy Stadium'], (41.5061, -81.6995), 'open', 'America/New_York'),
+            ('Paycor Stadium', ['Paul Brown Stadium'], (39.0955, -84.5160), 'open', 'America/New_York'),
+            ('Nissan Stadium', [], (36.1665, -86.7713), 'open', 'America/Chicago'),
+            ('NRG Stadium', [], (29.6847, -95.4107), 'retractable', 'America/Chicago'),
+            ('EverBank Stadium', ['TIAA Bank Field', 'EverBank Field'], (30.3238, -81.6374), 'open', 'America/New_York'),
+            ('Highmark Stadium', [], (42.7738, -78.7868), 'open', 'America/New_York'),
+            ('Hard Rock Stadium', [], (25.9580, -80.2389), 'open', 'America/New_York'),
+            ('Gillette Stadium', [], (42.0909, -71.2643), 'open', 'America/New_York'),
+            ('MetLife Stadium', [], (40.8135, -74.0745), 'open', 'America/New_York'),
+            ('Lincoln Financial Field', [], (39.9008, -75.1675), 'open', 'America/New_York'),
+            ('Northwest Stadium', ['Commanders Field', 'FedExField', 'FedEx Field'], (38.9077, -76.8645), 'open', 'America/New_York'),
+            ('Bank of America Stadium', [], (35.2258, -80.8528), 'open', 'America/New_York'),
+            ('Mercedes-Benz Stadium', [], (33.7553, -84.4006), 'retractable', 'America/New_York'),
+            ('Raymond James Stadium', [], (27.9759, -82.5033), 'open', 'America/New_York'),
+            ('Caesars Superdome', ['Mercedes-Benz Superdome', 'Louisiana Superdome'], (29.9511, -90.0812), 'dome', 'America/Chicago'),
+            ('AT&T Stadium', [], (32.7473, -97.0945), 'retractable', 'America/Chicago'),
+            ('State Farm Stadium', [], (33.5276, -112.2626), 'retractable', 'America/Phoenix'),
+            ("Levi's Stadium", [], (37.4030, -121.9698), 'open', 'America/Los_Angeles'),
+            ('SoFi Stadium', [], (33.9535, -118.3392), 'dome', 'America/Los_Angeles'),
+            ('Allegiant Stadium', [], (36.0909, -115.1833), 'dome', 'America/Los_Angeles'),
+            ('Empower Field at Mile High', ['Mile High Stadium'], (39.7439, -105.0201), 'open', 'America/Denver'),
+            ('Lumen Field', [], (47.5952, -122.3316), 'open', 'America/Los_Angeles'),
+        ]:
+            self.register_venue({'name': name, 'coordinates': coordinates, 'roof': roof, 'timezone': tz}, aliases)
+
     def get_current_season(self):
         """Get current NFL season year"""
         now = datetime.now()
@@ -126,6 +646,21 @@ class NFLGameTracker:
             return now.year - 1
     
     def get_current_week(self):
+        """Detect current NFL week, memoized for a few minutes"""
+        if not self.upstream_allowed():
+            return self.current_week_cache or 1
+
+        now = datetime.now()
+        if (self.current_week_cache and self.current_week_cache_time and
+            (now - self.current_week_cache_time).total_seconds() < self.current_week_ttl):
+            return self.current_week_cache
+
+        week = self.detect_current_week()
+        self.current_week_cache = week
+        self.current_week_cache_time = now
+        return week
+
+    def detect_current_week(self):
         """Detect current NFL week based on date with enhanced fallback logic"""
         now = datetime.now()
 
@@ -170,10 +705,8 @@ class NFLGameTracker:
             scoreboard_url = f"{self.base_url}/scoreboard"
             headers = self.headers
 
-            response = requests.get(scoreboard_url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-
+            data = self.http_get_cached(scoreboard_url, headers=headers, timeout=10)
+            if data is not None:
                 # Try to extract week from ESPN response
                 if 'season' in data and 'type' in data['season']:
                     season_data = data['season']
@@ -230,7 +763,7 @@ class NFLGameTracker:
                 try:
                     # Try a quick head request to ESPN
                     url = f"{self.base_url}/scoreboard?week={test_week}&seasontype=2&year={self.current_season}"
-                    response = requests.head(url, timeout=5)
+                    response = self.http_request('HEAD', url, timeout=5)
                     if response.status_code == 200:
                         available_weeks.append(test_week)
                 except:
@@ -387,7 +920,6 @@ class NFLGameTracker:
     def load_weekly_cache_from_file(self):
         """Load persistent weekly cache from file on startup"""
         try:
-            import os
             if os.path.exists(self.cache_file_path):
                 with open(self.cache_file_path, 'r') as f:
                     cache_data = json.load(f)
@@ -395,6 +927,9 @@ class NFLGameTracker:
                     self.weekly_cache_timestamps = cache_data.get('timestamps', {})
                     self.weekly_cache_hashes = cache_data.get('hashes', {})
                     self.last_refresh_check = cache_data.get('refresh_checks', {})
+                    self.weekly_cache_sections = cache_data.get('sections', {})
+                    for week_key, games in self.weekly_games_cache.items():
+                        self.update_week_hashes(week_key, games)
                     print(f"Loaded weekly cache for {len(self.weekly_games_cache)} weeks")
         except Exception as e:
             print(f"Could not load cache file: {e}")
@@ -402,39 +937,144 @@ class NFLGameTracker:
             self.weekly_cache_timestamps = {}
             self.weekly_cache_hashes = {}
             self.last_refresh_check = {}
+            self.weekly_cache_sections = {}
+
+    def mark_week_dirty(self, week_key):
+        """Queue a week for persistence; the background writer flushes it to disk"""
+        with self.dirty_weeks_lock:
+            self.dirty_weeks.add(week_key)
+            if self.cache_writer_thread is None or not self.cache_writer_thread.is_alive():
+                self.cache_writer_thread = threading.Thread(target=self.run_cache_writer, daemon=True)
+                self.cache_writer_thread.start()
+        self.cache_dirty_event.set()
+
+    def run_cache_writer(self):
+        """Background writer: batch dirty weeks for one flush interval, then persist them"""
+        while True:
+            self.cache_dirty_event.wait()
+            time.sleep(self.cache_flush_interval)
+            self.flush_weekly_cache()
+
+    def flush_weekly_cache(self):
+        """Persist the weekly cache if any week is dirty (also runs at shutdown)"""
+        with self.dirty_weeks_lock:
+            if not self.dirty_weeks:
+                return False
+            dirty_weeks = self.dirty_weeks
+            self.dirty_weeks = set()
+            self.cache_dirty_event.clear()
+
+        if self.save_weekly_cache_to_file():
+            print(f"💾 Flushed weekly cache ({len(dirty_weeks)} dirty weeks: {', '.join(sorted(map(str, dirty_weeks)))})")
+            return True
+
+        # Keep them dirty so the next flush retries
+        with self.dirty_weeks_lock:
+            self.dirty_weeks.update(dirty_weeks)
+        self.cache_dirty_event.set()
+        return False
 
     def save_weekly_cache_to_file(self):
-        """Save weekly cache to file for persistence"""
+        """Save weekly cache to file atomically (temp file + fsync + rename)"""
         try:
+            # Copy the top-level dicts first so concurrent fetches can't resize them mid-dump
             cache_data = {
-                'games': self.weekly_games_cache,
+                'games': dict(self.weekly_games_cache),
                 'timestamps': {k: v.isoformat() if isinstance(v, datetime) else v
-                              for k, v in self.weekly_cache_timestamps.items()},
-                'hashes': self.weekly_cache_hashes,
+                              for k, v in dict(self.weekly_cache_timestamps).items()},
+                'hashes': dict(self.weekly_cache_hashes),
                 'refresh_checks': {k: v.isoformat() if isinstance(v, datetime) else v
-                                  for k, v in self.last_refresh_check.items()}
+                                  for k, v in dict(self.last_refresh_check).items()},
+                'sections': dict(self.weekly_cache_sections)
             }
-            with open(self.cache_file_path, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            with self.cache_file_lock:
+                self.write_json_file(self.cache_file_path, cache_data, indent=2, raise_errors=True)
+            return True
         except Exception as e:
             print(f"Could not save cache file: {e}")
+            return False
+
+    def write_json_file(self, path, data, indent=None, raise_errors=False):
+        """Write JSON crash-safely: temp file in the same directory, fsync, then rename"""
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, indent=indent, default=str)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.chmod(temp_path, 0o644)  # mkstemp creates files owner-only
+                os.replace(temp_path, path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+
+            # Make the rename itself durable
+            if hasattr(os, 'O_DIRECTORY'):
+                dir_fd = os.open(directory, os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            return True
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"Could not write {path}: {e}")
+            return False
+
+    def calculate_game_hashes(self, game):
+        """Hash each content section of a game; the 'game' entry covers all sections"""
+        hashes = {}
+        for section, fields in self.game_hash_sections.items():
+            values = [self.get_game_field(game, field) for field in fields]
+            hashes[section] = hashlib.md5(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+        hashes['game'] = hashlib.md5(':'.join(hashes[section] for section in self.game_hash_sections).encode()).hexdigest()
+        return hashes
+
+    def combine_game_hashes(self, game_hashes, sections=('game',)):
+        """Merkle-style root over the selected section hashes of each game"""
+        leaves = [f"{game_id}:" + ':'.join(hashes[section] for section in sections)
+                  for game_id, hashes in game_hashes.items()]
+        return hashlib.md5('|'.join(leaves).encode()).hexdigest()
 
     def calculate_data_hash(self, games_data):
         """Calculate hash of games data to detect changes"""
-        import hashlib
-        # Create a simplified representation for hashing
-        hash_data = []
-        for game in games_data:
-            hash_data.append({
-                'id': game.get('id'),
-                'home_team': game.get('home_team', {}).get('abbr'),
-                'away_team': game.get('away_team', {}).get('abbr'),
-                'date': game.get('date'),
-                'status': game.get('status'),
-                'spread': game.get('spread')
-            })
-        data_string = json.dumps(hash_data, sort_keys=True)
-        return hashlib.md5(data_string.encode()).hexdigest()
+        return self.combine_game_hashes({game.get('id'): self.calculate_game_hashes(game) for game in games_data})
+
+    def update_week_hashes(self, week_key, games):
+        """Recompute a week's per-game section hashes and its root hash"""
+        game_hashes = {game.get('id'): self.calculate_game_hashes(game) for game in games}
+        self.weekly_game_hashes[week_key] = game_hashes
+        self.weekly_cache_hashes[week_key] = self.combine_game_hashes(game_hashes)
+        return self.weekly_cache_hashes[week_key]
+
+    def get_week_section_hash(self, week, sections):
+        """Root hash of a week over just the given sections (e.g. schedule and score)"""
+        week_key = str(week)
+        if week_key not in self.weekly_game_hashes and week_key in self.weekly_games_cache:
+            self.update_week_hashes(week_key, self.weekly_games_cache[week_key])
+        game_hashes = self.weekly_game_hashes.get(week_key)
+        return self.combine_game_hashes(game_hashes, sections) if game_hashes else None
+
+    def get_hash_sections_for_fields(self, fields=None):
+        """Map projected game fields to hash sections (None when a field depends on everything)"""
+        if fields is None:
+            return None
+
+        field_sections = {}
+        for section, section_fields in self.game_hash_sections.items():
+            for field in section_fields:
+                field_sections.setdefault(field.split('.')[0], section)
+
+        sections = set()
+        for field in fields:
+            if field not in field_sections:
+                return None
+            sections.add(field_sections[field])
+        return [section for section in self.game_hash_sections if section in sections]
 
     def is_cache_expired(self, week):
         """Check if weekly cache has expired (week ended)"""
@@ -476,10 +1116,217 @@ class NFLGameTracker:
         # Check twice daily (every 12 hours)
         return hours_since_check >= 12
 
-    def get_games_for_week(self, week=1):
-        """Smart weekly caching: Return cached data instantly, refresh intelligently"""
+    def is_week_cache_current(self, week):
+        """Check if get_games_for_week would serve this week from cache without refetching"""
+        if not self.upstream_allowed():
+            return str(week) in self.weekly_games_cache
+        return (str(week) in self.weekly_games_cache and
+                not self.is_cache_expired(week) and
+                not self.needs_refresh_check(week))
+
+    def get_week_etag(self, week, variant='', sections=None):
+        """Build a strong ETag for a week's API responses.
+
+        Derived from the week data hash, the odds snapshot version and the scoring
+        version, so a change to any of them invalidates client copies. With
+        sections, only those per-game section hashes count (e.g. a scores view
+        is unaffected by weather or odds changes).
+        """
+        if sections:
+            week_hash = self.get_week_section_hash(week, sections)
+            snapshot = 'sections'
+        else:
+            week_hash = self.weekly_cache_hashes.get(str(week))
+            snapshot = self.odds_snapshot_version
+        if not week_hash:
+            return None
+
+        fingerprint = f"{week_hash}:{snapshot}:{self.scoring_version}:{variant}"
+        return hashlib.md5(fingerprint.encode()).hexdigest()
+
+    def get_week_last_modified(self, week):
+        """Get the most recent time the week's data or the odds behind it changed"""
+        candidates = [self.weekly_cache_timestamps.get(str(week)), self.odds_cache_time]
+        times = []
+        for value in candidates:
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            if isinstance(value, datetime):
+                times.append(value)
+        return max(times) if times else None
+
+    def get_sections_for_fields(self, fields=None):
+        """Resolve which enrichment sections are needed to build the given game fields"""
+        if fields is None:
+            return list(self.enrichment_sections)
+
+        needed = set()
+        for field in fields:
+            needed.update(self.field_sections.get(field, []))
+        return [section for section in self.enrichment_sections if section in needed]
+
+    def get_week_sections(self, week_key):
+        """Get the enrichment sections already applied to a cached week"""
+        return self.weekly_cache_sections.get(week_key, self.enrichment_sections)
+
+    def get_week_writer_lock(self, week_key):
+        """Lock serializing the writers of one week (refresh merge, score merge, lazy enrichment).
+
+        Writers hold it from reading the published week to swapping in the rebuilt
+        one, so a slow writer can never publish over another writer's update.
+        """
+        with self.week_writer_locks_guard:
+            return self.week_writer_locks.setdefault(str(week_key), threading.RLock())
+
+    def ensure_week_sections(self, week, sections):
+        """Run any enrichment sections a cached week is still missing"""
+        week_key = str(week)
+        if all(section in self.get_week_sections(week_key) for section in sections):
+            return self.weekly_games_cache[week_key]
+
+        with self.get_week_writer_lock(week_key):
+            # Re-check under the lock: a concurrent request may have just filled them in
+            applied = self.get_week_sections(week_key)
+            missing = [section for section in sections if section not in applied]
+            if not missing:
+                return self.weekly_games_cache[week_key]
+
+            print(f"🧩 Enriching cached Week {week} with: {', '.join(missing)}")
+            # Enrich copies so readers of the published week never see games change under them
+            games = [dict(game) for game in self.weekly_games_cache[week_key]]
+            games = self.enhance_games_data(games, missing, week)
+            with self.weekly_cache_lock:
+                self.weekly_games_cache[week_key] = games
+                self.weekly_cache_sections[week_key] = [
+                    section for section in self.enrichment_sections if section in applied or section in missing
+                ]
+                self.update_week_hashes(week_key, games)
+        self.mark_week_dirty(week_key)
+        return games
+
+    def get_game_field(self, game, field):
+        """Read a dotted field path such as 'home_team.abbr' from a game"""
+        value = game
+        for part in field.split('.'):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    def get_known_game_fields(self):
+        """Field names ?fields= may ask for: the views, base and enrichment fields, and cached game keys"""
+        known = set(self.base_game_fields) | set(self.field_sections)
+        for fields in self.game_views.values():
+            known.update(fields or [])
+        for games in list(self.weekly_games_cache.values()):
+            for game in games:
+                known.update(game)
+        return known
+
+    def diff_game(self, cached_game, fresh_game):
+        """Compare the tracked fields of two versions of a game"""
+        changes = {}
+        for field in self.game_diff_fields:
+            old_value = self.get_game_field(cached_game, field)
+            new_value = self.get_game_field(fresh_game, field)
+            if old_value != new_value:
+                changes[field] = {'from': old_value, 'to': new_value}
+        return changes
+
+    def merge_week_games(self, week, fresh_games, sections):
+        """Merge a fresh, unenriched fetch into the cached week keyed on game id.
+
+        Enrichment is kept wherever its inputs didn't change and it is within its
+        section TTL; only stale sections (and new games) are re-enriched. Returns
+        (merged games, change log entries). Call with the week's writer lock held.
+        """
+        cached_by_id = {game.get('id'): game for game in self.weekly_games_cache.get(str(week), [])}
+        stale = {section: [] for section in sections if section != 'betting'}
+        fresh_sections = [section for section in ('betting',) if section in sections]
+        merged = []
+        changes = []
+
+        for fresh in fresh_games:
+            cached = cached_by_id.pop(fresh.get('id'), None)
+            if cached is None:
+                merged.append(fresh)
+                for games in stale.values():
+                    games.append(fresh)
+                changes.append({'game_id': fresh.get('id'), 'type': 'added', 'fields': {}, 'sections': list(stale)})
+                continue
+
+            fields = self.diff_game(cached, fresh)
+            expired = self.get_expired_sections(cached, stale)
+            if not fields and not expired:
+                merged.append(cached)
+                continue
+
+            # Fresh schedule/score/betting fields on top of the cached enrichment; the
+            # fresh fetch only ran fresh_sections, so the rest keep their cached state
+            game = dict(cached)
+            game.update(fresh)
+            game['enriched_at'] = dict(cached.get('enriched_at', {}), **fresh.get('enriched_at', {}))
+            game['missing_sections'] = cached.get('missing_sections', [])
+            self.mark_missing_sections(game, fresh_sections, fresh.get('missing_sections', []))
+            stale_sections = [section for section in stale
+                              if section in expired or
+                              any(field in fields for field in self.section_inputs.get(section, []))]
+            for section in stale_sections:
+                stale[section].append(game)
+            merged.append(game)
+            changes.append({'game_id': game.get('id'), 'type': 'updated' if fields else 'refreshed',
+                            'fields': fields, 'sections': stale_sections})
+
+        for game_id in cached_by_id:
+            changes.append({'game_id': game_id, 'type': 'removed', 'fields': {}, 'sections': []})
+
+        for section in self.enrichment_sections:
+            if stale.get(section):
+                print(f"🧩 Re-enriching {section} for {len(stale[section])} changed games in Week {week}")
+                self.enhance_games_data(stale[section], [section], week)
+
+        return merged, changes
+
+    def get_expired_sections(self, game, sections):
+        """Sections of a game older than their section TTL (or never timed)"""
+        now = time.time()
+        enriched_at = game.get('enriched_at', {})
+        return [section for section in sections
+                if section in self.section_ttls and now - enriched_at.get(section, 0) >= self.section_ttls[section]]
+
+    def record_week_changes(self, week, changes, publish=True):
+        """Append entries to a week's change log and push them to live subscribers"""
+        week_key = str(week)
+        log = self.week_change_logs.setdefault(week_key, [])
+        now = datetime.now().isoformat()
+        for change in changes:
+            self.change_log_seq += 1
+            change.update(seq=self.change_log_seq, week=week, time=now)
+            log.append(change)
+            if publish:
+                self.publish_live_event('game_update', change)
+        del log[:-self.change_log_limit]
+
+    def get_week_changes(self, week, since=0):
+        """Get change log entries for a week newer than a sequence number"""
+        return [change for change in self.week_change_logs.get(str(week), []) if change['seq'] > since]
+
+    def get_games_for_week(self, week=1, sections=None):
+        """Smart weekly caching: Return cached data instantly, refresh intelligently
+
+        sections limits enrichment to what the caller needs (None = every section);
+        sections skipped now are filled in lazily by a later request that needs them.
+        """
         week_key = str(week)
         now = datetime.now()
+        if sections is None:
+            sections = list(self.enrichment_sections)
+
+        if not self.upstream_allowed():
+            # Web workers serve what the refresher published and ask it for anything missing
+            if week_key not in self.weekly_games_cache:
+                self.shared_store.request_refresh(f"week:{week}")
+            return self.weekly_games_cache.get(week_key, [])
 
         print(f"Smart cache check for Week {week} of {self.current_season} season...")
 
@@ -493,46 +1340,53 @@ class NFLGameTracker:
             if self.needs_refresh_check(week):
                 print(f"⏰ Performing background refresh check for Week {week}")
 
-                # Try to get fresh data to compare
-                fresh_games = self.fetch_fresh_games_data(week)
-                if fresh_games:
-                    # Calculate hash of fresh data
-                    fresh_hash = self.calculate_data_hash(fresh_games)
-
-                    # Compare with cached hash
-                    if (week_key not in self.weekly_cache_hashes or
-                        fresh_hash != self.weekly_cache_hashes[week_key]):
-
-                        print(f"🔄 Data changed, updating cache for Week {week}")
-                        # Data has changed, update cache
-                        self.weekly_games_cache[week_key] = fresh_games
-                        self.weekly_cache_timestamps[week_key] = now
-                        self.weekly_cache_hashes[week_key] = fresh_hash
-                        self.save_weekly_cache_to_file()
+                # Refresh with every section the cached week already carries
+                applied = self.get_week_sections(week_key)
+                refresh_sections = [s for s in self.enrichment_sections if s in applied or s in sections]
 
-                        return fresh_games
-                    else:
-                        print(f"📝 No changes detected, keeping cache for Week {week}")
+                # Fetch the schedule plus (cheap, cached) betting lines, then merge game by game
+                fresh_games = self.fetch_fresh_games_data(week, [s for s in ['betting'] if s in refresh_sections])
+                if fresh_games:
+                    with self.get_week_writer_lock(week_key):
+                        # Merge against the week as published now; sections it lacks are
+                        # added to every game by ensure_week_sections below
+                        applied = self.get_week_sections(week_key)
+                        refresh_sections = [s for s in self.enrichment_sections if s in applied]
+                        merged_games, changes = self.merge_week_games(week, fresh_games, refresh_sections)
+
+                        if changes:
+                            print(f"🔄 {len(changes)} game changes, updating cache for Week {week}")
+                            with self.weekly_cache_lock:
+                                self.weekly_games_cache[week_key] = merged_games
+                                self.weekly_cache_timestamps[week_key] = now
+                                self.update_week_hashes(week_key, merged_games)
+                                self.weekly_cache_sections[week_key] = refresh_sections
+                                self.last_refresh_check[week_key] = now
+                                self.record_week_changes(week, changes)
+                            self.mark_week_dirty(week_key)
+                        else:
+                            print(f"📝 No changes detected, keeping cache for Week {week}")
 
                 # Update refresh check time regardless
                 self.last_refresh_check[week_key] = now
-                self.save_weekly_cache_to_file()
+                self.mark_week_dirty(week_key)
 
-            # Return cached data
-            return self.weekly_games_cache[week_key]
+            # Return cached data, enriched with anything the caller needs that it lacks
+            return self.ensure_week_sections(week, sections)
 
         # Step 2: No valid cache, fetch fresh data
         print(f"💾 No valid cache for Week {week}, fetching fresh data...")
-        fresh_games = self.fetch_fresh_games_data(week)
+        fresh_games = self.fetch_fresh_games_data(week, sections)
 
         if fresh_games:
             # Cache the fresh data
-            data_hash = self.calculate_data_hash(fresh_games)
-            self.weekly_games_cache[week_key] = fresh_games
-            self.weekly_cache_timestamps[week_key] = now
-            self.weekly_cache_hashes[week_key] = data_hash
-            self.last_refresh_check[week_key] = now
-            self.save_weekly_cache_to_file()
+            with self.get_week_writer_lock(week_key), self.weekly_cache_lock:
+                self.weekly_games_cache[week_key] = fresh_games
+                self.weekly_cache_timestamps[week_key] = now
+                self.update_week_hashes(week_key, fresh_games)
+                self.weekly_cache_sections[week_key] = list(sections)
+                self.last_refresh_check[week_key] = now
+            self.mark_week_dirty(week_key)
 
             print(f"✅ Cached {len(fresh_games)} games for Week {week}")
             return fresh_games
@@ -578,11 +1432,425 @@ Check the console logs above for specific API error details.
                 games = self.force_current_2025_records_on_games(games)
             return games
 
-    def fetch_fresh_games_data(self, week):
-        """Fetch fresh games data from ESPN API with enhanced retry logic and multiple endpoints"""
-        import time
-        import random
+    def get_source_key(self, url):
+        """Identify an upstream source by host and path, with numeric ids templated out"""
+        parsed = urlparse(url)
+        return f"{parsed.netloc}{re.sub(r'/[0-9]+(?=/|$)', '/{id}', parsed.path)}"
+
+    def get_source_stats(self, source):
+        """Get (creating if needed) the breaker and health record for a source"""
+        stats = self.source_health.get(source)
+        if stats is None:
+            stats = {
+                'state': 'closed',
+                'results': deque(maxlen=self.breaker_window),  # (ok, latency seconds)
+                'opened_at': None,
+                'probe_in_flight': False,
+                'total_calls': 0,
+                'total_failures': 0,
+                'last_error': None,
+                'last_success': None
+            }
+            self.source_health[source] = stats
+        return stats
+
+    def is_source_available(self, url):
+        """Whether a call to this URL would currently be let through (no state change)"""
+        with self.source_health_lock:
+            stats = self.source_health.get(self.get_source_key(url))
+            if stats is None or stats['state'] == 'closed':
+                return True
+            if stats['state'] == 'half_open':
+                return not stats['probe_in_flight']
+            return time.time() - stats['opened_at'] >= self.breaker_cooldown
+
+    def allow_source_request(self, source):
+        """Breaker gate: closed passes, open fails fast, and after the cooldown one probe goes through"""
+        with self.source_health_lock:
+            stats = self.get_source_stats(source)
+            if stats['state'] == 'open':
+                if time.time() - stats['opened_at'] < self.breaker_cooldown:
+                    return False
+                stats['state'] = 'half_open'
+                stats['probe_in_flight'] = False
+            if stats['state'] == 'half_open':
+                if stats['probe_in_flight']:
+                    return False
+                stats['probe_in_flight'] = True
+            return True
+
+    def record_source_result(self, source, ok, latency, error=None):
+        """Record a call outcome and open or close the source's breaker accordingly"""
+        with self.source_health_lock:
+            stats = self.get_source_stats(source)
+            stats['results'].append((ok, latency))
+            stats['total_calls'] += 1
+            if ok:
+                stats['last_success'] = datetime.now().isoformat()
+            else:
+                stats['total_failures'] += 1
+                stats['last_error'] = error
+
+            if stats['state'] == 'half_open':
+                stats['probe_in_flight'] = False
+                if ok:
+                    print(f"🟢 Circuit closed for {source} (probe succeeded)")
+                    stats['state'] = 'closed'
+                    stats['results'].clear()
+                    stats['results'].append((ok, latency))
+                else:
+                    stats['state'] = 'open'
+                    stats['opened_at'] = time.time()
+                return
+
+            failures = sum(1 for result_ok, _ in stats['results'] if not result_ok)
+            if (stats['state'] == 'closed' and len(stats['results']) >= self.breaker_min_calls and
+                    failures / len(stats['results']) >= self.breaker_failure_threshold):
+                print(f"🔴 Circuit opened for {source} ({failures}/{len(stats['results'])} recent calls failed)")
+                stats['state'] = 'open'
+                stats['opened_at'] = time.time()
+
+    def create_http_session(self):
+        """Build the shared requests session with per-host keep-alive pools"""
+        session = requests.Session()
+        # Only retry a dropped connection once, immediately (e.g. a stale keep-alive socket);
+        # HTTP error statuses are left to the caller and the circuit breakers
+        retries = Retry(total=1, connect=1, read=1, status=0, redirect=3, backoff_factor=0,
+                        allowed_methods=frozenset({'GET', 'HEAD'}), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self.http_pool_hosts, pool_maxsize=self.http_pool_size,
+                              max_retries=retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_http_timeout(self, timeout=None):
+        """Normalize a timeout to (connect, read) so slow handshakes fail fast"""
+        if isinstance(timeout, tuple):
+            return timeout
+        read_timeout = timeout if timeout is not None else self.http_read_timeout
+        return (min(self.http_connect_timeout, read_timeout), read_timeout)
+
+    def acquire_host_slot(self, host, reserve=0):
+        """Per-host token bucket: take a token and return 0, or return the seconds until one is available.
+
+        reserve leaves that many tokens in the bucket (prefetch keeps headroom for direct calls).
+        """
+        rate, burst = self.host_rate_limits.get(host, self.host_rate_limit)
+        now = time.monotonic()
+        with self.host_limits_lock:
+            limits = self.host_limits.setdefault(host, {'tokens': burst, 'updated': now, 'blocked_until': 0})
+            if now < limits['blocked_until']:
+                return limits['blocked_until'] - now
+            limits['tokens'] = min(burst, limits['tokens'] + (now - limits['updated']) * rate)
+            limits['updated'] = now
+            if limits['tokens'] < 1 + reserve:
+                return (1 + reserve - limits['tokens']) / rate
+            limits['tokens'] -= 1
+            return 0
+
+    def pause_host(self, host, seconds):
+        """Hold off every request to a host for the given number of seconds"""
+        with self.host_limits_lock:
+            rate, burst = self.host_rate_limits.get(host, self.host_rate_limit)
+            limits = self.host_limits.setdefault(host, {'tokens': burst, 'updated': time.monotonic(), 'blocked_until': 0})
+            limits['blocked_until'] = max(limits['blocked_until'], time.monotonic() + seconds)
+
+    def parse_retry_after(self, value):
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), None if absent or invalid"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def begin_upstream_request(self, url, token_acquired=False):
+        """Admission checks for an upstream call: host rate limit, then the source's breaker"""
+        host = urlparse(url).netloc
+        if not token_acquired:
+            wait = self.acquire_host_slot(host)
+            if wait:
+                raise SourceRateLimitedError(f"Rate limited for {host}, retry in {wait:.1f}s", retry_after=wait)
+
+        source = self.get_source_key(url)
+        if not self.allow_source_request(source):
+            raise SourceUnavailableError(f"Circuit open for {source}")
+        return host, source
+
+    def http_request(self, method, url, token_acquired=False, **kwargs):
+        """Upstream HTTP call over the pooled session, paced per host and guarded by the source's circuit breaker.
+
+        Never waits: an exhausted token bucket or an active Retry-After window
+        raises SourceRateLimitedError so the caller can fall back or retry later.
+        """
+        try:
+            host, source = self.begin_upstream_request(url, token_acquired)
+        except SourceUnavailableError:
+            self.note_upstream_failure()
+            raise
+
+        kwargs['timeout'] = self.get_http_timeout(kwargs.get('timeout'))
+        start = time.monotonic()
+        try:
+            response = self.http_session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException as e:
+            self.record_source_result(source, False, time.monotonic() - start, type(e).__name__)
+            self.note_upstream_failure()
+            raise
+
+        self.finish_upstream_request(host, source, response, start)
+        if response.status_code == 429 or response.status_code >= 500:
+            self.note_upstream_failure()
+        return response
+
+    def finish_upstream_request(self, host, source, response, start):
+        """Record an upstream response against its breaker and honor any Retry-After it carries"""
+        ok = response.status_code < 400
+        self.record_source_result(source, ok, time.monotonic() - start, None if ok else f"HTTP {response.status_code}")
+
+        if response.status_code in (429, 503):
+            retry_after = self.parse_retry_after(response.headers.get('Retry-After'))
+            if retry_after is None and response.status_code == 429:
+                retry_after = self.rate_limit_default_wait
+            if retry_after:
+                print(f"🚦 {host} asked us to back off for {retry_after:.0f}s")
+                self.pause_host(host, retry_after)
+
+    def http_get(self, url, **kwargs):
+        """GET an upstream URL, taking a prefetched response if one is waiting"""
+        if not kwargs.get('params'):
+            response = self.take_prefetched_response(url)
+            if response is not None:
+                return response
+        return self.http_request('GET', url, **kwargs)
+
+    def prefetch_urls(self, urls, deadline=None):
+        """Fetch URLs concurrently on the async engine and park the responses for http_get to pick up.
+
+        Callers then run their usual sequential code; each http_get for a
+        prefetched URL returns immediately, so a fan-out costs one round trip.
+        """
+        if not self.upstream_allowed():
+            return 0
+        urls = [url for url in dict.fromkeys(urls)
+                if url not in self.prefetched_responses and self.is_source_available(url)]
+        if not urls:
+            return 0
+
+        start = time.monotonic()
+        results = self.fetch_engine.fetch_all(urls, deadline or self.prefetch_deadline, headers=self.headers)
+        expires_at = time.monotonic() + self.prefetch_ttl
+        with self.prefetched_responses_lock:
+            now = time.monotonic()
+            self.prefetched_responses = {url: entry for url, entry in self.prefetched_responses.items()
+                                         if entry[0] > now}
+            for url, result in results.items():
+                if not isinstance(result, Exception):
+                    self.prefetched_responses[url] = (expires_at, result)
+        fetched = sum(1 for result in results.values() if not isinstance(result, Exception))
+        print(f"⚡ Prefetched {fetched}/{len(urls)} upstream responses in {time.monotonic() - start:.2f}s")
+        return fetched
+
+    def take_prefetched_response(self, url):
+        """Pop a still-fresh prefetched response for a URL"""
+        if not self.prefetched_responses:
+            return None
+        with self.prefetched_responses_lock:
+            entry = self.prefetched_responses.pop(url, None)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def get_http_cache_max_age(self, url):
+        """Seconds a cached response for this URL's source may be reused without revalidation"""
+        source = self.get_source_key(url)
+        for pattern, max_age in self.http_cache_max_age.items():
+            if pattern in source:
+                return max_age
+        return 0
+
+    def get_http_cache_max_stale(self, url):
+        """Seconds past fetching that a cached copy may still be served when its source fails"""
+        source = self.get_source_key(url)
+        for pattern, max_stale in self.http_cache_max_stale.items():
+            if pattern in source:
+                return max_stale
+        return self.http_cache_default_max_stale
+
+    def serve_stale_http_cache(self, url, entry, reason):
+        """Cached data to fall back on after a failed fetch, if it is within the source's max-stale"""
+        if not entry:
+            return None
+        age = time.time() - entry['fetched_at']
+        source = self.get_source_key(url)
+        if age > self.get_http_cache_max_stale(url):
+            print(f"⚠️ {reason} for {source}; cached copy is {age:.0f}s old, too stale to serve")
+            self.stale_sources.pop(source, None)
+            return None
+        print(f"⚠️ {reason} for {source}, serving cached copy ({age:.0f}s old)")
+        self.stale_sources[source] = entry['fetched_at']
+        return entry['data']
+
+    def get_source_staleness(self, url):
+        """Age in seconds of the stale copy being served for a URL's source, or None if it is fresh"""
+        fetched_at = self.stale_sources.get(self.get_source_key(url))
+        return round(time.time() - fetched_at) if fetched_at else None
+
+    def get_http_cache_key(self, url, params=None):
+        """Cache key (and on-disk file name) for a URL and its query params"""
+        return hashlib.sha256(f"{url}|{json.dumps(params, sort_keys=True)}".encode()).hexdigest()[:32]
+
+    def is_http_cache_fresh(self, url, params=None):
+        """Whether http_get_cached would answer this URL from cache without a request"""
+        entry = self.load_http_cache_entry(self.get_http_cache_key(url, params))
+        return bool(entry) and time.time() - entry['fetched_at'] < self.get_http_cache_max_age(url)
+
+    def load_http_cache_entry(self, cache_key):
+        """Cached response for a key, from memory or the on-disk cache"""
+        with self.http_cache_lock:
+            entry = self.http_cache.get(cache_key)
+        if entry is not None:
+            return entry
+        try:
+            with open(os.path.join(self.http_cache_dir, f"{cache_key}.json"), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self.http_cache_lock:
+            return self.http_cache.setdefault(cache_key, entry)
+
+    def store_http_cache_entry(self, cache_key, entry, persist=True):
+        """Publish a cached response in memory and (optionally) on disk"""
+        with self.http_cache_lock:
+            self.http_cache[cache_key] = entry
+        if persist:
+            os.makedirs(self.http_cache_dir, exist_ok=True)
+            self.write_json_file(os.path.join(self.http_cache_dir, f"{cache_key}.json"), entry)
+
+    def http_get_cached(self, url, parse=None, max_age=None, **kwargs):
+        """GET a URL and return its parsed body, using conditional requests and the HTTP cache.
+
+        Within the source's max-age the cached parse is returned without a request;
+        after that the URL is revalidated with If-None-Match/If-Modified-Since and a
+        304 (or an unchanged body) reuses the cached parse. Returns None on failure
+        unless a copy within the source's max-stale is available (see
+        get_source_staleness). Cached results are shared: treat as read-only.
+        Sources revalidated more often than http_cache_persist_min_age are kept in
+        memory only.
+        """
+        parse = parse or (lambda response: response.json())
+        cache_key = self.get_http_cache_key(url, kwargs.get('params'))
+        max_age = self.get_http_cache_max_age(url) if max_age is None else max_age
+        entry = self.load_http_cache_entry(cache_key)
+        now = time.time()
+        if entry and now - entry['fetched_at'] < max_age:
+            return entry['data']
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
 
+        try:
+            response = self.http_get(url, headers=headers, **kwargs)
+        except requests.exceptions.RequestException as e:
+            data = self.serve_stale_http_cache(url, entry, type(e).__name__)
+            if data is None:
+                raise
+            return data
+
+        if response.status_code == 304 and entry:
+            self.stale_sources.pop(self.get_source_key(url), None)
+            self.store_http_cache_entry(cache_key, dict(entry, fetched_at=now), persist=False)
+            return entry['data']
+        if response.status_code != 200:
+            return self.serve_stale_http_cache(url, entry, f"HTTP {response.status_code}")
+        self.stale_sources.pop(self.get_source_key(url), None)
+
+        body_hash = hashlib.sha256(response.content).hexdigest()
+        unchanged = entry is not None and entry.get('body_hash') == body_hash
+        new_entry = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': body_hash,
+            'fetched_at': now,
+            'data': entry['data'] if unchanged else parse(response)
+        }
+        validators_changed = not entry or (entry.get('etag'), entry.get('last_modified')) != (new_entry['etag'], new_entry['last_modified'])
+        persist = (not unchanged or validators_changed) and max_age >= self.http_cache_persist_min_age
+        self.store_http_cache_entry(cache_key, new_entry, persist=persist)
+        return new_entry['data']
+
+    def get_source_health_score(self, url):
+        """Score a source: success rate (with a neutral prior for unknown sources) minus a latency penalty"""
+        stats = self.source_health.get(self.get_source_key(url))
+        if stats is None:
+            return 0.5
+        results = list(stats['results'])
+        successes = sum(1 for ok, _ in results if ok)
+        success_rate = (successes + 1) / (len(results) + 2)
+        avg_latency = sum(latency for _, latency in results) / len(results) if results else 0
+        return success_rate - min(avg_latency / 10, 0.3)
+
+    def order_by_source_health(self, urls):
+        """Order candidate URLs by measured health.
+
+        Healthy sources (and open ones due a half-open probe) keep their priority
+        order, degraded ones follow healthiest first, and sources whose breaker
+        is still cooling down go last.
+        """
+        def sort_key(item):
+            index, url = item
+            stats = self.source_health.get(self.get_source_key(url))
+            if stats and stats['state'] == 'open':
+                if not self.is_source_available(url):
+                    return (2, 0, index)
+                return (0, 0, index)
+            score = self.get_source_health_score(url)
+            if score >= 0.5:
+                return (0, 0, index)
+            return (1, -score, index)
+
+        return [url for _, url in sorted(enumerate(urls), key=sort_key)]
+
+    def get_source_health_report(self):
+        """Summarize breaker state and rolling health for every source seen so far"""
+        report = []
+        with self.source_health_lock:
+            for source, stats in self.source_health.items():
+                results = list(stats['results'])
+                successes = sum(1 for ok, _ in results if ok)
+                retry_at = None
+                if stats['state'] == 'open':
+                    retry_at = datetime.fromtimestamp(stats['opened_at'] + self.breaker_cooldown).isoformat()
+                report.append({
+                    'source': source,
+                    'state': stats['state'],
+                    'success_rate': round(successes / len(results), 3) if results else None,
+                    'avg_latency_ms': round(sum(latency for _, latency in results) / len(results) * 1000) if results else None,
+                    'recent_calls': len(results),
+                    'total_calls': stats['total_calls'],
+                    'total_failures': stats['total_failures'],
+                    'last_error': stats['last_error'],
+                    'last_success': stats['last_success'],
+                    'retry_at': retry_at,
+                    'serving_stale_seconds': round(time.time() - self.stale_sources[source]) if source in self.stale_sources else None
+                })
+        report.sort(key=lambda entry: (entry['state'] != 'open', entry['success_rate'] or 0))
+        return report
+
+    def fetch_fresh_games_data(self, week, sections=None):
+        """Fetch fresh games data from ESPN API, falling back across multiple endpoints.
+
+        Each endpoint gets a single attempt; if every one fails the week is queued
+        for a background retry instead of sleeping in the request thread.
+        """
         # Enhanced headers that rotate to avoid detection
         headers_options = [
             {
@@ -634,92 +1902,189 @@ Check the console logs above for specific API error details.
             f"https://www.cbssports.com/nfl/ajax/scorestrip/{self.current_season}/REG/{week}",
         ]
 
+        # Healthiest sources first; known-dead ones last and skipped while their breaker is open
+        endpoints = self.order_by_source_health(endpoints)
+
         print(f"🏈 Attempting to fetch Week {week} data from {len(endpoints)} endpoints...")
 
+        retry_after = None  # Longest back-off an upstream asked for during this pass
         for attempt, url in enumerate(endpoints, 1):
-            max_retries = 2 if attempt <= 4 else 1  # More retries for primary endpoints
+            if not self.is_source_available(url):
+                print(f"⛔ Skipping {url[:60]}... (circuit open)")
+                continue
 
-            for retry in range(max_retries):
-                try:
-                    # Rotate headers and add random delay to avoid rate limiting
-                    headers = random.choice(headers_options)
-                    if retry > 0:
-                        delay = random.uniform(1, 3)
-                        print(f"⏳ Retry {retry}, waiting {delay:.1f}s before request...")
-                        time.sleep(delay)
+            try:
+                # Rotate headers to avoid rate limiting
+                headers = random.choice(headers_options)
 
-                    print(f"📡 Attempt {attempt}/{len(endpoints)} (retry {retry+1}/{max_retries}): {url[:60]}...")
+                print(f"📡 Attempt {attempt}/{len(endpoints)}: {url[:60]}...")
 
-                    response = requests.get(url, headers=headers, timeout=20)
+                response = self.http_get(url, headers=headers, timeout=20)
 
-                    print(f"🔍 Response: {response.status_code} - {len(response.content)} bytes")
+                print(f"🔍 Response: {response.status_code} - {len(response.content)} bytes")
 
-                    if response.status_code == 200:
-                        # Handle different data sources and content types
-                        if 'rss.xml' in url:
-                            # Handle RSS feed
-                            games = self.parse_espn_rss(response.text, week)
-                        elif 'nfl.com' in url:
-                            # Handle NFL.com API
-                            data = response.json()
-                            games = self.parse_nfl_com_data(data, week)
-                        elif 'thesportsdb.com' in url:
-                            # Handle TheSportsDB API
+                if response.status_code == 200:
+                    # Handle different data sources and content types
+                    if 'rss.xml' in url:
+                        # Handle RSS feed
+                        games = self.parse_espn_rss(response.text, week)
+                    elif 'nfl.com' in url:
+                        # Handle NFL.com API
+                        data = response.json()
+                        games = self.parse_nfl_com_data(data, week)
+                    elif 'thesportsdb.com' in url:
+                        # Handle TheSportsDB API
+                        data = response.json()
+                        games = self.parse_sportsdb_data(data, week)
+                    elif 'cbssports.com' in url:
+                        # Handle CBS Sports API
+                        if response.headers.get('content-type', '').startswith('application/json'):
                             data = response.json()
-                            games = self.parse_sportsdb_data(data, week)
-                        elif 'cbssports.com' in url:
-                            # Handle CBS Sports API
-                            if response.headers.get('content-type', '').startswith('application/json'):
-                                data = response.json()
-                                games = self.parse_cbs_data(data, week)
-                            else:
-                                # CBS might return XML
-                                games = self.parse_cbs_xml(response.text, week)
+                            games = self.parse_cbs_data(data, week)
                         else:
-                            # Handle ESPN JSON response
-                            data = response.json()
-                            games = self.parse_espn_data(data, week)
-
-                        if games:
-                            print(f"✅ Successfully parsed {len(games)} games from ESPN")
-
-                            # Force current 2025 records for Week 3 display
-                            if self.current_season == 2025:
-                                games = self.force_current_2025_records_on_games(games)
+                            # CBS might return XML
+                            games = self.parse_cbs_xml(response.text, week)
+                    else:
+                        # Handle ESPN JSON response
+                        data = response.json()
+                        games = self.parse_espn_data(data, week)
 
-                            # Enhance with betting and weather data
-                            games = self.enhance_games_data(games)
+                    if games:
+                        print(f"✅ Successfully parsed {len(games)} games from ESPN")
+                        self.clear_fetch_retry(week)
 
-                            # Apply cross-source validation and confidence scoring (non-blocking)
-                            try:
-                                games = self.apply_cross_validation(games, week)
-                            except Exception as e:
-                                print(f"⚠️ Cross-validation failed: {e}")
+                        # Force current 2025 records for Week 3 display
+                        if self.current_season == 2025:
+                            games = self.force_current_2025_records_on_games(games)
 
-                            return games
-                        else:
-                            print(f"⚠️ Endpoint returned empty games list")
+                        # Enhance with betting, weather and the other requested sections
+                        games = self.enhance_games_data(games, sections, week)
 
-                    elif response.status_code == 429:
-                        print(f"🚫 Rate limited (429), waiting before retry...")
-                        time.sleep(5)
-                    elif response.status_code == 403:
-                        print(f"🚫 Forbidden (403), trying different headers...")
+                        return games
                     else:
-                        print(f"❌ HTTP {response.status_code}: {response.reason}")
-                        break  # Don't retry on other HTTP errors
+                        print(f"⚠️ Endpoint returned empty games list")
 
-                except requests.exceptions.Timeout:
-                    print(f"⏰ Request timeout on attempt {retry+1}")
-                except requests.exceptions.ConnectionError:
-                    print(f"🔌 Connection error on attempt {retry+1}")
-                except Exception as e:
-                    print(f"💥 ESPN API error with {url}: {e}")
-                    break  # Don't retry on parsing errors
+                elif response.status_code == 429:
+                    print(f"🚫 Rate limited (429), moving on")
+                    wait = self.parse_retry_after(response.headers.get('Retry-After')) or self.rate_limit_default_wait
+                    retry_after = max(retry_after or 0, wait)
+                else:
+                    print(f"❌ HTTP {response.status_code}: {response.reason}")
 
-        print(f"❌ All ESPN endpoints failed after multiple attempts")
+            except SourceRateLimitedError as e:
+                print(f"🚦 Skipping {url[:60]}... (rate limited for {e.retry_after:.1f}s)")
+                retry_after = max(retry_after or 0, e.retry_after)
+            except SourceUnavailableError:
+                print(f"⛔ Circuit opened for {url[:60]}..., moving on")
+            except requests.exceptions.Timeout:
+                print(f"⏰ Request timeout on {url[:60]}...")
+            except requests.exceptions.ConnectionError:
+                print(f"🔌 Connection error on {url[:60]}...")
+            except Exception as e:
+                print(f"💥 ESPN API error with {url}: {e}")
+
+        print(f"❌ All ESPN endpoints failed for Week {week}")
+        self.schedule_fetch_retry(week, sections, retry_after)
         return None
 
+    def schedule_fetch_retry(self, week, sections=None, retry_after=None, games=None):
+        """Queue a background retry for a week with jittered exponential backoff, honoring Retry-After.
+
+        Without games the whole week is re-fetched; games ({game id: [sections]})
+        re-runs only the enrichment sections those games are missing.
+        """
+        week_key = str(week)
+        with self.fetch_retries_lock:
+            retry = self.fetch_retries.get(week_key)
+            if retry and not retry.get('running'):
+                # Already queued: fold this request into it
+                retry['fetch'] = retry.get('fetch', True) or games is None
+                for game_id, game_sections in (games or {}).items():
+                    retry['games'][game_id] = sorted(set(retry['games'].get(game_id, [])) | set(game_sections))
+                return retry['due'] - time.time()
+            attempt = retry['attempt'] if retry else 0
+            if attempt >= self.fetch_retry_max_attempts:
+                print(f"❌ Giving up on Week {week} after {attempt} background retries")
+                self.fetch_retries.pop(week_key, None)
+                return None
+
+            delay = random.uniform(0, min(self.fetch_retry_cap, self.fetch_retry_base * 2 ** attempt))
+            delay = max(delay, retry_after or 0)
+            self.fetch_retries[week_key] = {'attempt': attempt + 1, 'due': time.time() + delay, 'sections': sections,
+                                            'fetch': games is None, 'games': dict(games or {})}
+            if self.fetch_retry_thread is None or not self.fetch_retry_thread.is_alive():
+                self.fetch_retry_thread = threading.Thread(target=self.run_fetch_retry_worker, daemon=True)
+                self.fetch_retry_thread.start()
+        self.fetch_retry_event.set()
+        print(f"🔁 Week {week} background retry {attempt + 1} in {delay:.1f}s")
+        return delay
+
+    def clear_fetch_retry(self, week):
+        """Drop any pending background retry for a week that has been fetched"""
+        with self.fetch_retries_lock:
+            self.fetch_retries.pop(str(week), None)
+
+    def run_fetch_retry_worker(self):
+        """Background retry loop: re-run due week fetches so request threads never wait on them"""
+        while True:
+            self.fetch_retry_event.clear()
+            with self.fetch_retries_lock:
+                now = time.time()
+                due = [(week_key, retry) for week_key, retry in self.fetch_retries.items()
+                       if not retry.get('running') and retry['due'] <= now]
+                for _, retry in due:
+                    retry['running'] = True
+                next_due = min((retry['due'] for retry in self.fetch_retries.values() if not retry.get('running')),
+                               default=None)
+
+            for week_key, retry in due:
+                self.retry_week_fetch(week_key, retry)
+
+            if not due:
+                self.fetch_retry_event.wait(None if next_due is None else max(0, next_due - time.time()))
+
+    def retry_week_fetch(self, week_key, retry):
+        """Run one background retry through the normal cache path (merging into a cached week)"""
+        print(f"🔁 Background retry {retry['attempt']} for Week {week_key}")
+        try:
+            if retry.get('fetch', True):
+                if week_key in self.weekly_games_cache:
+                    self.last_refresh_check.pop(week_key, None)  # Take the refresh-and-merge path
+                self.get_games_for_week(int(week_key), retry['sections'])
+            if retry.get('games'):
+                self.retry_week_enrichment(week_key, retry['games'])
+        except Exception as e:
+            print(f"❌ Background retry for Week {week_key} failed: {e}")
+        finally:
+            with self.fetch_retries_lock:
+                # Neither rescheduled nor cleared: nothing left to retry
+                if self.fetch_retries.get(week_key) is retry:
+                    self.fetch_retries.pop(week_key)
+
+    def retry_week_enrichment(self, week_key, missing):
+        """Re-run the enrichment sections individual games are missing and publish the week"""
+        with self.get_week_writer_lock(week_key):
+            published = self.weekly_games_cache.get(week_key)
+            if not published:
+                return
+            games = [dict(game) for game in published]
+            by_section = {}
+            for game in games:
+                for section in missing.get(game.get('id'), ()):
+                    if section in game.get('missing_sections', ()):
+                        by_section.setdefault(section, []).append(game)
+            if not by_section:
+                return
+
+            for section in self.enrichment_sections:
+                if by_section.get(section):
+                    print(f"🧩 Retrying {section} for {len(by_section[section])} games in Week {week_key}")
+                    self.enhance_games_data(by_section[section], [section], int(week_key))
+            with self.weekly_cache_lock:
+                self.weekly_games_cache[week_key] = games
+                self.update_week_hashes(week_key, games)
+        self.mark_week_dirty(week_key)
+
     def parse_espn_rss(self, rss_content, week):
         """Parse ESPN RSS feed for NFL scores - fallback data source"""
         try:
@@ -790,42 +2155,7 @@ Check the console logs above for specific API error details.
 
     def get_team_abbr_from_name(self, team_name):
         """Convert team name to abbreviation for RSS parsing"""
-        name_to_abbr = {
-            'Chiefs': 'KC', 'Kansas City': 'KC',
-            'Bills': 'BUF', 'Buffalo': 'BUF',
-            'Dolphins': 'MIA', 'Miami': 'MIA',
-            'Patriots': 'NE', 'New England': 'NE',
-            'Jets': 'NYJ', 'New York Jets': 'NYJ',
-            'Ravens': 'BAL', 'Baltimore': 'BAL',
-            'Bengals': 'CIN', 'Cincinnati': 'CIN',
-            'Browns': 'CLE', 'Cleveland': 'CLE',
-            'Steelers': 'PIT', 'Pittsburgh': 'PIT',
-            'Titans': 'TEN', 'Tennessee': 'TEN',
-            'Colts': 'IND', 'Indianapolis': 'IND',
-            'Jaguars': 'JAX', 'Jacksonville': 'JAX',
-            'Texans': 'HOU', 'Houston': 'HOU',
-            'Cowboys': 'DAL', 'Dallas': 'DAL',
-            'Giants': 'NYG', 'New York Giants': 'NYG',
-            'Eagles': 'PHI', 'Philadelphia': 'PHI',
-            'Commanders': 'WAS', 'Washington': 'WAS',
-            'Packers': 'GB', 'Green Bay': 'GB',
-            'Bears': 'CHI', 'Chicago': 'CHI',
-            'Lions': 'DET', 'Detroit': 'DET',
-            'Vikings': 'MIN', 'Minnesota': 'MIN',
-            'Falcons': 'ATL', 'Atlanta': 'ATL',
-            'Panthers': 'CAR', 'Carolina': 'CAR',
-            'Saints': 'NO', 'New Orleans': 'NO',
-            'Buccaneers': 'TB', 'Tampa Bay': 'TB', 'Bucs': 'TB',
-            '49ers': 'SF', 'San Francisco': 'SF',
-            'Rams': 'LAR', 'Los Angeles Rams': 'LAR',
-            'Seahawks': 'SEA', 'Seattle': 'SEA',
-            'Cardinals': 'ARI', 'Arizona': 'ARI',
-            'Chargers': 'LAC', 'Los Angeles Chargers': 'LAC',
-            'Raiders': 'LV', 'Las Vegas': 'LV',
-            'Broncos': 'DEN', 'Denver': 'DEN'
-        }
-
-        return name_to_abbr.get(team_name, team_name[:3].upper())
+        return self.team_name_aliases.get(team_name, team_name[:3].upper())
 
     def parse_nfl_com_data(self, data, week):
         """Parse NFL.com API data"""
@@ -1030,13 +2360,16 @@ Check the console logs above for specific API error details.
             for event in events:
                 # Handle different ESPN API response formats
                 competition = event.get('competitions', [{}])[0] if 'competitions' in event else event
+                venue_info = competition.get('venue') if isinstance(competition.get('venue'), dict) else {}
                 
                 game = {
                     "id": event.get('id', f"week_{week}_{len(games)}"),
                     "date": event.get('date', competition.get('date', '')),
                     "status": self.parse_game_status(event),
                     "venue": self.parse_venue(competition),
+                    "venue_id": str(venue_info['id']) if venue_info.get('id') else None,
                 }
+                self.learn_venue(venue_info)
                 
                 # Get teams
                 competitors = competition.get('competitors', [])
@@ -1074,18 +2407,20 @@ Check the console logs above for specific API error details.
             
         return games
     
-    def parse_game_status(self, event):
-        """Extract game status from ESPN event data"""
+    def get_status_name(self, event):
+        """Raw ESPN status name for an event, lowercased (e.g. 'status_postponed')"""
         status = event.get('status', {})
         
         if isinstance(status, dict):
             status_type = status.get('type', {})
             if isinstance(status_type, dict):
-                name = status_type.get('name', 'pregame').lower()
-            else:
-                name = str(status_type).lower()
-        else:
-            name = str(status).lower()
+                return status_type.get('name', 'pregame').lower()
+            return str(status_type).lower()
+        return str(status).lower()
+
+    def parse_game_status(self, event):
+        """Extract game status from ESPN event data"""
+        name = self.get_status_name(event)
         
         # Normalize status names
         if 'final' in name or 'end' in name:
@@ -1112,7 +2447,7 @@ Check the console logs above for specific API error details.
 
         for url in endpoints:
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = self.http_get(url, headers=self.headers, timeout=10)
                 if response.status_code != 200:
                     continue
 
@@ -1243,19 +2578,42 @@ Check the console logs above for specific API error details.
         if isinstance(venue, dict):
             return venue.get('fullName', venue.get('name', ''))
         return str(venue) if venue else ''
-    
-    def parse_team_record(self, competitor):
-        """Extract team record from competitor data"""
-        # For 2025 season, use 2024 final records for better analysis
-        if self.current_season == 2025:
-            team_data = competitor.get('team', {})
-            team_abbr = team_data.get('abbreviation', '')
-            if team_abbr:
-                cached_2024_record = self.get_2024_season_record(team_abbr)
-                if cached_2024_record and cached_2024_record != '0-0':
-                    print(f"DEBUG: Using 2024 record for {team_abbr}: {cached_2024_record}")
-                    return cached_2024_record
 
+    def normalize_venue_name(self, name):
+        """Normalize a venue name for registry lookups (case, punctuation, spacing)"""
+        return ' '.join(re.sub(r"[^a-z0-9&]+", ' ', (name or '').lower().replace("'", '')).split())
+
+    def register_venue(self, venue, aliases=()):
+        """Add a venue to the registry under its name and any former names"""
+        key = self.normalize_venue_name(venue['name'])
+        self.venue_registry[key] = venue
+        for name in [venue['name'], *aliases]:
+            self.venue_names[self.normalize_venue_name(name)] = key
+        return key
+
+    def learn_venue(self, venue_info):
+        """Record the ESPN venue id for a scoreboard venue; unknown venues get a no-weather entry"""
+        venue_id = str(venue_info.get('id') or '')
+        if not venue_id or venue_id in self.venue_ids:
+            return
+        name = venue_info.get('fullName', venue_info.get('name', ''))
+        key = self.venue_names.get(self.normalize_venue_name(name))
+        if key is None and 'indoor' in venue_info:
+            # Neutral-site and international venues: trust ESPN's indoor flag, skip weather
+            key = self.register_venue({'name': name, 'coordinates': None, 'timezone': None,
+                                       'roof': 'dome' if venue_info.get('indoor') else 'open'})
+        if key is not None:
+            self.venue_ids[venue_id] = key
+
+    def resolve_venue(self, venue_name, venue_id=None):
+        """Registry entry for an ESPN venue id or venue name, or None if the venue is unknown"""
+        key = self.venue_ids.get(str(venue_id)) if venue_id else None
+        if key is None:
+            key = self.venue_names.get(self.normalize_venue_name(venue_name))
+        return self.venue_registry.get(key) if key else None
+    
+    def parse_competitor_record(self, competitor):
+        """Extract a team's record string from scoreboard competitor data"""
         records = competitor.get('records', [])
         if records and len(records) > 0:
             return records[0].get('displayValue', '0-0')
@@ -1269,58 +2627,143 @@ Check the console logs above for specific API error details.
 
         return '0-0'
 
-    def get_team_injuries(self, team_abbr):
-        """Fetch injury data for a team from ESPN API"""
-        if team_abbr not in self.espn_team_ids:
-            return []
+    def get_team_injuries(self, team_abbr, team_id=None):
+        """Get injury report for a specific team (see get_injuries_for_teams)"""
+        return self.get_injuries_for_teams({team_abbr: team_id}).get(team_abbr, [])
 
-        team_id = self.espn_team_ids[team_abbr]
+    def get_injuries_for_teams(self, teams):
+        """Injury reports for several teams from the one cached injury provider.
 
-        # Check cache (30 minute cache)
-        cache_key = f"injuries_{team_abbr}"
-        if (cache_key in self.injury_cache and self.injury_cache_time and
-            (datetime.now() - self.injury_cache_time).seconds < 1800):
-            return self.injury_cache[cache_key]
+        teams maps abbreviation -> ESPN team id (None = look it up). Fresh reports
+        come from the per-team cache; otherwise the site API's league-wide injury
+        report is fetched once and cached for all 32 teams, so a cold week costs a
+        single injury fetch per TTL. Within that report only new or changed
+        injury items are re-resolved (see resolve_injury_refs).
+        """
+        results = {}
+        stale = {}
+        for team_abbr, team_id in teams.items():
+            team_id = str(team_id or self.espn_team_ids.get(team_abbr) or '')
+            if not team_id:
+                results[team_abbr] = []
+                continue
+            cached_injuries = self.get_cached_team_enrichment('injuries', team_id)
+            if cached_injuries is not None:
+                results[team_abbr] = cached_injuries
+            elif not self.upstream_allowed():
+                results[team_abbr] = []
+            else:
+                stale[team_abbr] = team_id
+        if not stale:
+            return results
+
+        with self.injury_cache_lock:
+            # Another request may have fetched the report while this one waited
+            report = {team_id: self.get_cached_team_enrichment('injuries', team_id) for team_id in stale.values()}
+            if any(injuries is None for injuries in report.values()):
+                report = self.fetch_league_injuries()
+
+        for team_abbr, team_id in stale.items():
+            if report is not None:
+                results[team_abbr] = report.get(team_id, [])
+            elif self.strict_real_data:
+                # Strict mode: do not return mock injuries
+                results[team_abbr] = []
+            else:
+                results[team_abbr] = self.get_mock_injury_data(team_abbr)
+        return results
 
+    def fetch_league_injuries(self):
+        """Fetch the league-wide injury report and cache it per team (None on failure)"""
         try:
-            url = f"https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams/{team_id}/injuries"
-            response = requests.get(url, headers=self.headers, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                injuries = []
+            response = self.http_get(self.league_injuries_url, headers=self.headers, timeout=10)
+            if response.status_code != 200:
+                print(f"Injury API returned status code: {response.status_code}")
+                return None
+            team_items = {str(team.get('id')): team.get('injuries', [])
+                          for team in response.json().get('injuries', []) if team.get('id')}
+            report = self.resolve_injury_refs(team_items)
+        except Exception as e:
+            print(f"Failed to fetch league injury report: {e}")
+            return None
 
-                for item in data.get('items', []):
-                    try:
-                        injury_response = requests.get(item['$ref'], headers=self.headers, timeout=5)
-                        if injury_response.status_code == 200:
-                            injury_data = injury_response.json()
-
-                            # Extract player and injury info
-                            athlete = injury_data.get('athlete', {})
-                            injury_details = injury_data.get('details', {})
-
-                            injury_info = {
-                                'player_name': athlete.get('displayName', 'Unknown'),
-                                'position': athlete.get('position', {}).get('abbreviation', ''),
-                                'status': injury_details.get('type', 'Unknown'),
-                                'description': injury_details.get('detail', ''),
-                                'severity': self.get_injury_severity(injury_details.get('type', ''))
-                            }
-                            injuries.append(injury_info)
-                    except:
+        # Teams with nobody listed are absent from the report. A team whose cached report is
+        # still fresh and unchanged keeps its own TTL; the rest are (re)cached
+        updated = 0
+        for team_id in set(self.espn_team_ids.values()) | set(report):
+            injuries = report.get(team_id, [])
+            cached_injuries = self.get_cached_team_enrichment('injuries', team_id)
+            if cached_injuries is None or cached_injuries != injuries:
+                self.store_team_enrichment('injuries', team_id, injuries)
+                updated += 1
+            report[team_id] = injuries
+        print(f"🩹 Cached injury reports for {updated}/{len(report)} teams from one league-wide fetch")
+        return report
+
+    def resolve_injury_refs(self, team_items):
+        """Resolve league report items (team id -> items) through the per-ref cache.
+
+        Only refs that are new, whose listed item changed, or that are past
+        injury_ref_ttl are resolved: inline items are parsed in place, items
+        listed only by $ref are fetched in one concurrent batch. Refs that
+        dropped off the report are evicted; a ref that fails to resolve keeps
+        its last resolved value. Call with injury_cache_lock held.
+        """
+        now = time.time()
+        listed = {team_id: [(self.get_injury_ref(item), self.fingerprint_injury(item), item) for item in items]
+                  for team_id, items in team_items.items()}
+        ref_cache = self.injury_ref_cache
+        pending = {ref: (fingerprint, item) for entries in listed.values() for ref, fingerprint, item in entries
+                   if ref not in ref_cache or ref_cache[ref][1] != fingerprint or
+                   now - ref_cache[ref][0] >= self.injury_ref_ttl}
+
+        remote = [item['$ref'] for _, item in pending.values() if 'athlete' not in item and item.get('$ref')]
+        self.prefetch_urls(remote)
+        resolved = {}
+        for ref, (fingerprint, item) in pending.items():
+            if 'athlete' not in item and item.get('$ref'):
+                try:
+                    response = self.http_get(item['$ref'], headers=self.headers, timeout=5)
+                    if response.status_code != 200:
                         continue
+                    item = response.json()
+                except Exception as e:
+                    print(f"⚠️ Could not resolve injury {ref}: {e}")
+                    continue
+            resolved[ref] = (now, fingerprint, self.parse_league_injury(item))
 
-                # Cache the results
-                self.injury_cache[cache_key] = injuries
-                self.injury_cache_time = datetime.now()
-                print(f"Fetched {len(injuries)} injuries for {team_abbr}")
-                return injuries
+        # Rebuild from the refs still listed so dropped injuries are evicted
+        refs = {ref for entries in listed.values() for ref, _, _ in entries}
+        ref_cache = {ref: entry for ref, entry in ref_cache.items() if ref in refs}
+        ref_cache.update(resolved)
+        self.injury_ref_cache = ref_cache
+        print(f"🩹 Resolved {len(resolved)}/{len(pending)} new or changed injury refs, reused {len(refs) - len(pending)}")
 
-        except Exception as e:
-            print(f"Failed to fetch injuries for {team_abbr}: {e}")
+        return {team_id: [ref_cache[ref][2] for ref, _, _ in entries if ref in ref_cache]
+                for team_id, entries in listed.items()}
+
+    def get_injury_ref(self, item):
+        """Stable key for a league report injury item: its $ref, else its id, else its content"""
+        return item.get('$ref') or (f"injury:{item['id']}" if item.get('id') else self.fingerprint_injury(item))
+
+    def fingerprint_injury(self, item):
+        """Content hash of a listed injury item (a changed status or comment changes it)"""
+        return hashlib.md5(json.dumps(item, sort_keys=True, default=str).encode()).hexdigest()
 
-        return []
+    def parse_league_injury(self, injury_data):
+        """Extract player and injury info from a league injury report item"""
+        athlete = injury_data.get('athlete', {})
+        injury_details = injury_data.get('details', {})
+        status = injury_data.get('status', 'Unknown')
+
+        return {
+            'player_name': athlete.get('displayName', 'Unknown'),
+            'position': athlete.get('position', {}).get('abbreviation', ''),
+            'status': status,
+            'description': injury_data.get('shortComment') or injury_details.get('detail', ''),
+            'type': injury_details.get('type', ''),
+            'severity': self.get_injury_severity(status)
+        }
 
     def get_injury_severity(self, injury_status):
         """Convert injury status to severity level (1-5)"""
@@ -1336,48 +2779,137 @@ Check the console logs above for specific API error details.
         return severity_map.get(injury_status, 1)
 
     def get_nfl_news_feed(self):
-        """Fetch latest NFL news from ESPN RSS feed"""
-        # Check cache (15 minute cache for news)
-        if (self.news_cache and self.news_cache_time and
-            (datetime.now() - self.news_cache_time).seconds < 900):
-            return self.news_cache.get('news_items', [])
-
-        try:
-            import xml.etree.ElementTree as ET
+        """Latest NFL news from the rolling article store, ingesting new items when it is due"""
+        if self.is_news_stale():
+            if not self.upstream_allowed():
+                self.shared_store.request_refresh('news')
+            else:
+                with self.news_ingest_lock:
+                    # Another request may have ingested while this one waited
+                    if self.is_news_stale():
+                        try:
+                            self.ingest_news()
+                        except Exception as e:
+                            print(f"Failed to fetch NFL news: {e}")
+
+        return self.news_cache.get('news_items', [])
+
+    def is_news_stale(self):
+        """Whether the article store is due for another ingestion"""
+        return (not self.news_cache_time or
+                (datetime.now() - self.news_cache_time).total_seconds() >= self.news_refresh_interval)
+
+    def ingest_news(self):
+        """Merge the ESPN RSS feed and site news JSON into the rolling article store.
+
+        Items are deduped by GUID and link; only unseen ones are tagged with teams
+        and impact. The store keeps the newest news_store_limit articles published
+        within news_retention_days. Returns the number of new articles.
+        """
+        store = self.news_cache.get('news_items', [])
+        seen = {key for article in store for key in (article.get('id'), article.get('link_key')) if key}
 
-            url = "https://www.espn.com/nfl/rss.xml"
-            response = requests.get(url, headers=self.headers, timeout=10)
+        fresh = []
+        for source_name, items in (('ESPN', self.fetch_site_news_items()), ('ESPN RSS', self.fetch_rss_news_items())):
+            for item in items:
+                link = self.normalize_news_link(item.get('link'))
+                keys = [key for key in (item.get('guid'), link) if key]
+                if not keys or any(key in seen for key in keys):
+                    continue
+                seen.update(keys)
+                fresh.append(self.build_news_article(keys[0], link, item, source_name))
 
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                news_items = []
-
-                # Parse RSS feed
-                for item in root.findall('.//item')[:10]:  # Get top 10 news items
-                    title = item.find('title')
-                    description = item.find('description')
-                    link = item.find('link')
-                    pub_date = item.find('pubDate')
-
-                    news_item = {
-                        'title': title.text if title is not None else '',
-                        'description': description.text if description is not None else '',
-                        'link': link.text if link is not None else '',
-                        'published': pub_date.text if pub_date is not None else '',
-                        'impact': self.assess_news_impact(title.text if title is not None else '')
-                    }
-                    news_items.append(news_item)
+        now = time.time()
+        cutoff = now - self.news_retention_days * 86400
+        articles = [article for article in fresh + store if (article.get('published_ts') or now) >= cutoff]
+        articles.sort(key=lambda article: article.get('published_ts') or 0, reverse=True)
 
-                # Cache the results
-                self.news_cache = {'news_items': news_items}
-                self.news_cache_time = datetime.now()
-                print(f"Fetched {len(news_items)} news items")
-                return news_items
+        self.news_cache = {'news_items': articles[:self.news_store_limit]}
+        self.news_cache_time = datetime.now()
+        print(f"📰 Ingested {len(fresh)} new news articles ({len(self.news_cache['news_items'])} in store)")
+        return len(fresh)
 
+    def fetch_site_news_items(self):
+        """Raw items from the ESPN site news JSON (HTTP-cached; empty on failure)"""
+        try:
+            data = self.http_get_cached(self.news_site_url, headers=self.headers, timeout=5)
+        except Exception as e:
+            print(f"Error fetching news: {e}")
+            return []
+        return [{
+            'guid': f"espn:{article['id']}" if article.get('id') else None,
+            'title': article.get('headline') or '',
+            'description': article.get('description') or '',
+            'link': article.get('links', {}).get('web', {}).get('href', ''),
+            'published': article.get('published', '')
+        } for article in (data or {}).get('articles', [])]
+
+    def fetch_rss_news_items(self):
+        """Raw items from the ESPN RSS feed (HTTP-cached, so an unchanged feed isn't re-parsed)"""
+        try:
+            return self.http_get_cached(self.news_rss_url, parse=self.parse_news_rss, headers=self.headers, timeout=10) or []
         except Exception as e:
             print(f"Failed to fetch NFL news: {e}")
+            return []
 
-        return []
+    def parse_news_rss(self, response):
+        """Parse the items of an RSS news response"""
+        import xml.etree.ElementTree as ET
+
+        root = ET.fromstring(response.content)
+        news_items = []
+
+        # Parse RSS feed
+        for item in root.findall('.//item'):
+            title = item.find('title')
+            description = item.find('description')
+            link = item.find('link')
+            pub_date = item.find('pubDate')
+            guid = item.find('guid')
+
+            news_items.append({
+                'guid': guid.text if guid is not None else None,
+                'title': title.text if title is not None else '',
+                'description': description.text if description is not None else '',
+                'link': link.text if link is not None else '',
+                'published': pub_date.text if pub_date is not None else ''
+            })
+
+        return news_items
+
+    def normalize_news_link(self, link):
+        """Canonical form of an article link for dedupe (no query, fragment or trailing slash)"""
+        if not link:
+            return None
+        parsed = urlparse(link.strip())
+        return f"{parsed.netloc.lower()}{parsed.path.rstrip('/')}" or None
+
+    def build_news_article(self, article_id, link, item, source_name):
+        """Store entry for a newly seen news item, tagged with teams and impact"""
+        headline = item.get('title') or ''
+        description = item.get('description') or ''
+        published = item.get('published') or ''
+        published_ts = None
+        try:
+            published_ts = datetime.fromisoformat(published.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            try:
+                published_ts = parsedate_to_datetime(published).timestamp()
+            except (TypeError, ValueError):
+                pass
+
+        return {
+            'id': article_id,
+            'headline': headline,
+            'description': description,
+            'published': published,
+            'published_ts': published_ts or time.time(),
+            'link': item.get('link') or '',
+            'link_key': link,
+            'source': source_name,
+            'impact': self.assess_news_impact(headline),
+            'teams': sorted(self.find_team_mentions(f"{headline}\n{description}"))
+        }
 
     def assess_news_impact(self, title):
         """Assess news impact level (1-5) based on keywords"""
@@ -1396,77 +2928,16 @@ Check the console logs above for specific API error details.
 
         return 1
 
-    def get_injury_data_for_game(self, game):
-        """Get injury data for both teams in a game"""
-        home_team = game.get('home_team', {})
-        away_team = game.get('away_team', {})
-
-        home_abbr = home_team.get('abbreviation') or home_team.get('abbr', '')
-        away_abbr = away_team.get('abbreviation') or away_team.get('abbr', '')
-
-        injury_data = {
-            'home_injuries': [],
-            'away_injuries': [],
-            'impact_summary': {
-                'home_impact': 0,
-                'away_impact': 0
-            }
-        }
-
-        # Get injuries for home team
-        if home_abbr:
-            home_injuries = self.get_team_injuries(home_abbr)
-            injury_data['home_injuries'] = home_injuries
-            # Calculate impact (higher severity = more impact)
-            injury_data['impact_summary']['home_impact'] = sum(inj.get('severity', 1) for inj in home_injuries)
-
-        # Get injuries for away team
-        if away_abbr:
-            away_injuries = self.get_team_injuries(away_abbr)
-            injury_data['away_injuries'] = away_injuries
-            # Calculate impact (higher severity = more impact)
-            injury_data['impact_summary']['away_impact'] = sum(inj.get('severity', 1) for inj in away_injuries)
-
-        return injury_data
-
-    def get_game_news(self, game):
-        """Get relevant news for teams in the game"""
-        home_team = game.get('home_team', {})
-        away_team = game.get('away_team', {})
-
-        home_name = home_team.get('name', '').lower()
-        away_name = away_team.get('name', '').lower()
-        home_abbr = home_team.get('abbreviation', '').lower()
-        away_abbr = away_team.get('abbreviation', '').lower()
-
-        # Get all news items
-        all_news = self.get_nfl_news_feed()
-
-        # Filter news relevant to this game
-        relevant_news = []
-        for news_item in all_news:
-            title_lower = news_item['title'].lower()
-            description_lower = news_item['description'].lower()
-
-            # Check if news mentions either team
-            if (home_name in title_lower or home_abbr in title_lower or
-                away_name in title_lower or away_abbr in title_lower or
-                home_name in description_lower or home_abbr in description_lower or
-                away_name in description_lower or away_abbr in description_lower):
-                relevant_news.append(news_item)
-
-        return relevant_news[:3]  # Return top 3 relevant news items
-
     def track_odds_history(self, new_odds_data, timestamp):
         """Track historical odds for line movement analysis"""
+        # Build the next history off to the side and swap it in, so readers never see it change
+        historical_odds = dict(self.historical_odds)
         for game in new_odds_data:
             game_id = game.get('id', '')
             if not game_id:
                 continue
 
-            # Initialize game history if not exists
-            if game_id not in self.historical_odds:
-                self.historical_odds[game_id] = []
+            historical_odds[game_id] = list(historical_odds.get(game_id, []))
 
             # Extract odds from different bookmakers
             bookmakers = game.get('bookmakers', [])
@@ -1487,16 +2958,18 @@ Check the console logs above for specific API error details.
                     }
 
                     # Add to historical data
-                    self.historical_odds[game_id].append(odds_snapshot)
+                    historical_odds[game_id].append(odds_snapshot)
 
             # Keep only last 20 snapshots per game to manage memory
-            if len(self.historical_odds[game_id]) > 20:
-                self.historical_odds[game_id] = self.historical_odds[game_id][-20:]
+            if len(historical_odds[game_id]) > 20:
+                historical_odds[game_id] = historical_odds[game_id][-20:]
 
+        self.historical_odds = historical_odds
         print(f"Updated historical odds for {len(new_odds_data)} games")
 
     def analyze_line_movements(self):
         """Analyze line movements to detect significant changes"""
+        line_movements = dict(self.line_movements)
         for game_id, history in self.historical_odds.items():
             if len(history) < 2:
                 continue
@@ -1530,7 +3003,9 @@ Check the console logs above for specific API error details.
             # Analyze significant movements
             movements = self.detect_significant_movements(game_id, spread_history, total_history)
             if movements:
-                self.line_movements[game_id] = movements
+                line_movements[game_id] = movements
+
+        self.line_movements = line_movements
 
     def detect_significant_movements(self, game_id, spread_history, total_history):
         """Detect significant line movements (3+ points spread, 2+ points total)"""
@@ -1618,34 +3093,194 @@ Check the console logs above for specific API error details.
         """Get historical odds snapshots for a game"""
         return self.historical_odds.get(game_id, [])
 
-    def enhance_games_data(self, games):
-        """Add betting lines, weather data, and injury reports to games"""
+    def format_export_cursor(self, position):
+        """Encode an export position as an opaque resume cursor"""
+        return ':'.join(quote(str(part), safe='') for part in position)
+
+    def parse_export_cursor(self, cursor):
+        """Decode a resume cursor back into a comparable export position.
+
+        Positions are keyed on record identity, not list offsets:
+        (0, week, game id, record type rank) for games and analyses and
+        (1, game id, snapshot timestamp) for odds snapshots.
+        """
+        if not cursor:
+            return None
+        try:
+            parts = [unquote(part) for part in cursor.split(':')]
+            if parts[0] == '0' and len(parts) == 4:
+                return (0, int(parts[1]), parts[2], int(parts[3]))
+            if parts[0] == '1' and len(parts) == 3:
+                return (1, parts[1], parts[2])
+        except ValueError:
+            pass
+        raise ValueError(f"Invalid export cursor: {cursor}")
+
+    def iter_season_export(self, cursor=None, record_types=None):
+        """Yield season export records one at a time: games, analyses and odds snapshots.
+
+        Records are generated straight from the weekly cache and odds history, so
+        memory stays flat however much is exported. Records come in order of their
+        identity (week, game id, record type; then game id, snapshot time) and every
+        record carries a cursor; passing it back resumes right after that record even
+        if weeks were re-merged or odds history trimmed in between.
+        """
+        start = self.parse_export_cursor(cursor)
+        record_types = record_types or ['game', 'analysis', 'odds']
+
+        def after_cursor(position):
+            if start is None:
+                return True
+            if position[0] != start[0]:
+                return position[0] > start[0]
+            return position > start
+
+        # Phase 0: each cached week's games by id, each followed by its eliminator analysis
+        for week_key in sorted(list(self.weekly_games_cache), key=int):
+            games = self.weekly_games_cache.get(week_key) or []
+            for game in sorted(games, key=lambda game: str(game.get('id'))):
+                for rank, record_type in enumerate(('game', 'analysis')):
+                    position = (0, int(week_key), str(game.get('id')), rank)
+                    if record_type not in record_types or not after_cursor(position):
+                        continue
+                    data = game if record_type == 'game' else self.get_cached_eliminator_analysis(game)
+                    yield {
+                        'type': record_type,
+                        'season': self.current_season,
+                        'week': int(week_key),
+                        'game_id': game.get('id'),
+                        'cursor': self.format_export_cursor(position),
+                        'data': data
+                    }
+
+        # Phase 1: odds snapshots per game, oldest first
+        if 'odds' in record_types:
+            historical_odds = self.historical_odds
+            for game_id in sorted(historical_odds, key=str):
+                for snapshot in historical_odds.get(game_id, []):
+                    position = (1, str(game_id), str(snapshot.get('timestamp', '')))
+                    if not after_cursor(position):
+                        continue
+                    yield {
+                        'type': 'odds',
+                        'season': self.current_season,
+                        'game_id': game_id,
+                        'cursor': self.format_export_cursor(position),
+                        'data': snapshot
+                    }
+
+    def enhance_games_data(self, games, sections=None, week=None):
+        """Add betting lines, weather data, and injury reports to games
+
+        sections selects which enrichment steps to run (None = all of them).
+        """
+        if sections is None:
+            sections = self.enrichment_sections
+
         # Fetch odds data once for all games (more efficient)
-        self.refresh_odds_cache()
-        
+        if 'betting' in sections:
+            self.refresh_odds_cache()
+
+        # One concurrent round trip for the per-team and per-venue fetches the loop below makes
+        weather_urls = self.plan_weather_fetches(games) if 'weather' in sections else []
+        self.prefetch_urls(self.get_enrichment_urls(games, sections) + weather_urls)
+        if 'injuries' in sections:
+            # Fetches the league-wide report at most once for every team in the batch
+            self.get_injuries_for_teams({game.get(side, {}).get('abbr'): game.get(side, {}).get('id')
+                                         for game in games for side in ('home_team', 'away_team')
+                                         if game.get(side, {}).get('abbr')})
+
+        # Sections whose upstream calls failed (e.g. rate limited) are marked on the game
+        # and queued for a background retry of just those sections
+        missing = {}
         for game in games:
+            failed = []
+            enriched_at = dict(game.get('enriched_at', {}))
+            for section in sections:
+                failures = self.get_upstream_failure_count()
+                self.apply_game_section(game, section, weather_urls)
+                if self.get_upstream_failure_count() > failures:
+                    failed.append(section)
+                elif section in self.section_ttls:
+                    enriched_at[section] = time.time()
+            if enriched_at:
+                game['enriched_at'] = enriched_at
+            self.mark_missing_sections(game, sections, failed)
+            if failed:
+                missing[game.get('id')] = failed
+
+        if missing and week is not None:
+            print(f"🧩 {len(missing)} games in Week {week} are missing enrichment after upstream failures")
+            self.schedule_fetch_retry(week, games=missing)
+
+        if 'confidence' in sections and week is not None:
+            # Apply cross-source validation and confidence scoring (non-blocking)
+            try:
+                games = self.apply_cross_validation(games, week)
+            except Exception as e:
+                print(f"⚠️ Cross-validation failed: {e}")
+        
+        return games
+    
+    def apply_game_section(self, game, section, weather_urls=None):
+        """Run one per-game enrichment section ('confidence' runs across the week instead)"""
+        if section == 'betting':
             # Add betting data using cached odds
             game.update(self.get_betting_data(game))
+        elif section == 'weather':
             # Add weather data
-            game['weather'] = self.get_weather_data(game)
+            game['weather'] = self.get_weather_data(game, weather_urls)
+        elif section == 'injuries':
             # Add injury data
             game['injuries'] = self.get_injury_data_for_game(game)
+        elif section == 'analytics':
             # Add team analytics
             game['analytics'] = self.get_team_analytics_for_game(game)
+        elif section == 'news':
             # Add relevant news
             game['news'] = self.get_game_news(game)
+        elif section == 'probabilities':
             # Add win probabilities
             game['probabilities'] = self.calculate_game_probabilities(game)
+        elif section == 'advanced_metrics':
             # Add advanced research metrics
             game['advanced_metrics'] = {
                 'home_team': self.calculate_advanced_team_metrics(game.get('home_team', {}).get('abbr', ''), 1),
                 'away_team': self.calculate_advanced_team_metrics(game.get('away_team', {}).get('abbr', ''), 1)
             }
+        elif section == 'divisional':
             # Add divisional matchup detection
             game['divisional'] = self.is_divisional_game(game)
-        
-        return games
-    
+
+    def mark_missing_sections(self, game, sections, failed):
+        """Update a game's missing_sections: add the sections that just failed, drop the ones that ran clean"""
+        missing = [section for section in self.enrichment_sections
+                   if section in failed or (section in game.get('missing_sections', ()) and section not in sections)]
+        if missing:
+            game['missing_sections'] = missing
+        else:
+            game.pop('missing_sections', None)
+
+    def get_upstream_failure_count(self):
+        """Upstream calls that failed on this thread so far (lets enrichment spot sections that lost data)"""
+        return getattr(self.upstream_failures, 'count', 0)
+
+    def note_upstream_failure(self):
+        """Count a failed upstream call against the current thread"""
+        self.upstream_failures.count = self.get_upstream_failure_count() + 1
+
+    def get_enrichment_urls(self, games, sections):
+        """Per-team upstream URLs the enrichment loop will fetch for these games (skipping fresh cache hits)"""
+        urls = []
+        for game in games:
+            for side in ('home_team', 'away_team'):
+                team_id = game.get(side, {}).get('id')
+                if not team_id:
+                    continue
+                if 'analytics' in sections and self.get_cached_team_enrichment('stats', team_id) is None:
+                    urls.append(f"{self.base_url}/teams/{team_id}/statistics")
+        return urls
+
     def is_divisional_game(self, game):
         """Check if a game is between division rivals"""
         home_abbr = game.get('home_team', {}).get('abbr', '')
@@ -1663,83 +3298,102 @@ Check the console logs above for specific API error details.
     
     def refresh_odds_cache(self):
         """Refresh odds cache if needed (every 10 minutes) with enhanced logging"""
+        if not self.upstream_allowed():
+            return  # Odds snapshots arrive through the shared store
+
         now = datetime.now()
         
         cache_age = (now - self.odds_cache_time).total_seconds() if self.odds_cache_time else float('inf')
         print(f"💰 Odds cache check: age={cache_age:.0f}s, threshold=600s")
 
         if (self.odds_cache_time is None or cache_age > 600):  # 10 minutes
-            print(f"🔄 Refreshing odds cache (last refresh: {self.odds_cache_time or 'Never'})")
-
+            # Single flight: one thread fetches while the others keep serving the current
+            # snapshot (or wait for it when there is none yet)
+            if not self.odds_refresh_lock.acquire(blocking=self.odds_cache is None):
+                print("⏳ Odds refresh already in progress, using current snapshot")
+                return
             try:
-                print(f"📡 Fetching real betting odds from The Odds API (key: {self.odds_api_key[:8]}...)")
-                url = "https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds"
-                params = {
-                    'api_key': self.odds_api_key,
-                    'regions': 'us',
-                    'markets': 'h2h,spreads,totals',  # h2h = moneyline
-                    'oddsFormat': 'american',
-                    'dateFormat': 'iso'
-                }
+                if (self.odds_cache_time is not None and
+                        (datetime.now() - self.odds_cache_time).total_seconds() <= 600):
+                    return  # Another thread refreshed while we waited
+                self.fetch_odds_snapshot(now)
+            finally:
+                self.odds_refresh_lock.release()
+        else:
+            print(f"⚡ Using cached odds (age: {cache_age:.0f}s)")
+            if self.odds_cache:
+                print(f"📊 Current cache contains {len(self.odds_cache)} games")
+    
+    def fetch_odds_snapshot(self, now):
+        """Fetch a new odds snapshot from The Odds API and publish it"""
+        print(f"🔄 Refreshing odds cache (last refresh: {self.odds_cache_time or 'Never'})")
+
+        try:
+            print(f"📡 Fetching real betting odds from The Odds API (key: {self.odds_api_key[:8]}...)")
+            url = "https://api.the-odds-api.com/v4/sports/americanfootball_nfl/odds"
+            params = {
+                'api_key': self.odds_api_key,
+                'regions': 'us',
+                'markets': 'h2h,spreads,totals',  # h2h = moneyline
+                'oddsFormat': 'american',
+                'dateFormat': 'iso'
+            }
 
-                print(f"🎯 Request URL: {url}")
-                print(f"🎯 Request params: {dict(params, api_key='[HIDDEN]')}")
+            print(f"🎯 Request URL: {url}")
+            print(f"🎯 Request params: {dict(params, api_key='[HIDDEN]')}")
 
-                response = requests.get(url, params=params, timeout=15)
+            response = self.http_get(url, params=params, timeout=15)
 
-                print(f"📊 Odds API Response: {response.status_code} - {len(response.content)} bytes")
+            print(f"📊 Odds API Response: {response.status_code} - {len(response.content)} bytes")
                 
-                if response.status_code == 200:
-                    new_odds_data = response.json()
+            if response.status_code == 200:
+                new_odds_data = response.json()
 
-                    print(f"🎲 Received {len(new_odds_data)} games with odds data")
+                print(f"🎲 Received {len(new_odds_data)} games with odds data")
 
-                    # Log sample of odds data structure
-                    if new_odds_data:
-                        sample_game = new_odds_data[0]
-                        print(f"📋 Sample odds structure: {list(sample_game.keys())}")
-                        if 'bookmakers' in sample_game:
-                            print(f"📚 Bookmakers available: {len(sample_game['bookmakers'])}")
+                # Log sample of odds data structure
+                if new_odds_data:
+                    sample_game = new_odds_data[0]
+                    print(f"📋 Sample odds structure: {list(sample_game.keys())}")
+                    if 'bookmakers' in sample_game:
+                        print(f"📚 Bookmakers available: {len(sample_game['bookmakers'])}")
 
-                    # Track historical odds for line movement analysis
-                    self.track_odds_history(new_odds_data, now)
+                # Track historical odds for line movement analysis
+                self.track_odds_history(new_odds_data, now)
 
-                    self.odds_cache = new_odds_data
-                    self.odds_cache_time = now
-                    print(f"✅ Successfully cached {len(self.odds_cache)} games with real betting odds")
+                self.odds_cache = new_odds_data
+                self.odds_cache_time = now
+                self.odds_snapshot_version += 1
+                print(f"✅ Successfully cached {len(self.odds_cache)} games with real betting odds")
 
-                    # Analyze line movements after updating cache
-                    self.analyze_line_movements()
+                # Analyze line movements after updating cache
+                self.analyze_line_movements()
 
-                    # Test odds matching with first game
-                    if new_odds_data:
-                        sample_odds = new_odds_data[0]
-                        print(f"🧪 Test odds game: {sample_odds.get('home_team', 'N/A')} vs {sample_odds.get('away_team', 'N/A')}")
+                # Test odds matching with first game
+                if new_odds_data:
+                    sample_odds = new_odds_data[0]
+                    print(f"🧪 Test odds game: {sample_odds.get('home_team', 'N/A')} vs {sample_odds.get('away_team', 'N/A')}")
 
-                else:
-                    print(f"❌ Odds API returned status code: {response.status_code}")
-                    print(f"❌ Response content: {response.text[:500]}")
-
-                    if response.status_code == 401:
-                        print("🚫 Invalid API key for The Odds API - check your API key")
-                    elif response.status_code == 429:
-                        print("🚫 Rate limit exceeded for The Odds API - try again later")
-                    elif response.status_code == 422:
-                        print("🚫 Invalid request parameters for The Odds API")
+            else:
+                print(f"❌ Odds API returned status code: {response.status_code}")
+                print(f"❌ Response content: {response.text[:500]}")
+
+                if response.status_code == 401:
+                    print("🚫 Invalid API key for The Odds API - check your API key")
+                elif response.status_code == 429:
+                    print("🚫 Rate limit exceeded for The Odds API - try again later")
+                elif response.status_code == 422:
+                    print("🚫 Invalid request parameters for The Odds API")
                         
-            except requests.exceptions.Timeout:
-                print(f"⏰ Timeout fetching odds from The Odds API")
-            except requests.exceptions.ConnectionError:
-                print(f"🔌 Connection error fetching odds from The Odds API")
-            except Exception as e:
-                print(f"💥 Error fetching odds cache: {e}")
-                import traceback
-                print(f"📋 Full traceback: {traceback.format_exc()}")
-        else:
-            print(f"⚡ Using cached odds (age: {cache_age:.0f}s)")
-            if self.odds_cache:
-                print(f"📊 Current cache contains {len(self.odds_cache)} games")
-    
+        except requests.exceptions.Timeout:
+            print(f"⏰ Timeout fetching odds from The Odds API")
+        except requests.exceptions.ConnectionError:
+            print(f"🔌 Connection error fetching odds from The Odds API")
+        except Exception as e:
+            print(f"💥 Error fetching odds cache: {e}")
+            import traceback
+            print(f"📋 Full traceback: {traceback.format_exc()}")
+
     def get_betting_data(self, game):
         """Get betting lines for a game - try real odds API first"""
         # Try to get real betting odds
@@ -1763,7 +3417,8 @@ Check the console logs above for specific API error details.
     
     def get_real_betting_odds_for_game(self, game):
         """Get real betting odds from cached data with enhanced matching and logging"""
-        if not self.odds_cache:
+        odds_cache = self.odds_cache  # One snapshot for the whole match
+        if not odds_cache:
             print(f"⚠️ No odds cache available for game matching")
             return None
         
@@ -1777,7 +3432,7 @@ Check the console logs above for specific API error details.
             print(f"🎯 Looking for odds match: {away_team} ({away_abbr}) @ {home_team} ({home_abbr})")
 
             # Try matching with multiple team identifiers
-            for i, odds_game in enumerate(self.odds_cache):
+            for i, odds_game in enumerate(odds_cache):
                 odds_home = odds_game.get('home_team', '')
                 odds_away = odds_game.get('away_team', '')
 
@@ -1810,7 +3465,7 @@ Check the console logs above for specific API error details.
                         print(f"❌ No match #{i}: {odds_away} @ {odds_home}")
 
             print(f"❌ No odds match found for {away_team} @ {home_team}")
-            print(f"📋 Available odds games: {[(g.get('away_team'), g.get('home_team')) for g in self.odds_cache[:3]]}")
+            print(f"📋 Available odds games: {[(g.get('away_team'), g.get('home_team')) for g in odds_cache[:3]]}")
                     
         except Exception as e:
             print(f"💥 Error matching game to cached odds: {e}")
@@ -2033,20 +3688,20 @@ Check the console logs above for specific API error details.
             }
         }
     
-    def get_weather_data(self, game):
-        """Get weather data for game venue"""
-        venue = game.get('venue', '').lower()
-        
-        # Indoor venues
-        indoor_venues = [
-            'at&t stadium', 'mercedes-benz superdome', 'ford field', 'lucas oil stadium',
-            'u.s. bank stadium', 'state farm stadium', 'mercedes-benz stadium', 
-            'allegiant stadium', 'sofi stadium', 'dome', 'indoor'
-        ]
-        
-        is_indoor = any(indoor in venue for indoor in indoor_venues)
-        
-        if is_indoor:
+    def is_indoor_venue(self, venue_name, venue_id=None):
+        """Check whether a venue has a roof (dome or retractable), so outdoor weather doesn't apply"""
+        venue = self.resolve_venue(venue_name, venue_id)
+        if venue:
+            return venue['roof'] != 'open'
+        name = (venue_name or '').lower()
+        return 'dome' in name or 'indoor' in name
+
+    def get_weather_data(self, game, weather_urls=None):
+        """Get weather data for game venue
+
+        weather_urls limits which venue forecasts may be fetched (None = any).
+        """
+        if self.is_indoor_venue(game.get('venue', ''), game.get('venue_id')):
             return {
                 "temp": 72,
                 "condition": "Indoor",
@@ -2055,7 +3710,9 @@ Check the console logs above for specific API error details.
             }
         
         # Try to get real weather data
-        real_weather = self.get_real_weather_for_venue(game.get('venue', ''))
+        fetch = weather_urls is None or self.get_venue_weather_url(game.get('venue', ''), game.get('venue_id')) in weather_urls
+        real_weather = self.get_real_weather_for_venue(game.get('venue', ''), game.get('venue_id'),
+                                                       self.parse_kickoff(game), fetch=fetch)
         if real_weather:
             return real_weather
         
@@ -2088,66 +3745,180 @@ Check the console logs above for specific API error details.
             "indoor": False
         }
     
-    def get_real_weather_for_venue(self, venue_name):
-        """Get real weather data for a venue using free weather service"""
-        if not venue_name or venue_name.lower() in ['', 'unknown']:
+    def parse_kickoff(self, game):
+        """Kickoff time of a game as an aware UTC datetime, or None if its date is unparseable"""
+        try:
+            kickoff = datetime.fromisoformat(game.get('date', '').replace('Z', '+00:00'))
+        except ValueError:
             return None
-            
-        # Find coordinates for this venue
-        coordinates = None
-        for venue_key, coords in self.venue_coordinates.items():
-            if venue_key.lower() in venue_name.lower() or venue_name.lower() in venue_key.lower():
-                coordinates = coords
-                break
-        
-        if not coordinates:
+        if kickoff.tzinfo is None:
+            kickoff = kickoff.replace(tzinfo=timezone.utc)
+        return kickoff
+
+    def get_venue_weather_url(self, venue_name, venue_id=None):
+        """Weather service URL for a venue, or None if its coordinates are unknown"""
+        venue = self.resolve_venue(venue_name, venue_id)
+        if not venue or not venue.get('coordinates'):
+            return None
+
+        lat, lon = venue['coordinates']
+        # Using wttr.in - free weather API that doesn't require API key
+        return f"https://wttr.in/{lat},{lon}?format=j1"
+
+    def normalize_weather_condition(self, condition):
+        """Map a weather service description onto our condition names"""
+        condition_map = {
+            'sunny': 'Clear',
+            'clear': 'Clear',
+            'partly cloudy': 'Cloudy',
+            'cloudy': 'Cloudy',
+            'overcast': 'Cloudy',
+            'light rain': 'Rain',
+            'moderate rain': 'Rain',
+            'heavy rain': 'Rain',
+            'light snow': 'Snow',
+            'moderate snow': 'Snow',
+            'heavy snow': 'Snow',
+        }
+        return condition_map.get(condition.strip().lower(), condition.strip())
+
+    def parse_venue_forecast(self, data, tz_name):
+        """Reduce a wttr.in j1 response to current conditions plus a UTC hourly series.
+
+        wttr.in reports hourly slots ("0", "300", ... "2100") in the venue's local
+        time, so each slot is converted with the venue's timezone.
+        """
+        current = data.get('current_condition', [{}])[0]
+        forecast = {
+            'current': {
+                'temp': float(current.get('temp_F', 32)),
+                'condition': self.normalize_weather_condition(current.get('weatherDesc', [{}])[0].get('value', 'Clear')),
+                'wind': float(current.get('windspeedMiles', 0))
+            },
+            'hourly': []  # [utc timestamp, temp F, wind mph, condition]
+        }
+        try:
+            tz = ZoneInfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError, TypeError):
+            return forecast
+        for day in data.get('weather', []):
+            try:
+                day_date = datetime.strptime(day.get('date', ''), '%Y-%m-%d')
+            except ValueError:
+                continue
+            for hour in day.get('hourly', []):
+                try:
+                    slot = int(hour.get('time', '0'))
+                    local = day_date.replace(hour=slot // 100, minute=slot % 100, tzinfo=tz)
+                    forecast['hourly'].append([
+                        local.timestamp(),
+                        float(hour.get('tempF')),
+                        float(hour.get('windspeedMiles', 0)),
+                        self.normalize_weather_condition(hour.get('weatherDesc', [{}])[0].get('value', 'Clear'))
+                    ])
+                except (TypeError, ValueError):
+                    continue
+        forecast['hourly'].sort()
+        return forecast
+
+    def interpolate_forecast(self, forecast, kickoff):
+        """Weather at kickoff: linear between the bracketing hourly slots, nearest slot's condition.
+
+        Kickoffs outside the forecast window use current conditions when the game is
+        under way or about to be, and otherwise have no forecast yet.
+        """
+        hourly = forecast.get('hourly', [])
+        now = datetime.now(timezone.utc)
+        if kickoff is None:
+            kickoff = now
+        target = kickoff.timestamp()
+
+        if not hourly or not hourly[0][0] <= target <= hourly[-1][0]:
+            if abs((kickoff - now).total_seconds()) <= 3 * 3600:
+                current = forecast['current']
+                return current['temp'], current['wind'], current['condition']
+            return None
+
+        index = bisect.bisect_left([slot[0] for slot in hourly], target)
+        after = hourly[index]
+        before = hourly[index - 1] if index > 0 else after
+        span = after[0] - before[0]
+        weight = (target - before[0]) / span if span else 0
+        temp = before[1] + (after[1] - before[1]) * weight
+        wind = before[2] + (after[2] - before[2]) * weight
+        condition = after[3] if weight >= 0.5 else before[3]
+        return temp, wind, condition
+
+    def get_real_weather_for_venue(self, venue_name, venue_id=None, kickoff=None, fetch=True):
+        """Forecast weather at kickoff for a venue, cached per (venue, kickoff hour).
+
+        The venue's forecast is fetched at most once per cache max-age; with
+        fetch=False (over this refresh's weather budget) or when the fetch fails,
+        the last known forecast for that venue and hour is returned instead.
+        """
+        venue = self.resolve_venue(venue_name, venue_id)
+        url = self.get_venue_weather_url(venue_name, venue_id)
+        if not url:
             return None
-        
-        lat, lon = coordinates
-        
+
+        bucket_time = kickoff or datetime.now(timezone.utc)
+        cache_key = (self.normalize_venue_name(venue['name']), bucket_time.strftime('%Y-%m-%dT%H'))
+        cached = self.weather_cache.get(cache_key)
+        if cached and time.time() - cached[0] < self.get_http_cache_max_age(url):
+            return cached[1]
+
+        weather = None
         try:
-            # Using wttr.in - free weather API that doesn't require API key
-            url = f"https://wttr.in/{lat},{lon}?format=j1"
-            response = requests.get(url, timeout=5, headers=self.headers)
-            
-            if response.status_code == 200:
-                data = response.json()
-                current = data.get('current_condition', [{}])[0]
-                
-                temp_f = int(float(current.get('temp_F', 32)))
-                condition = current.get('weatherDesc', [{}])[0].get('value', 'Clear')
-                wind_mph = int(float(current.get('windspeedMiles', 0)))
-                
-                # Normalize condition names
-                condition_map = {
-                    'sunny': 'Clear',
-                    'clear': 'Clear', 
-                    'partly cloudy': 'Cloudy',
-                    'cloudy': 'Cloudy',
-                    'overcast': 'Cloudy',
-                    'light rain': 'Rain',
-                    'moderate rain': 'Rain',
-                    'heavy rain': 'Rain',
-                    'light snow': 'Snow',
-                    'moderate snow': 'Snow',
-                    'heavy snow': 'Snow',
-                }
-                
-                normalized_condition = condition_map.get(condition.lower(), condition)
-                
-                print(f"Real weather for {venue_name}: {temp_f}°F, {normalized_condition}, {wind_mph}mph wind")
-                
-                return {
-                    "temp": temp_f,
-                    "condition": normalized_condition,
-                    "wind": wind_mph,
-                    "indoor": False
-                }
-                
+            if fetch or self.is_http_cache_fresh(url):
+                forecast = self.http_get_cached(
+                    url, parse=lambda response: self.parse_venue_forecast(response.json(), venue.get('timezone')),
+                    timeout=5, headers=self.headers)
+            else:
+                entry = self.load_http_cache_entry(self.get_http_cache_key(url))
+                forecast = entry['data'] if entry else None
+            weather = self.interpolate_forecast(forecast, kickoff) if forecast else None
         except Exception as e:
             print(f"Weather API failed for {venue_name}: {e}")
-        
-        return None
+
+        if not weather:
+            return cached[1] if cached else None
+
+        temp_f, wind_mph, condition = weather
+        print(f"Real weather for {venue_name}: {round(temp_f)}°F, {condition}, {round(wind_mph)}mph wind")
+        result = {
+            "temp": int(round(temp_f)),
+            "condition": condition,
+            "wind": int(round(wind_mph)),
+            "indoor": False
+        }
+        self.store_weather_cache(cache_key, result)
+        return result
+
+    def store_weather_cache(self, cache_key, weather):
+        """Remember a venue/hour forecast, dropping buckets more than a day past kickoff"""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=1)).strftime('%Y-%m-%dT%H')
+        with self.weather_cache_lock:
+            self.weather_cache = {key: value for key, value in self.weather_cache.items() if key[1] >= cutoff}
+            self.weather_cache[cache_key] = (time.time(), weather)
+
+    def plan_weather_fetches(self, games):
+        """Distinct outdoor venue forecast URLs that need a fetch, soonest kickoff first, capped per refresh"""
+        now = datetime.now(timezone.utc)
+        kickoffs = {}
+        for game in games:
+            if self.is_indoor_venue(game.get('venue', ''), game.get('venue_id')):
+                continue
+            url = self.get_venue_weather_url(game.get('venue', ''), game.get('venue_id'))
+            if not url or self.is_http_cache_fresh(url):
+                continue
+            kickoff = self.parse_kickoff(game) or now
+            # Upcoming games first, then the most recently started
+            rank = (kickoff < now, abs((kickoff - now).total_seconds()))
+            kickoffs[url] = min(kickoffs.get(url, rank), rank)
+        urls = sorted(kickoffs, key=kickoffs.get)
+        if len(urls) > self.weather_fetch_limit:
+            print(f"🌦️ Weather budget: fetching {self.weather_fetch_limit} of {len(urls)} venues, others use last known forecast")
+        return urls[:self.weather_fetch_limit]
     
     def calculate_elo_ratings(self, team_abbr):
         """Calculate simplified Elo-style ratings for teams"""
@@ -2320,7 +4091,7 @@ Check the console logs above for specific API error details.
     def get_eliminator_recommendation(self, game):
         """Generate eliminator pool recommendation based on game data"""
         # Get advanced analytics first
-        analytics = self.get_advanced_eliminator_analysis(game)
+        analytics = self.get_cached_eliminator_analysis(game)
         
         # Determine recommended team
         if game.get('favorite') == 'home':
@@ -2338,6 +4109,17 @@ Check the console logs above for specific API error details.
             "value_score": analytics['value_score']
         }
     
+    def get_cached_eliminator_analysis(self, game):
+        """Eliminator analysis memoized per game on its content hash"""
+        game_hash = self.calculate_game_hashes(game)['game']
+        cached = self.analysis_cache.get(game.get('id'))
+        if cached and cached[0] == game_hash and cached[1] == self.scoring_version:
+            return cached[2]
+
+        analysis = self.get_advanced_eliminator_analysis(game)
+        self.analysis_cache[game.get('id')] = (game_hash, self.scoring_version, analysis)
+        return analysis
+
     def get_advanced_eliminator_analysis(self, game):
         """Enhanced eliminator pool analysis with probability-based multi-factor confidence scoring"""
         spread_value = game.get('spread', 0)
@@ -2731,8 +4513,8 @@ Check the console logs above for specific API error details.
         away_team_id = game.get('away_team', {}).get('id')
         
         injuries = {
-            'home_team': self.get_team_injuries(home_team_id, game.get('home_team', {}).get('abbr')),
-            'away_team': self.get_team_injuries(away_team_id, game.get('away_team', {}).get('abbr')),
+            'home_team': self.get_team_injuries(game.get('home_team', {}).get('abbr'), home_team_id),
+            'away_team': self.get_team_injuries(game.get('away_team', {}).get('abbr'), away_team_id),
             'impact_score': 0,
             'warnings': []
         }
@@ -2751,51 +4533,6 @@ Check the console logs above for specific API error details.
         
         return injuries
     
-    def get_team_injuries(self, team_id, team_abbr):
-        """Get injury report for a specific team"""
-        if not team_id:
-            return []
-        
-        try:
-            url = f"{self.base_url}/teams/{team_id}/injuries"
-            response = requests.get(url, headers=self.headers, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return self.parse_injury_data(data)
-            else:
-                print(f"Injury API returned status code: {response.status_code} for team {team_abbr}")
-                
-        except Exception as e:
-            print(f"Error fetching injuries for {team_abbr}: {e}")
-        
-        # Strict mode: do not return mock injuries
-        if self.strict_real_data:
-            return []
-        
-        # Non-strict: return mock injury data
-        return self.get_mock_injury_data(team_abbr)
-    
-    def parse_injury_data(self, data):
-        """Parse ESPN injury API response"""
-        injuries = []
-        
-        try:
-            if 'injuries' in data:
-                for injury in data['injuries']:
-                    athlete = injury.get('athlete', {})
-                    injuries.append({
-                        'player_name': athlete.get('displayName', 'Unknown'),
-                        'position': athlete.get('position', {}).get('abbreviation', ''),
-                        'status': injury.get('status', 'Unknown'),
-                        'description': injury.get('description', ''),
-                        'type': injury.get('type', '')
-                    })
-        except Exception as e:
-            print(f"Error parsing injury data: {e}")
-        
-        return injuries
-    
     def get_mock_injury_data(self, team_abbr):
         """Generate mock injury data for demonstration"""
         # Common NFL injury types and statuses
@@ -2840,6 +4577,18 @@ Check the console logs above for specific API error details.
         
         return min(impact_score, 5)  # Cap at 5
     
+    def get_cached_team_enrichment(self, kind, team_id):
+        """Return a cached team-level enrichment value if it is still fresh"""
+        cached = self.team_enrichment_cache.get((kind, team_id))
+        if cached and (datetime.now() - cached[0]).total_seconds() < self.team_enrichment_ttl:
+            return cached[1]
+        return None
+
+    def store_team_enrichment(self, kind, team_id, value):
+        """Cache a team-level enrichment value for reuse across games and weeks"""
+        self.team_enrichment_cache[(kind, team_id)] = (datetime.now(), value)
+        return value
+
     def get_team_analytics_for_game(self, game):
         """Get team performance analytics for both teams"""
         home_team_id = game.get('home_team', {}).get('id')
@@ -2867,14 +4616,20 @@ Check the console logs above for specific API error details.
         """Get comprehensive team statistics"""
         if not team_id:
             return {} if self.strict_real_data else self.get_mock_team_stats(team_abbr)
+
+        cached_stats = self.get_cached_team_enrichment('stats', team_id)
+        if cached_stats is not None:
+            return cached_stats
+        if not self.upstream_allowed():
+            return {}
         
         try:
             url = f"{self.base_url}/teams/{team_id}/statistics"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            response = self.http_get(url, headers=self.headers, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
-                return self.parse_team_stats(data)
+                return self.store_team_enrichment('stats', team_id, self.parse_team_stats(data))
             else:
                 print(f"Team stats API returned status code: {response.status_code} for {team_abbr}")
                 
@@ -2965,19 +4720,17 @@ Check the console logs above for specific API error details.
         """Get relevant news for the game"""
         home_team = game.get('home_team', {}).get('abbr', '')
         away_team = game.get('away_team', {}).get('abbr', '')
+
+        if not self.upstream_allowed():
+            return game.get('news', [])
         
-        # Try to get real news from ESPN
-        try:
-            url = f"{self.base_url}/news"
-            response = requests.get(url, headers=self.headers, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                relevant_news = self.filter_game_news(data, home_team, away_team)
-                if relevant_news:
-                    return relevant_news
-        except Exception as e:
-            print(f"Error fetching news: {e}")
+        # Union of both teams' postings in the shared news index (tagged with canonical abbreviations)
+        news_index = self.get_news_index()
+        article_ids = sorted(set(news_index['teams'].get(self.canonical_team_abbr(home_team), ())) |
+                             set(news_index['teams'].get(self.canonical_team_abbr(away_team), ())))
+        relevant_news = [news_index['articles'][article_id] for article_id in article_ids[:3]]
+        if relevant_news:
+            return relevant_news
         
         # Strict mode: do not return mock news
         if self.strict_real_data:
@@ -2986,30 +4739,53 @@ Check the console logs above for specific API error details.
         # Non-strict: return mock news
         return self.get_mock_game_news(home_team, away_team)
     
-    def filter_game_news(self, news_data, home_team, away_team):
-        """Filter news relevant to the game teams"""
-        relevant_news = []
-        
-        if 'articles' in news_data:
-            for article in news_data['articles'][:10]:  # Check first 10 articles
-                headline = article.get('headline', '').lower()
-                description = article.get('description', '').lower()
-                
-                if (home_team.lower() in headline or away_team.lower() in headline or
-                    home_team.lower() in description or away_team.lower() in description):
-                    
-                    relevant_news.append({
-                        'headline': article.get('headline', ''),
-                        'description': article.get('description', ''),
-                        'published': article.get('published', ''),
-                        'source': 'ESPN'
-                    })
-                
-                if len(relevant_news) >= 3:  # Limit to 3 relevant articles
+    def get_news_index(self):
+        """Team index over the news store, rebuilt only when an ingestion swaps in a new store.
+
+        Returns {'articles': [...], 'teams': {abbr: [article ids, newest first]}}.
+        """
+        articles = self.get_nfl_news_feed()
+        news_index = self.news_index
+        if articles is not news_index['source']:
+            teams = {}
+            for article_id, article in enumerate(articles):
+                for team_abbr in article.get('teams', ()):
+                    teams.setdefault(team_abbr, []).append(article_id)
+            news_index = {'source': articles, 'articles': articles, 'teams': teams}
+            self.news_index = news_index
+            print(f"🗂️ Indexed {len(articles)} news articles across {len(teams)} teams")
+        return news_index
+
+    def canonical_team_abbr(self, abbr):
+        """Map an alternate team abbreviation (e.g. ESPN's WSH) onto the one used as key here"""
+        return self.team_abbr_aliases.get(abbr, abbr)
+
+    def find_team_mentions(self, text):
+        """Teams mentioned in text, resolved through the alias table (longest alias wins).
+
+        Names and cities must be capitalized in the text; abbreviations must match exactly.
+        """
+        tokens = re.findall(r"[A-Za-z0-9]+", text or '')
+        mentions = set()
+        i = 0
+        while i < len(tokens):
+            for length in (3, 2, 1):
+                phrase = tokens[i:i + length]
+                if len(phrase) < length:
+                    continue
+                abbr = None
+                if phrase[0][0].isupper() or phrase[0][0].isdigit():
+                    abbr = self.news_name_aliases.get(' '.join(phrase).lower())
+                if abbr is None and length == 1:
+                    abbr = self.news_abbr_aliases.get(phrase[0])
+                if abbr:
+                    mentions.add(abbr)
+                    i += length
                     break
-        
-        return relevant_news
-    
+            else:
+                i += 1
+        return mentions
+
     def get_mock_game_news(self, home_team, away_team):
         """Generate mock news for the game"""
         news_types = [
@@ -3032,6 +4808,10 @@ Check the console logs above for specific API error details.
 
     def update_team_records_weekly(self):
         """Update team records cache weekly by fetching current standings"""
+        if not self.upstream_allowed():
+            self.shared_store.request_refresh('team_records')
+            return
+
         try:
             print(f"Starting weekly team records update at {datetime.now()}")
 
@@ -3041,10 +4821,9 @@ Check the console logs above for specific API error details.
             # Approach 1: Try standings API
             try:
                 standings_url = f"{self.base_url}/standings?season={self.current_season}"
-                response = requests.get(standings_url, headers=self.headers, timeout=10)
+                standings_data = self.http_get_cached(standings_url, headers=self.headers, timeout=10)
 
-                if response.status_code == 200:
-                    standings_data = response.json()
+                if standings_data is not None:
                     self.team_standings_cache = standings_data
                     if self.parse_standings_to_records(standings_data):
                         records_updated = True
@@ -3057,10 +4836,9 @@ Check the console logs above for specific API error details.
                 try:
                     current_week = self.get_current_week()
                     scoreboard_url = f"{self.base_url}/scoreboard?week={current_week}&seasontype=2&year={self.current_season}"
-                    response = requests.get(scoreboard_url, headers=self.headers, timeout=10)
+                    scoreboard_data = self.http_get_cached(scoreboard_url, headers=self.headers, timeout=10)
 
-                    if response.status_code == 200:
-                        scoreboard_data = response.json()
+                    if scoreboard_data is not None:
                         if self.parse_scoreboard_to_records(scoreboard_data):
                             records_updated = True
                             print(f"Updated records from scoreboard week {current_week}")
@@ -3069,9 +4847,8 @@ Check the console logs above for specific API error details.
                             prev_week = max(1, current_week - 1)
                             if prev_week != current_week:
                                 fallback_url = f"{self.base_url}/scoreboard?week={prev_week}&seasontype=2&year={self.current_season}"
-                                fallback_response = requests.get(fallback_url, headers=self.headers, timeout=10)
-                                if fallback_response.status_code == 200:
-                                    fallback_data = fallback_response.json()
+                                fallback_data = self.http_get_cached(fallback_url, headers=self.headers, timeout=10)
+                                if fallback_data is not None:
                                     if self.parse_scoreboard_to_records(fallback_data):
                                         records_updated = True
                                         print(f"Updated records from fallback week {prev_week}")
@@ -3092,6 +4869,7 @@ Check the console logs above for specific API error details.
         """Parse ESPN standings data to extract team records"""
         try:
             records_found = False
+            team_records = dict(self.team_records_cache)
             if 'children' in standings_data:
                 for conference in standings_data['children']:
                     if 'standings' in conference and 'entries' in conference['standings']:
@@ -3111,9 +4889,11 @@ Check the console logs above for specific API error details.
                                         losses = stat.get('value', 0)
 
                                 record_str = f"{wins}-{losses}"
-                                self.team_records_cache[team_abbr] = record_str
+                                team_records[team_abbr] = record_str
                                 records_found = True
 
+            with self.team_records_lock:
+                self.team_records_cache = team_records
             return records_found
 
         except Exception as e:
@@ -3124,6 +4904,7 @@ Check the console logs above for specific API error details.
         """Parse scoreboard data to extract team records as fallback"""
         try:
             records_found = False
+            team_records = dict(self.team_records_cache)
             if 'events' in scoreboard_data:
                 for event in scoreboard_data['events']:
                     competitions = event.get('competitions', [])
@@ -3135,16 +4916,18 @@ Check the console logs above for specific API error details.
 
                             if team_abbr:
                                 # Use existing record parsing logic
-                                record_str = self.parse_team_record(competitor)
+                                record_str = self.parse_competitor_record(competitor)
                                 if record_str and record_str != '0-0':
                                     # Ensure record is stored as string format
                                     if isinstance(record_str, dict):
                                         wins = record_str.get('wins', 0)
                                         losses = record_str.get('losses', 0)
                                         record_str = f"{wins}-{losses}"
-                                    self.team_records_cache[team_abbr] = record_str
+                                    team_records[team_abbr] = record_str
                                     records_found = True
 
+            with self.team_records_lock:
+                self.team_records_cache = team_records
             return records_found
 
         except Exception as e:
@@ -3174,7 +4957,7 @@ Check the console logs above for specific API error details.
                 return cached_record
 
         # Fall back to original parsing method
-        record = self.parse_team_record(competitor)
+        record = self.parse_competitor_record(competitor)
 
         # For 2025 season, use current 2025 records when ESPN returns 0-0
         if self.current_season == 2025 and team_abbr and (record == '0-0' or not record):
@@ -3242,18 +5025,27 @@ Check the console logs above for specific API error details.
         return "Never updated"
 
     def daily_morning_refresh(self):
-        """Perform daily morning refresh of line movements, injuries, weather"""
+        """Daily morning refresh of odds, injuries, news and weather.
+
+        Takes a new odds snapshot, then runs the current week's refresh-and-merge,
+        which re-enriches the sections that are past their section TTLs.
+        """
+        if not self.upstream_allowed():
+            self.shared_store.request_refresh('daily_refresh')
+            return self.weekly_games_cache.get(str(self.get_current_week()))
+
         try:
             print(f"Starting daily morning refresh at {datetime.now()}")
 
             # Refresh current week games data
             current_week = self.get_current_week()
 
-            # Clear relevant caches to force fresh data
-            self.odds_cache = None
+            # Expire the odds snapshot to force a fresh fetch; requests keep using the
+            # current one until the new snapshot is swapped in
             self.odds_cache_time = None
 
-            # Get fresh data for current week
+            # Get fresh data for current week through the refresh-and-merge path
+            self.last_refresh_check.pop(str(current_week), None)
             fresh_games = self.get_games_for_week(current_week)
 
             self.last_daily_refresh = datetime.now()
@@ -3280,6 +5072,11 @@ Check the console logs above for specific API error details.
 
     def start_weekly_scheduler(self):
         """Start the background scheduler for weekly and daily updates"""
+        if self.process_mode == 'web':
+            print("🌐 Web worker mode: serving snapshots from the shared store, no upstream polling")
+            self.sync_shared_store()
+            return
+
         def run_scheduler():
             # Schedule weekly team record updates on Tuesdays at 2 AM (after Monday Night Football)
             schedule.every().tuesday.at("02:00").do(self.update_team_records_weekly)
@@ -3300,26 +5097,718 @@ Check the console logs above for specific API error details.
         scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
         scheduler_thread.start()
 
-        # Do initial updates if needed
+        # Initial updates run in the background so startup never waits on upstream APIs
+        threading.Thread(target=self.run_startup_warmup, daemon=True).start()
+
+        # Keep live scores current between the 12-hour refresh checks
+        self.start_live_poller()
+
+        if self.process_mode == 'refresher':
+            threading.Thread(target=self.run_shared_refresher, daemon=True).start()
+
+        threading.Thread(target=self.run_warm_snapshot_writer, daemon=True).start()
+
+    def start_background_services(self):
+        """Start the scheduler, pollers and cache warm-up once; returns immediately"""
+        with self.startup_lock:
+            if self.background_started:
+                return False
+            self.background_started = True
+        self.start_weekly_scheduler()
+        return True
+
+    def run_startup_warmup(self):
+        """Warm the caches after startup: team records, then the current week"""
+        self.warmup_status.update(state='warming', started_at=datetime.now().isoformat())
+        steps = []
         if (not self.team_records_last_updated or
             (datetime.now() - self.team_records_last_updated).days >= 7):
-            print("Performing initial team records update...")
-            self.update_team_records_weekly()
-
-        # Check if daily refresh is needed
+            steps.append(('team_records', self.warm_team_records))
         if self.should_perform_daily_refresh():
-            print("Performing initial daily refresh...")
-            self.daily_morning_refresh()
+            steps.append(('daily_refresh', self.warm_daily_refresh))
+        else:
+            steps.append(('current_week', self.warm_current_week))
+
+        # Steps return whether they warmed their cache; the upstream helpers swallow their
+        # own errors, so a False (or an exception) is a failure retried with exponential backoff
+        while steps:
+            failed = []
+            for name, step in steps:
+                self.warmup_status['steps'][name] = 'running'
+                print(f"🔥 Warm-up: {name}...")
+                try:
+                    warmed = step()
+                except Exception as e:
+                    print(f"❌ Warm-up step {name} failed: {e}")
+                    warmed = False
+                if warmed:
+                    self.warmup_status['steps'][name] = 'done'
+                else:
+                    print(f"❌ Warm-up step {name} did not warm its cache")
+                    self.warmup_status['steps'][name] = 'failed'
+                    failed.append((name, step))
+            if not failed:
+                break
+
+            attempts = self.warmup_status['attempts'] + 1
+            delay = min(self.warmup_retry_base * 2 ** (attempts - 1), self.warmup_retry_max)
+            self.warmup_status.update(state='retrying', attempts=attempts,
+                                      next_retry_at=(datetime.now() + timedelta(seconds=delay)).isoformat())
+            print(f"🔁 Retrying {len(failed)} warm-up steps in {delay}s")
+            self.warmup_retry_event.wait(delay)
+            self.warmup_retry_event.clear()
+            steps = failed
+
+        self.warmup_status.update(state='ready', next_retry_at=None, finished_at=datetime.now().isoformat())
+        print("🔥 Warm-up ready")
+
+    def warm_team_records(self):
+        """Warm-up step: refresh team records (True once they were updated)"""
+        last_updated = self.team_records_last_updated
+        self.update_team_records_weekly()
+        return self.team_records_last_updated is not None and self.team_records_last_updated != last_updated
+
+    def warm_current_week(self):
+        """Warm-up step: load the current week (True once it is cached with games)"""
+        current_week = self.get_current_week()
+        self.get_games_for_week(current_week)
+        return bool(self.weekly_games_cache.get(str(current_week)))
+
+    def warm_daily_refresh(self):
+        """Warm-up step: run the daily refresh (True once the current week is cached with games)"""
+        self.daily_morning_refresh()
+        return bool(self.weekly_games_cache.get(str(self.get_current_week())))
+
+    def is_ready(self):
+        """Whether caches are warm enough to serve traffic.
+
+        Ready once warm-up finishes, or as soon as the current week is cached while
+        failed warm-up steps are still being retried (see warmup_status).
+        """
+        if self.process_mode == 'web':
+            return self.shared_store_version > 0
+        if self.warmup_status['state'] == 'ready':
+            return True
+        current_week = self.current_week_cache
+        return bool(current_week) and str(current_week) in self.weekly_games_cache
+
+    def upstream_allowed(self):
+        """Web workers never call upstream APIs; the refresher (or standalone process) does"""
+        return self.process_mode != 'web'
+
+    def build_shared_snapshots(self):
+        """Collect (key, fingerprint, build payload) for everything web workers read"""
+        def iso(value):
+            return value.isoformat() if isinstance(value, datetime) else value
+
+        entries = []
+        for week_key in list(self.weekly_games_cache):
+            fingerprint = (f"{self.weekly_cache_hashes.get(week_key)}:{self.weekly_cache_sections.get(week_key)}:"
+                           f"{iso(self.weekly_cache_timestamps.get(week_key))}")
+            entries.append((f"week:{week_key}", fingerprint, lambda week_key=week_key: {
+                'games': self.weekly_games_cache.get(week_key, []),
+                'timestamp': iso(self.weekly_cache_timestamps.get(week_key)),
+                'sections': self.weekly_cache_sections.get(week_key),
+                'refresh_check': iso(self.last_refresh_check.get(week_key))
+            }))
+        entries.append(('odds', str(self.odds_snapshot_version), lambda: {
+            'odds_cache': self.odds_cache,
+            'odds_cache_time': iso(self.odds_cache_time),
+            'odds_snapshot_version': self.odds_snapshot_version
+        }))
+        entries.append(('line_history', str(self.odds_snapshot_version), lambda: {
+            'historical_odds': self.historical_odds,
+            'line_movements': self.line_movements,
+            'odds_snapshot_version': self.odds_snapshot_version
+        }))
+        entries.append(('team_records', f"{iso(self.team_records_last_updated)}:{len(self.team_records_cache)}", lambda: {
+            'records': self.team_records_cache,
+            'standings': self.team_standings_cache,
+            'last_updated': iso(self.team_records_last_updated)
+        }))
+        team_enrichment = dict(self.team_enrichment_cache)
+        entries.append(('team_enrichment', str(sorted((key, iso(value[0])) for key, value in team_enrichment.items())), lambda: [
+            [kind, team_id, iso(fetched_at), value] for (kind, team_id), (fetched_at, value) in team_enrichment.items()
+        ]))
+        entries.append(('news', str(iso(self.news_cache_time)), lambda: {
+            'news_cache': self.news_cache,
+            'news_cache_time': iso(self.news_cache_time)
+        }))
+        entries.append(('current_week', f"{self.current_week_cache}:{iso(self.current_week_cache_time)}", lambda: {
+            'week': self.current_week_cache,
+            'detected_at': iso(self.current_week_cache_time)
+        }))
+        entries.append(('refresh_state', str(iso(self.last_daily_refresh)), lambda: {
+            'last_daily_refresh': iso(self.last_daily_refresh)
+        }))
+        return entries
+
+    def publish_shared_snapshots(self):
+        """Publish every snapshot that changed since the last publish to the shared store"""
+        changed = {}
+        fingerprints = {}
+        for key, fingerprint, build_payload in self.build_shared_snapshots():
+            if self.published_fingerprints.get(key) != fingerprint:
+                changed[key] = json.dumps(build_payload(), default=str)
+                fingerprints[key] = fingerprint
+        if not changed:
+            return None
+
+        version = self.shared_store.publish(changed)
+        self.published_fingerprints.update(fingerprints)
+        print(f"📤 Published {len(changed)} snapshots to shared store (version {version})")
+        return version
+
+    def sync_shared_store(self):
+        """Cheap version check; load and swap in whatever the refresher published since"""
+        if self.shared_store is None:
+            return False
+        try:
+            if self.shared_store.get_version() == self.shared_store_version:
+                return False
+            with self.shared_store_lock:
+                snapshots, version = self.shared_store.read_since(self.shared_store_version)
+                for key, payload in snapshots.items():
+                    self.apply_shared_snapshot(key, json.loads(payload))
+                self.shared_store_version = version
+            return True
+        except Exception as e:
+            print(f"❌ Shared store sync failed: {e}")
+            return False
+
+    def apply_shared_snapshot(self, key, data):
+        """Swap one published snapshot into this worker's caches"""
+        def parse_time(value):
+            return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+        if key.startswith('week:'):
+            week_key = key.split(':', 1)[1]
+            with self.weekly_cache_lock:
+                self.weekly_games_cache[week_key] = data['games']
+                self.weekly_cache_timestamps[week_key] = parse_time(data['timestamp'])
+                self.weekly_cache_sections[week_key] = data['sections'] or self.enrichment_sections
+                if data.get('refresh_check'):
+                    self.last_refresh_check[week_key] = parse_time(data['refresh_check'])
+                self.update_week_hashes(week_key, data['games'])
+        elif key == 'odds':
+            self.odds_cache = data['odds_cache']
+            self.odds_cache_time = parse_time(data['odds_cache_time'])
+            self.odds_snapshot_version = max(self.odds_snapshot_version, data['odds_snapshot_version'])
+        elif key == 'line_history':
+            self.historical_odds = data['historical_odds']
+            self.line_movements = data['line_movements']
+            self.odds_snapshot_version = max(self.odds_snapshot_version, data['odds_snapshot_version'])
+        elif key == 'team_records':
+            self.team_records_cache = data['records']
+            self.team_standings_cache = data.get('standings')
+            self.team_records_last_updated = parse_time(data['last_updated'])
+        elif key == 'team_enrichment':
+            self.team_enrichment_cache = {(kind, team_id): (parse_time(fetched_at), value)
+                                          for kind, team_id, fetched_at, value in data}
+        elif key == 'news':
+            self.news_cache = data['news_cache']
+            self.news_cache_time = parse_time(data['news_cache_time'])
+        elif key == 'current_week':
+            self.current_week_cache = data['week']
+            self.current_week_cache_time = parse_time(data['detected_at']) or datetime.now()
+        elif key == 'refresh_state':
+            self.last_daily_refresh = parse_time(data['last_daily_refresh'])
+
+    def get_snapshot_expiry(self, key):
+        """When a cache snapshot entry stops being worth restoring (None = no expiry)"""
+        def after(start, seconds):
+            return start + timedelta(seconds=seconds) if isinstance(start, datetime) else None
+
+        if key == 'odds':
+            return after(self.odds_cache_time, 600)
+        if key == 'line_history':
+            return after(datetime.now(), 7 * 86400)
+        if key == 'team_records':
+            return after(self.team_records_last_updated, 7 * 86400)
+        if key == 'team_enrichment':
+            fetched = [fetched_at for fetched_at, _ in self.team_enrichment_cache.values()]
+            return after(max(fetched), self.team_enrichment_ttl) if fetched else None
+        if key == 'news':
+            return after(self.news_cache_time, self.news_retention_days * 86400)
+        if key == 'current_week':
+            return after(self.current_week_cache_time, self.current_week_ttl)
+        return None
+
+    def get_warm_snapshot_entries(self):
+        """Snapshot entries for the warm-start file (weekly data has its own cache file)"""
+        return [entry for entry in self.build_shared_snapshots() if not entry[0].startswith('week:')]
+
+    def write_warm_snapshot(self):
+        """Write every non-weekly cache to the warm-start snapshot (skipped if nothing changed)"""
+        if not self.upstream_allowed():
+            return False  # Web workers get their caches from the shared store
+
+        entries = self.get_warm_snapshot_entries()
+        fingerprint = '|'.join(f"{key}={value}" for key, value, _ in entries)
+        if fingerprint == self.warm_snapshot_fingerprint:
+            return False
+
+        now = datetime.now()
+        snapshot = {'format_version': self.warm_snapshot_format, 'season': self.current_season,
+                    'written_at': now.isoformat(), 'entries': {}}
+        for key, _, build_payload in entries:
+            expires_at = self.get_snapshot_expiry(key)
+            snapshot['entries'][key] = {
+                'saved_at': now.isoformat(),
+                'expires_at': expires_at.isoformat() if expires_at else None,
+                'data': build_payload()
+            }
+
+        if self.write_json_file(self.warm_snapshot_path, snapshot, indent=None):
+            self.warm_snapshot_fingerprint = fingerprint
+            print(f"💾 Wrote warm-start snapshot ({len(entries)} entries)")
+            return True
+        return False
+
+    def load_warm_snapshot(self):
+        """Restore non-weekly caches from the warm-start snapshot, skipping expired entries"""
+        try:
+            if not os.path.exists(self.warm_snapshot_path):
+                return 0
+            with open(self.warm_snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            if (snapshot.get('format_version') != self.warm_snapshot_format or
+                    snapshot.get('season') != self.current_season):
+                print("Ignoring warm-start snapshot from another format version or season")
+                return 0
+
+            now = datetime.now()
+            restored = []
+            for key, entry in snapshot.get('entries', {}).items():
+                expires_at = entry.get('expires_at')
+                if expires_at and datetime.fromisoformat(expires_at) <= now:
+                    continue
+                self.apply_shared_snapshot(key, entry['data'])
+                restored.append(key)
+            print(f"Restored warm-start snapshot: {', '.join(restored) or 'nothing fresh'}")
+            return len(restored)
+        except Exception as e:
+            print(f"Could not load warm-start snapshot: {e}")
+            return 0
+
+    def run_warm_snapshot_writer(self):
+        """Background writer for the warm-start snapshot"""
+        while True:
+            time.sleep(self.warm_snapshot_interval)
+            self.write_warm_snapshot()
+
+    def run_shared_refresher(self):
+        """Refresher process loop: serve web worker requests, keep the current week fresh, publish"""
+        print(f"📤 Shared store refresher started ({self.shared_store.path})")
+        while True:
+            try:
+                for name in self.shared_store.take_refresh_requests():
+                    print(f"📥 Refresh requested by web worker: {name}")
+                    if name.startswith('week:'):
+                        self.get_games_for_week(int(name.split(':', 1)[1]))
+                    elif name == 'daily_refresh':
+                        self.daily_morning_refresh()
+                    elif name == 'team_records':
+                        self.update_team_records_weekly()
+                    elif name == 'news':
+                        self.get_nfl_news_feed()
+
+                # The week's own refresh checks decide whether this touches upstream
+                self.get_games_for_week(self.get_current_week())
+                self.publish_shared_snapshots()
+            except Exception as e:
+                print(f"❌ Shared refresher cycle failed: {e}")
+            time.sleep(self.shared_publish_interval)
+
+    def subscribe_live_updates(self):
+        """Register a live feed subscriber and make sure the poller is running"""
+        subscriber = queue.Queue(maxsize=self.live_queue_size)
+        with self.live_subscribers_lock:
+            self.live_subscribers.add(subscriber)
+            snapshot = [dict(state, game_id=game_id) for game_id, state in dict(self.live_game_state).items()]
+        self.start_live_poller()
+
+        # New clients start from the last published state, not from nothing
+        subscriber.put_nowait({'id': self.live_event_id, 'type': 'snapshot', 'data': {'games': snapshot}})
+        print(f"📡 Live subscriber connected ({len(self.live_subscribers)} total)")
+        return subscriber
+
+    def unsubscribe_live_updates(self, subscriber):
+        """Remove a live feed subscriber"""
+        with self.live_subscribers_lock:
+            self.live_subscribers.discard(subscriber)
+        print(f"📡 Live subscriber disconnected ({len(self.live_subscribers)} remaining)")
+
+    def publish_live_event(self, event_type, data):
+        """Fan a live event out to every subscriber queue"""
+        with self.live_subscribers_lock:
+            self.live_event_id += 1
+            event = {'id': self.live_event_id, 'type': event_type, 'data': data}
+            for subscriber in list(self.live_subscribers):
+                try:
+                    subscriber.put_nowait(event)
+                except queue.Full:
+                    # Slow client: drop its oldest event rather than block the poller
+                    try:
+                        subscriber.get_nowait()
+                        subscriber.put_nowait(event)
+                    except (queue.Empty, queue.Full):
+                        pass
+
+    def start_live_poller(self):
+        """Start the shared live poller thread if it isn't already running"""
+        with self.live_subscribers_lock:
+            if self.live_poller_thread is None or not self.live_poller_thread.is_alive():
+                self.live_poller_thread = threading.Thread(target=self.run_live_poller, daemon=True)
+                self.live_poller_thread.start()
+
+    def run_live_poller(self):
+        """Background poller: scoreboard on an adaptive cadence, feed checks while anyone listens"""
+        print("📡 Live poller started")
+        while True:
+            try:
+                self.poll_live_updates()
+            except Exception as e:
+                print(f"❌ Live poll failed: {e}")
+
+            # Sleep until the next scoreboard poll is due, but wake for feed checks while clients are connected
+            week_key = str(self.get_current_week())
+            next_poll = self.score_poll_due.get(week_key)
+            sleep_for = (next_poll - datetime.now()).total_seconds() if next_poll else self.poll_intervals['pregame']
+            if self.live_subscribers:
+                sleep_for = min(sleep_for, self.live_poll_interval)
+            time.sleep(max(1, sleep_for))
+
+    def get_week_poll_interval(self, games):
+        """Pick the scoreboard poll interval for a week from its game states (None = all final)"""
+        now = datetime.now(timezone.utc)
+        interval = None
+        for game in games:
+            status = game.get('status')
+            if status == 'final':
+                continue
+            if any(name in game.get('status_name', '') for name in self.idle_status_names):
+                # Postponed/canceled/suspended games report as pregame; they won't go live this week
+                continue
+            if status == 'live':
+                return self.poll_intervals['live']
+
+            # A pregame game just past kickoff is about to go live; poll it at the live cadence
+            kickoff = self.parse_kickoff(game)
+            if kickoff and kickoff <= now < kickoff + timedelta(seconds=self.live_poll_window):
+                return self.poll_intervals['live']
+            interval = self.poll_intervals['pregame']
+        return interval
+
+    def parse_scoreboard_scores(self, data):
+        """Parse just ids, teams, scores and status from an ESPN scoreboard response"""
+        games = []
+        for event in data.get('events', []):
+            competition = event.get('competitions', [{}])[0]
+            game = {
+                'id': event.get('id'),
+                'date': event.get('date', competition.get('date', '')),
+                'status': self.parse_game_status(event),
+                'status_name': self.get_status_name(event)
+            }
+            for competitor in competition.get('competitors', []):
+                team_data = competitor.get('team', {})
+                side = 'home' if competitor.get('homeAway') == 'home' else 'away'
+                game[f'{side}_team'] = {
+                    'id': team_data.get('id', ''),
+                    'name': team_data.get('displayName', team_data.get('name', '')),
+                    'abbr': team_data.get('abbreviation', '')
+                }
+                try:
+                    game[f'{side}_score'] = int(competitor.get('score', 0) or 0)
+                except (TypeError, ValueError):
+                    game[f'{side}_score'] = 0
+            if game['id'] and 'home_team' in game and 'away_team' in game:
+                games.append(game)
+        return games
+
+    def fetch_scoreboard_scores(self, week):
+        """Fetch the scoreboard for a week (scores and status only, no enrichment)"""
+        if not self.upstream_allowed():
+            # Web workers read scores from the last published week instead
+            return [{key: game.get(key) for key in ('id', 'date', 'status', 'home_team', 'away_team', 'home_score', 'away_score')}
+                    for game in self.weekly_games_cache.get(str(week), [])]
+
+        try:
+            url = f"{self.base_url}/scoreboard?week={week}&seasontype=2&year={self.current_season}"
+            data = self.http_get_cached(url, headers=self.headers, timeout=10)
+            if data is not None:
+                return self.parse_scoreboard_scores(data)
+        except Exception as e:
+            print(f"❌ Error polling scoreboard: {e}")
+        return None
+
+    def merge_scoreboard_scores(self, week, scores):
+        """Merge polled scores/status into the cached week without re-running enrichment"""
+        week_key = str(week)
+        with self.get_week_writer_lock(week_key):
+            cached_games = self.weekly_games_cache.get(week_key)
+            if not cached_games:
+                return 0
+
+            polled = {game['id']: game for game in scores}
+            merged_games = []
+            changes = []
+            for game in cached_games:
+                fresh = polled.get(game.get('id'))
+                fields = {}
+                if fresh:
+                    fields = {key: {'from': game.get(key), 'to': fresh[key]}
+                              for key in ('status', 'home_score', 'away_score') if game.get(key) != fresh[key]}
+                if not fields:
+                    merged_games.append(game)
+                    continue
+
+                # Copy-on-write so the published week is never modified in place
+                game = dict(game, status=fresh['status'], home_score=fresh['home_score'], away_score=fresh['away_score'])
+                game['home_team'] = dict(game.get('home_team', {}), score=fresh['home_score'])
+                game['away_team'] = dict(game.get('away_team', {}), score=fresh['away_score'])
+                merged_games.append(game)
+                changes.append({'game_id': game.get('id'), 'type': 'updated', 'fields': fields, 'sections': []})
+
+            if changes:
+                print(f"🏈 Merged {len(changes)} score/status updates into Week {week}")
+                with self.weekly_cache_lock:
+                    self.weekly_games_cache[week_key] = merged_games
+                    self.update_week_hashes(week_key, merged_games)
+                    # Score events are already pushed by the live poller
+                    self.record_week_changes(week, changes, publish=False)
+                self.mark_week_dirty(week_key)
+            return len(changes)
+
+    def poll_week_scores(self, week):
+        """Poll the scoreboard for a week if its adaptive cadence says it's due"""
+        week_key = str(week)
+        now = datetime.now()
+        due = self.score_poll_due.get(week_key)
+        if due is not None and now < due:
+            return None
+
+        known_games = self.live_scoreboard.get(week_key) or self.weekly_games_cache.get(week_key) or []
+        if known_games and self.get_week_poll_interval(known_games) is None:
+            # Every game is final; nothing left to poll this week
+            self.score_poll_due[week_key] = now + timedelta(seconds=self.poll_intervals['pregame'])
+            return None
+
+        scores = self.fetch_scoreboard_scores(week)
+        if scores is None:
+            self.score_poll_due[week_key] = now + timedelta(seconds=self.poll_intervals['live'])
+            return None
+
+        self.live_scoreboard[week_key] = scores
+        self.merge_scoreboard_scores(week, scores)
+        interval = self.get_week_poll_interval(scores) or self.poll_intervals['pregame']
+        self.score_poll_due[week_key] = now + timedelta(seconds=interval)
+        return scores
+
+    def poll_live_updates(self):
+        """Run one live poll and publish score, odds, line movement and injury deltas"""
+        if not self.upstream_allowed():
+            self.sync_shared_store()
+        week = self.get_current_week()
+        scores = self.poll_week_scores(week)
+
+        # Score and status changes
+        for game in scores or []:
+            state = {
+                'week': week,
+                'status': game.get('status'),
+                'home_team': game['home_team'].get('abbr'),
+                'away_team': game['away_team'].get('abbr'),
+                'home_score': game.get('home_score', 0),
+                'away_score': game.get('away_score', 0)
+            }
+            previous = self.live_game_state.get(game['id'])
+            self.live_game_state[game['id']] = state
+            if previous is not None and previous != state:
+                changed = [key for key in ('status', 'home_score', 'away_score') if previous.get(key) != state[key]]
+                self.publish_live_event('score', dict(state, game_id=game['id'], changed=changed))
+
+        # Odds, line movement and injury checks only matter while someone is listening
+        if not self.live_subscribers:
+            return
+        games = self.live_scoreboard.get(str(week)) or self.weekly_games_cache.get(str(week)) or []
+
+        # New odds snapshots (refresh_odds_cache keeps its own 10 minute TTL)
+        self.refresh_odds_cache()
+        if self.odds_cache and self.live_odds_version != self.odds_snapshot_version:
+            first_snapshot = self.live_odds_version is None
+            self.live_odds_version = self.odds_snapshot_version
+            if not first_snapshot:
+                odds = []
+                for game in games:
+                    betting = self.get_real_betting_odds_for_game(game)
+                    if betting:
+                        odds.append({'game_id': game['id'], 'week': week, 'betting': betting})
+                self.publish_live_event('odds', {'snapshot_version': self.odds_snapshot_version, 'games': odds})
+
+        # Line movement events
+        for odds_game_id, movements in list(self.line_movements.items()):
+            previous = self.live_line_movements.get(odds_game_id)
+            self.live_line_movements[odds_game_id] = movements
+            if movements and previous != movements:
+                self.publish_live_event('line_movement', {'odds_game_id': odds_game_id, 'movements': movements})
+
+        # Injury status flips for teams playing this week
+        for game in games:
+            for side in ('home_team', 'away_team'):
+                team = game[side]
+                for injury in self.get_team_injuries(team.get('abbr'), team.get('id')):
+                    key = (team.get('abbr'), injury.get('player_name'))
+                    previous = self.live_injury_state.get(key)
+                    self.live_injury_state[key] = injury.get('status')
+                    if previous is not None and previous != injury.get('status'):
+                        self.publish_live_event('injury', {
+                            'game_id': game['id'],
+                            'team': team.get('abbr'),
+                            'player_name': injury.get('player_name'),
+                            'position': injury.get('position'),
+                            'from': previous,
+                            'to': injury.get('status')
+                        })
 
-# Initialize the tracker
+# Initialize the tracker (no network I/O here; background services start lazily)
 nfl_tracker = NFLGameTracker()
+app.config.setdefault('TRACKER_AUTOSTART', True)
+
+def create_app(start_background=True):
+    """Configure and return the module-level app (and its tracker).
 
-# Start the weekly scheduler
-nfl_tracker.start_weekly_scheduler()
+    Not a true factory: routes and the tracker are module globals, so every call
+    returns the same `app` object. With start_background the scheduler, pollers
+    and warm-up start right away (in background threads). Without it nothing
+    starts, not even on the first request, which keeps imports and tests offline.
+    Importing `app:app` directly still works; services then start on the first request.
+    """
+    app.config['TRACKER_AUTOSTART'] = start_background
+    if start_background:
+        nfl_tracker.start_background_services()
+    return app
+
+@app.before_request
+def ensure_background_services():
+    """Lazily start background services on the first request"""
+    if app.config['TRACKER_AUTOSTART'] and not nfl_tracker.background_started:
+        nfl_tracker.start_background_services()
+
+@app.before_request
+def sync_shared_snapshots():
+    """Web workers pick up newly published snapshots before serving each request"""
+    if nfl_tracker.process_mode == 'web':
+        nfl_tracker.sync_shared_store()
+
+# Precompressed response bodies: cache key -> (version, {encoding: body bytes})
+encoded_body_cache = {}
+encoded_body_cache_lock = threading.Lock()
+
+def encode_body_variants(body):
+    """Compress a response body once into every encoding we can serve"""
+    variants = {'identity': body}
+    if len(body) >= 1024:  # Not worth compressing tiny payloads
+        variants['gzip'] = gzip.compress(body, compresslevel=9)
+        if brotli:
+            variants['br'] = brotli.compress(body, quality=9)
+    return variants
+
+def get_encoded_body(cache_key, version, build_body):
+    """Return the precompressed variants for a cache key, building them once per version"""
+    cached = encoded_body_cache.get(cache_key)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    variants = encode_body_variants(build_body())
+    if version is not None:
+        with encoded_body_cache_lock:
+            encoded_body_cache[cache_key] = (version, variants)
+    return variants
+
+def get_cached_encoded_body(cache_key, version):
+    """Return precompressed variants only if they were built for this exact version"""
+    cached = encoded_body_cache.get(cache_key)
+    if cached and cached[0] == version:
+        return cached[1]
+    return None
+
+def coded_etag(etag, encoding=None):
+    """Strong ETag for one content-coding of a representation (RFC 9110: codings must not share one)"""
+    return f"{etag}-{encoding}" if encoding and encoding != 'identity' else etag
+
+def encoded_response(variants, mimetype, etag=None):
+    """Pick the best encoding the client accepts and wrap it in a response, tagged per coding"""
+    offered = [encoding for encoding in ('br', 'gzip') if encoding in variants]
+    encoding = request.accept_encodings.best_match(offered) if offered else None
+
+    response = Response(variants[encoding or 'identity'], mimetype=mimetype)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if etag:
+        response.set_etag(coded_etag(etag, encoding))
+    response.vary.add('Accept-Encoding')
+    return response
+
+def json_body(payload):
+    """Serialize a payload exactly like jsonify would"""
+    return f"{app.json.dumps(payload)}\n".encode('utf-8')
+
+def apply_week_cache_headers(response, week, etag=None):
+    """Attach Last-Modified and Cache-Control headers (and an ETag, if given) to a week response"""
+    if etag:
+        response.set_etag(etag)
+    last_modified = nfl_tracker.get_week_last_modified(week)
+    if last_modified:
+        response.last_modified = last_modified.astimezone(timezone.utc)
+    # Clients may keep a copy but must revalidate it on every use
+    response.cache_control.public = True
+    response.cache_control.max_age = 0
+    response.cache_control.must_revalidate = True
+    return response
+
+def conditional_week_response(week, endpoint, build_payload, sections=None):
+    """Serve a week endpoint with If-None-Match revalidation.
+
+    When the week cache is current and the client already holds the matching
+    ETag, a 304 is returned before any payload is built. sections limits the
+    ETag to those per-game hash sections.
+    """
+    cache_key = (endpoint, week)
+
+    variants = None
+    if nfl_tracker.is_week_cache_current(week):
+        etag = nfl_tracker.get_week_etag(week, endpoint, sections)
+        held = [coded_etag(etag, encoding) for encoding in ('identity', 'gzip', 'br')
+                if etag and request.if_none_match.contains(coded_etag(etag, encoding))]
+        if held:
+            return apply_week_cache_headers(Response(status=304), week, held[0])
+        # Serve the body precompressed for this version without rebuilding it
+        variants = get_cached_encoded_body(cache_key, etag) if etag else None
+
+    if variants is None:
+        body = json_body(build_payload())
+        etag = nfl_tracker.get_week_etag(week, endpoint, sections)
+        variants = get_encoded_body(cache_key, etag, lambda: body)
+
+    response = encoded_response(variants, 'application/json', etag)
+    apply_week_cache_headers(response, week)
+    return response.make_conditional(request)
+
+def template_version(template_name, variant=''):
+    """Version a template by its file modification time and size"""
+    template_path = os.path.join(os.path.dirname(__file__), 'templates', template_name)
+    stat = os.stat(template_path)
+    return f"{template_name}:{stat.st_mtime_ns}:{stat.st_size}:{variant}"
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    version = template_version('index.html')
+    variants = get_encoded_body('index', version,
+                                lambda: render_template('index.html').encode('utf-8'))
+    response = encoded_response(variants, 'text/html', hashlib.md5(version.encode()).hexdigest())
+    return response.make_conditional(request)
 
 @app.route('/beta')
 def index_beta():
@@ -3328,22 +5817,56 @@ def index_beta():
     This keeps the main dashboard untouched. Visit /beta to see the experimental styling.
     """
     try:
-        import os
-        template_path = os.path.join(os.path.dirname(__file__), 'templates', 'index.html')
-        with open(template_path, 'r', encoding='utf-8') as f:
-            html = f.read()
-
-        # Add cache-busting query so new beta styles show immediately after deploy
-        injection = "\n    <link rel=\"stylesheet\" href=\"/static/index_beta.css?v=2\">\n"
-        if '</head>' in html:
-            html = html.replace('</head>', f'{injection}</head>')
-        else:
-            # Fallback: prepend link at the start if no head tag is found
-            html = injection + html
-        return html
+        def build_beta_html():
+            template_path = os.path.join(os.path.dirname(__file__), 'templates', 'index.html')
+            with open(template_path, 'r', encoding='utf-8') as f:
+                html = f.read()
+
+            # Add cache-busting query so new beta styles show immediately after deploy
+            injection = "\n    <link rel=\"stylesheet\" href=\"/static/index_beta.css?v=2\">\n"
+            if '</head>' in html:
+                html = html.replace('</head>', f'{injection}</head>')
+            else:
+                # Fallback: prepend link at the start if no head tag is found
+                html = injection + html
+            return html.encode('utf-8')
+
+        version = template_version('index.html', 'beta-v2')
+        variants = get_encoded_body('index_beta', version, build_beta_html)
+        return encoded_response(variants, 'text/html')
     except Exception as e:
         return f"Beta view failed to load: {e}", 500
 
+@app.route('/api/ready')
+def readiness():
+    """Readiness probe: 200 once caches are warm, 503 while warming up"""
+    current_week = nfl_tracker.current_week_cache
+    ready = nfl_tracker.is_ready()
+    return jsonify({
+        'ready': ready,
+        'mode': nfl_tracker.process_mode,
+        'warmup': nfl_tracker.warmup_status,
+        'shared_store_version': nfl_tracker.shared_store_version if nfl_tracker.shared_store else None,
+        'cached_weeks': sorted(nfl_tracker.weekly_games_cache, key=int),
+        'current_week': current_week,
+        'current_week_cached': str(current_week) in nfl_tracker.weekly_games_cache if current_week else False
+    }), 200 if ready else 503
+
+@app.route('/api/sources/health')
+def sources_health():
+    """Circuit breaker state and rolling success rate / latency per upstream source"""
+    report = nfl_tracker.get_source_health_report()
+    return jsonify({
+        'sources': report,
+        'open_circuits': len([entry for entry in report if entry['state'] == 'open']),
+        'breaker': {
+            'window': nfl_tracker.breaker_window,
+            'min_calls': nfl_tracker.breaker_min_calls,
+            'failure_threshold': nfl_tracker.breaker_failure_threshold,
+            'cooldown_seconds': nfl_tracker.breaker_cooldown
+        }
+    })
+
 @app.route('/api/current-week')
 def get_current_week():
     """Get the current NFL week"""
@@ -3352,24 +5875,161 @@ def get_current_week():
         'season': nfl_tracker.current_season
     })
 
+def parse_game_fields():
+    """Resolve the view/fields query parameters into (variant, fields); fields None = every field"""
+    fields_param = request.args.get('fields')
+    if fields_param:
+        fields = sorted({field.strip() for field in fields_param.split(',') if field.strip()})
+        # Each field combination gets its own encoded body cache entry, so only real fields are accepted
+        unknown = sorted(set(fields) - nfl_tracker.get_known_game_fields())
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+        if 'id' not in fields:
+            fields.insert(0, 'id')
+        return f"fields={','.join(fields)}", fields
+
+    view = request.args.get('view', 'full')
+    if view not in nfl_tracker.game_views:
+        raise ValueError(f"Unknown view '{view}'. Use one of: {', '.join(nfl_tracker.game_views)}")
+    return view, nfl_tracker.game_views[view]
+
+def project_game(game, fields):
+    """Build only the requested top-level fields of a game, including its eliminator pick"""
+    if fields is None:
+        # Copy rather than annotate the shared cached game
+        return dict(game, eliminator=nfl_tracker.get_eliminator_recommendation(game))
+
+    projected = {field: game[field] for field in fields if field in game}
+    if game.get('missing_sections'):
+        # Sections that lost an upstream call and are still being retried in the background
+        projected['missing_sections'] = game['missing_sections']
+    if 'eliminator' in fields:
+        projected['eliminator'] = nfl_tracker.get_eliminator_recommendation(game)
+    return projected
+
 @app.route('/api/games/<int:week>')
 def get_games(week):
-    games = nfl_tracker.get_games_for_week(week)
-    
-    # Add eliminator recommendations to each game
-    for game in games:
-        game['eliminator'] = nfl_tracker.get_eliminator_recommendation(game)
-    
-    return jsonify(games)
+    """Get games for a week; ?view=scores|picks|full or ?fields=a,b limits what is built"""
+    try:
+        variant, fields = parse_game_fields()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return conditional_week_response(week, f"games:{variant}", lambda: build_games_payload(week, fields),
+                                     nfl_tracker.get_hash_sections_for_fields(fields))
+
+def build_games_payload(week, fields=None):
+    """Build a week's game list, enriching only the sections the fields need"""
+    sections = nfl_tracker.get_sections_for_fields(fields)
+    games = nfl_tracker.get_games_for_week(week, sections)
+
+    # Add eliminator recommendations only when the view includes them
+    return [project_game(game, fields) for game in games]
+
+def parse_weeks_param(weeks_param):
+    """Parse a weeks spec like '1-18' or '1,3,5-7' into a sorted list of week numbers"""
+    weeks = set()
+    for part in (weeks_param or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            weeks.update(range(int(start), int(end) + 1))
+        else:
+            weeks.add(int(part))
+
+    if not weeks or min(weeks) < 1 or max(weeks) > 18:
+        raise ValueError("weeks must list regular season weeks between 1 and 18, e.g. weeks=1-18")
+    return sorted(weeks)
+
+def cached_week_body(endpoint, week, sections=None):
+    """JSON body for one week's payload if a current encoding is already cached"""
+    if not nfl_tracker.is_week_cache_current(week):
+        return None
+    variants = get_cached_encoded_body((endpoint, week), nfl_tracker.get_week_etag(week, endpoint, sections))
+    return variants['identity'].rstrip(b'\n') if variants else None
+
+def build_week_body(endpoint, week, build_payload, sections=None):
+    """Build one week's payload body and cache its encodings for single-week requests"""
+    body = json_body(build_payload())
+    get_encoded_body((endpoint, week), nfl_tracker.get_week_etag(week, endpoint, sections), lambda: body)
+    return body.rstrip(b'\n')
+
+def batch_week_response(endpoint, build_payload, sections=None):
+    """Stream one JSON document covering several weeks of an endpoint.
+
+    Weeks with a current cached body are served straight away; the rest are
+    built concurrently under the tracker's shared upstream budget. sections
+    must match the single-week route's, so both share one cached body per week.
+    """
+    try:
+        weeks = parse_weeks_param(request.args.get('weeks'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    def fetch_week(week):
+        with nfl_tracker.upstream_fetch_semaphore:
+            return build_week_body(endpoint, week, lambda: build_payload(week), sections)
+
+    def generate():
+        ready = {week: cached_week_body(endpoint, week, sections) for week in weeks}
+        missing = [week for week in weeks if ready[week] is None]
+        if missing:
+            # Refresh odds once up front so concurrent week fetches share one snapshot
+            nfl_tracker.refresh_odds_cache()
+
+        with ThreadPoolExecutor(max_workers=nfl_tracker.upstream_fetch_limit) as executor:
+            pending = {week: executor.submit(fetch_week, week) for week in missing}
+
+            yield f'{{"season": {nfl_tracker.current_season}, "weeks": {json.dumps(weeks)}, "data": {{'
+            for i, week in enumerate(weeks):
+                body = ready[week]
+                if body is None:
+                    try:
+                        body = pending[week].result()
+                    except Exception as e:
+                        # The 200 is already sent: report the failed week inside the document
+                        print(f"❌ Batch {endpoint} failed for Week {week}: {e}")
+                        body = json.dumps({'error': f"Week {week} failed to build: {e}"}).encode('utf-8')
+                separator = ', ' if i else ''
+                yield f'{separator}"{week}": '.encode('utf-8') + body
+            yield '}}\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+@app.route('/api/games')
+def get_games_batch():
+    """Get games for several weeks at once, e.g. /api/games?weeks=1-18&view=picks"""
+    try:
+        variant, fields = parse_game_fields()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return batch_week_response(f"games:{variant}", lambda week: build_games_payload(week, fields),
+                               nfl_tracker.get_hash_sections_for_fields(fields))
+
+@app.route('/api/analytics')
+def get_analytics_batch():
+    """Get advanced analytics for several weeks at once, e.g. /api/analytics?weeks=1-4"""
+    return batch_week_response('analytics', build_analytics_payload)
+
+@app.route('/api/probabilities')
+def get_probabilities_batch():
+    """Get win probabilities for several weeks at once, e.g. /api/probabilities?weeks=1-18"""
+    return batch_week_response('probabilities', build_probabilities_payload)
 
 @app.route('/api/analytics/<int:week>')
 def get_analytics(week):
     """Get advanced analytics for all games in a week"""
+    return conditional_week_response(week, 'analytics', lambda: build_analytics_payload(week))
+
+def build_analytics_payload(week):
+    """Build the per-game eliminator analytics list for a week"""
     games = nfl_tracker.get_games_for_week(week)
-    
+
     analytics_data = []
     for game in games:
-        analysis = nfl_tracker.get_advanced_eliminator_analysis(game)
+        analysis = nfl_tracker.get_cached_eliminator_analysis(game)
         analytics_data.append({
             'game_id': game.get('id'),
             'home_team': game.get('home_team', {}).get('abbr'),
@@ -3382,8 +6042,8 @@ def get_analytics(week):
             'reasons': analysis['reasons'],
             'warnings': analysis['warnings']
         })
-    
-    return jsonify(analytics_data)
+
+    return analytics_data
 
 @app.route('/api/research-hub/<int:week>')
 def get_research_hub_data(week):
@@ -3407,7 +6067,7 @@ def get_research_hub_data(week):
     
     for game in games:
         # Get comprehensive game analysis
-        analysis = nfl_tracker.get_advanced_eliminator_analysis(game)
+        analysis = nfl_tracker.get_cached_eliminator_analysis(game)
         
         game_research = {
             'game_id': game.get('id'),
@@ -3482,6 +6142,57 @@ def get_research_hub_data(week):
     
     return jsonify(research_data)
 
+def iter_export_lines(cursor=None, record_types=None, limit=None):
+    """Serialize season export records as NDJSON lines"""
+    for count, record in enumerate(nfl_tracker.iter_season_export(cursor, record_types)):
+        if limit is not None and count >= limit:
+            break
+        yield json.dumps(record) + '\n'
+
+def parse_export_types(types_param):
+    """Parse a comma-separated list of export record types"""
+    if not types_param:
+        return None
+    record_types = [t.strip() for t in types_param.split(',') if t.strip()]
+    unknown = [t for t in record_types if t not in ('game', 'analysis', 'odds')]
+    if unknown:
+        raise ValueError(f"Unknown export types: {', '.join(unknown)}. Use game, analysis, odds")
+    return record_types
+
+@app.route('/api/export/season')
+def export_season():
+    """Stream the season's games, analyses and odds snapshots as NDJSON.
+
+    Pass the last received record's cursor as ?cursor= to resume; ?types= and
+    ?limit= narrow the export.
+    """
+    try:
+        record_types = parse_export_types(request.args.get('types'))
+        cursor = request.args.get('cursor')
+        nfl_tracker.parse_export_cursor(cursor)
+        limit = request.args.get('limit', type=int)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    lines = iter_export_lines(cursor, record_types, limit)
+    return Response(stream_with_context(lines), mimetype='application/x-ndjson')
+
+@app.cli.command('export-season')
+@click.option('--output', '-o', type=click.File('w'), default='-', help='NDJSON file to write (default: stdout)')
+@click.option('--cursor', default=None, help='Resume after the record with this cursor')
+@click.option('--types', 'types_param', default=None, help='Comma-separated record types: game,analysis,odds')
+@click.option('--limit', type=int, default=None, help='Stop after this many records')
+def export_season_command(output, cursor, types_param, limit):
+    """Export the season's games, analyses and odds snapshots as NDJSON"""
+    try:
+        record_types = parse_export_types(types_param)
+        nfl_tracker.parse_export_cursor(cursor)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    for line in iter_export_lines(cursor, record_types, limit):
+        output.write(line)
+
 @app.route('/api/picks', methods=['GET', 'POST', 'PUT', 'DELETE'])
 def manage_picks():
     # This would normally connect to a database
@@ -3511,6 +6222,10 @@ def manage_picks():
 @app.route('/api/probabilities/<int:week>')
 def get_probabilities_data(week):
     """Get focused win probability data for all games in a week"""
+    return conditional_week_response(week, 'probabilities', lambda: build_probabilities_payload(week))
+
+def build_probabilities_payload(week):
+    """Build the win probability summary for a week"""
     games = nfl_tracker.get_games_for_week(week)
     
     probabilities_data = []
@@ -3540,12 +6255,12 @@ def get_probabilities_data(week):
             'vig_removed': probability_data.get('vig_removed', False)
         })
     
-    return jsonify({
+    return {
         'week': week,
         'season': nfl_tracker.current_season,
         'total_games': len(probabilities_data),
         'games': probabilities_data
-    })
+    }
 
 @app.route('/api/confidence-rankings/<int:week>')
 def get_confidence_rankings(week):
@@ -3554,7 +6269,7 @@ def get_confidence_rankings(week):
     
     rankings = []
     for game in games:
-        analysis = nfl_tracker.get_advanced_eliminator_analysis(game)
+        analysis = nfl_tracker.get_cached_eliminator_analysis(game)
         probability_data = game.get('probabilities', {})
         
         # Determine the favorite team and their probability
@@ -3636,7 +6351,7 @@ def get_eliminator_strategy(week):
     
     all_analyses = []
     for game in games:
-        analysis = nfl_tracker.get_advanced_eliminator_analysis(game)
+        analysis = nfl_tracker.get_cached_eliminator_analysis(game)
         probability_data = game.get('probabilities', {})
         
         # Determine recommended team details
@@ -3866,11 +6581,15 @@ def get_team_injuries_endpoint(team_abbr):
 def get_nfl_news_endpoint():
     """API endpoint to get latest NFL news"""
     try:
-        news = nfl_tracker.get_nfl_news_feed()
+        # Keep the feed's original 'title' field alongside the store's 'headline'
+        news = [dict(item, title=item.get('headline', '')) for item in nfl_tracker.get_nfl_news_feed()]
         return jsonify({
             'news_items': news,
             'total_items': len(news),
-            'high_impact_news': [item for item in news if item.get('impact', 1) >= 4]
+            'high_impact_news': [item for item in news if item.get('impact', 1) >= 4],
+            # Seconds old per feed currently served from cache because it is failing (None = fresh)
+            'stale_seconds': {'site': nfl_tracker.get_source_staleness(nfl_tracker.news_site_url),
+                              'rss': nfl_tracker.get_source_staleness(nfl_tracker.news_rss_url)}
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -3890,10 +6609,10 @@ def get_game_insights(week):
                 'game_id': game.get('id', ''),
                 'matchup': f"{game.get('away_team', {}).get('abbr', 'UNK')} @ {game.get('home_team', {}).get('abbr', 'UNK')}",
                 'injury_summary': {
-                    'home_injuries': len(injury_data.get('home_injuries', [])),
-                    'away_injuries': len(injury_data.get('away_injuries', [])),
-                    'home_impact': injury_data.get('impact_summary', {}).get('home_impact', 0),
-                    'away_impact': injury_data.get('impact_summary', {}).get('away_impact', 0)
+                    'home_injuries': len(injury_data.get('home_team', [])),
+                    'away_injuries': len(injury_data.get('away_team', [])),
+                    'home_impact': nfl_tracker.calculate_injury_impact(injury_data.get('home_team', [])),
+                    'away_impact': nfl_tracker.calculate_injury_impact(injury_data.get('away_team', []))
                 },
                 'news_count': len(relevant_news),
                 'high_impact_news': len([news for news in relevant_news if news.get('impact', 1) >= 4])
@@ -3917,35 +6636,38 @@ def get_game_insights(week):
 def get_line_movements(week):
     """API endpoint to get line movements for games in a specific week"""
     try:
-        games = nfl_tracker.get_games_for_week(week)
-
-        movements_data = []
-        for game in games:
-            game_id = game.get('id', '')
-            if game_id:
-                movements = nfl_tracker.get_line_movements_for_game(game_id)
-
-                if movements:
-                    movements_data.append({
-                        'game_id': game_id,
-                        'matchup': f"{game.get('away_team', {}).get('abbr', 'UNK')} @ {game.get('home_team', {}).get('abbr', 'UNK')}",
-                        'movements': movements,
-                        'total_movements': len(movements),
-                        'significant_movements': len([m for m in movements if m.get('significance') == 'high']),
-                        'sharp_money_indicators': len([m for m in movements if m.get('indicator') == 'sharp_money'])
-                    })
+        def build_line_movements():
+            games = nfl_tracker.get_games_for_week(week)
+
+            movements_data = []
+            for game in games:
+                game_id = game.get('id', '')
+                if game_id:
+                    movements = nfl_tracker.get_line_movements_for_game(game_id)
+
+                    if movements:
+                        movements_data.append({
+                            'game_id': game_id,
+                            'matchup': f"{game.get('away_team', {}).get('abbr', 'UNK')} @ {game.get('home_team', {}).get('abbr', 'UNK')}",
+                            'movements': movements,
+                            'total_movements': len(movements),
+                            'significant_movements': len([m for m in movements if m.get('significance') == 'high']),
+                            'sharp_money_indicators': len([m for m in movements if m.get('indicator') == 'sharp_money'])
+                        })
 
-        return jsonify({
-            'week': week,
-            'season': nfl_tracker.current_season,
-            'games_with_movements': movements_data,
-            'summary': {
-                'total_games_analyzed': len(games),
-                'games_with_movements': len(movements_data),
-                'total_movements': sum(g['total_movements'] for g in movements_data),
-                'sharp_money_games': len([g for g in movements_data if g['sharp_money_indicators'] > 0])
+            return {
+                'week': week,
+                'season': nfl_tracker.current_season,
+                'games_with_movements': movements_data,
+                'summary': {
+                    'total_games_analyzed': len(games),
+                    'games_with_movements': len(movements_data),
+                    'total_movements': sum(g['total_movements'] for g in movements_data),
+                    'sharp_money_games': len([g for g in movements_data if g['sharp_money_indicators'] > 0])
+                }
             }
-        })
+
+        return conditional_week_response(week, 'line-movements', build_line_movements)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -3983,49 +6705,93 @@ def get_historical_odds(game_id):
 def get_sharp_money_alerts(week):
     """API endpoint to get sharp money alerts for a specific week"""
     try:
-        games = nfl_tracker.get_games_for_week(week)
-
-        sharp_alerts = []
-        for game in games:
-            game_id = game.get('id', '')
-            if game_id:
-                movements = nfl_tracker.get_line_movements_for_game(game_id)
+        def build_sharp_money_alerts():
+            games = nfl_tracker.get_games_for_week(week)
+
+            sharp_alerts = []
+            for game in games:
+                game_id = game.get('id', '')
+                if game_id:
+                    movements = nfl_tracker.get_line_movements_for_game(game_id)
+
+                    # Filter for sharp money indicators
+                    sharp_movements = [m for m in movements if m.get('indicator') in ['sharp_money', 'possible_sharp']]
+
+                    if sharp_movements:
+                        sharp_alerts.append({
+                            'game_id': game_id,
+                            'matchup': f"{game.get('away_team', {}).get('abbr', 'UNK')} @ {game.get('home_team', {}).get('abbr', 'UNK')}",
+                            'date': game.get('date', ''),
+                            'sharp_movements': sharp_movements,
+                            'alert_level': 'high' if any(m.get('indicator') == 'sharp_money' for m in sharp_movements) else 'medium'
+                        })
 
-                # Filter for sharp money indicators
-                sharp_movements = [m for m in movements if m.get('indicator') in ['sharp_money', 'possible_sharp']]
+            # Sort by alert level and number of sharp movements
+            sharp_alerts.sort(key=lambda x: (
+                -1 if x['alert_level'] == 'high' else 0,
+                -len(x['sharp_movements'])
+            ))
 
-                if sharp_movements:
-                    sharp_alerts.append({
-                        'game_id': game_id,
-                        'matchup': f"{game.get('away_team', {}).get('abbr', 'UNK')} @ {game.get('home_team', {}).get('abbr', 'UNK')}",
-                        'date': game.get('date', ''),
-                        'sharp_movements': sharp_movements,
-                        'alert_level': 'high' if any(m.get('indicator') == 'sharp_money' for m in sharp_movements) else 'medium'
-                    })
+            return {
+                'week': week,
+                'season': nfl_tracker.current_season,
+                'sharp_money_alerts': sharp_alerts,
+                'summary': {
+                    'total_alerts': len(sharp_alerts),
+                    'high_priority': len([a for a in sharp_alerts if a['alert_level'] == 'high']),
+                    'medium_priority': len([a for a in sharp_alerts if a['alert_level'] == 'medium'])
+                }
+            }
 
-        # Sort by alert level and number of sharp movements
-        sharp_alerts.sort(key=lambda x: (
-            -1 if x['alert_level'] == 'high' else 0,
-            -len(x['sharp_movements'])
-        ))
+        return conditional_week_response(week, 'sharp-money-alerts', build_sharp_money_alerts)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
+@app.route('/api/changes/<int:week>')
+def get_week_changes(week):
+    """Change log for a week's cached games (pass ?since=<seq> to get only newer entries)"""
+    try:
+        since = request.args.get('since', 0, type=int)
+        changes = nfl_tracker.get_week_changes(week, since)
         return jsonify({
             'week': week,
             'season': nfl_tracker.current_season,
-            'sharp_money_alerts': sharp_alerts,
-            'summary': {
-                'total_alerts': len(sharp_alerts),
-                'high_priority': len([a for a in sharp_alerts if a['alert_level'] == 'high']),
-                'medium_priority': len([a for a in sharp_alerts if a['alert_level'] == 'medium'])
-            }
+            'changes': changes,
+            'latest_seq': changes[-1]['seq'] if changes else since
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def format_sse_event(event):
+    """Format a live event as a Server-Sent Events frame"""
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+@app.route('/api/live/stream')
+def live_stream():
+    """Server-Sent Events feed of score, odds, line movement and injury deltas"""
+    subscriber = nfl_tracker.subscribe_live_updates()
+
+    def generate():
+        try:
+            yield 'retry: 5000\n\n'
+            while True:
+                try:
+                    event = subscriber.get(timeout=15)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield format_sse_event(event)
+        finally:
+            nfl_tracker.unsubscribe_live_updates(subscriber)
+
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 if __name__ == '__main__':
-    import os
     port = int(os.environ.get('PORT', 5001))
     debug_mode = os.environ.get('FLASK_ENV', 'development') == 'development'
     print("Starting NFL Game Tracker...")
     print(f"Access the application at: http://localhost:{port}")
-    app.run(debug=debug_mode, host='0.0.0.0', port=port)
\ No newline at end of file
+    create_app().run(debug=debug_mode, host='0.0.0.0', port=port)
\ No newline at end of file
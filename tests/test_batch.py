@@ -0,0 +1,28 @@
+"""Batch week responses share cached bodies with the single-week routes."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+def test_batch_and_single_week_reuse_one_body(monkeypatch):
+    tracker = app_module.nfl_tracker
+    builds = []
+
+    def build_games_payload(week, fields=None):
+        builds.append(week)
+        return [{'id': f'40179{week}', 'status': 'final'}]
+
+    monkeypatch.setattr(app_module, 'build_games_payload', build_games_payload)
+    monkeypatch.setattr(tracker, 'is_week_cache_current', lambda week: True)
+    monkeypatch.setattr(tracker, 'get_week_etag', lambda week, variant='', sections=None: f"{week}:{variant}:{sections}")
+    monkeypatch.setattr(tracker, 'refresh_odds_cache', lambda: None)
+    client = app_module.app.test_client()
+
+    assert client.get('/api/games/7?view=scores').status_code == 200
+    response = client.get('/api/games?weeks=7&view=scores')
+    assert response.get_json()['data']['7'] == [{'id': '401797', 'status': 'final'}]
+    assert client.get('/api/games/7?view=scores').status_code == 200
+    assert builds == [7]
@@ -0,0 +1,150 @@
+"""Stress test: concurrent week requests against a scheduled refresh and the score poller.
+
+Upstream calls are replaced with in-memory fakes so the test runs offline.
+"""
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+WEEK = 3
+SECTIONS = ['weather', 'injuries', 'analytics']
+
+
+def make_game(index, date='2025-09-21T17:00Z'):
+    return {
+        'id': f'40177{index:04d}',
+        'date': date,
+        'status': 'live',
+        'venue': 'Lambeau Field',
+        'home_team': {'id': str(index * 2 + 1), 'abbr': f'H{index}', 'score': 0, 'record': '1-1'},
+        'away_team': {'id': str(index * 2 + 2), 'abbr': f'A{index}', 'score': 0, 'record': '1-1'},
+        'home_score': 0,
+        'away_score': 0,
+    }
+
+
+@pytest.fixture
+def tracker(monkeypatch, tmp_path):
+    tracker = app_module.nfl_tracker
+    app_module.create_app(start_background=False)
+    upstream = {'home_score': 0, 'date': '2025-09-21T17:00Z'}
+    started = threading.Event()
+
+    def fetch_fresh_games_data(week, sections=None):
+        time.sleep(0.05)
+        games = [make_game(i) for i in range(8)]
+        games[0]['date'] = upstream['date']
+        for game in games:
+            game['home_score'] = game['home_team']['score'] = upstream['home_score']
+        return games
+
+    def fetch_scoreboard_scores(week):
+        return [{'id': f'40177{i:04d}', 'date': '2025-09-21T17:00Z', 'status': 'live',
+                 'home_team': {}, 'away_team': {}, 'home_score': upstream['home_score'], 'away_score': 0}
+                for i in range(8)]
+
+    def enhance_games_data(games, sections=None, week=None):
+        started.set()
+        time.sleep(0.3)  # a slow enrichment, so writers overlap
+        for game in games:
+            for section in sections or []:
+                game[section] = {'section': section}
+            game['enriched_at'] = dict(game.get('enriched_at', {}), **{section: time.time() for section in sections or []})
+        return games
+
+    monkeypatch.setattr(tracker, 'cache_file_path', str(tmp_path / 'weekly_cache.json'))
+    monkeypatch.setattr(tracker, 'get_current_week', lambda: WEEK)
+    monkeypatch.setattr(tracker, 'refresh_odds_cache', lambda: None)
+    monkeypatch.setattr(tracker, 'fetch_fresh_games_data', fetch_fresh_games_data)
+    monkeypatch.setattr(tracker, 'fetch_scoreboard_scores', fetch_scoreboard_scores)
+    monkeypatch.setattr(tracker, 'enhance_games_data', enhance_games_data)
+
+    week_key = str(WEEK)
+    with tracker.weekly_cache_lock:
+        tracker.weekly_games_cache[week_key] = [make_game(i) for i in range(8)]
+        tracker.weekly_cache_sections[week_key] = ['betting']
+        tracker.weekly_cache_timestamps[week_key] = datetime.now()
+        tracker.last_refresh_check[week_key] = datetime.now() - timedelta(hours=13)
+        tracker.update_week_hashes(week_key, tracker.weekly_games_cache[week_key])
+    tracker.score_poll_due.pop(week_key, None)
+
+    tracker.fake_upstream = upstream
+    tracker.enrichment_started = started
+    yield tracker
+    tracker.flush_weekly_cache()  # persist to tmp_path, not the repo's weekly_cache.json
+    for cache in (tracker.weekly_games_cache, tracker.weekly_cache_sections, tracker.weekly_cache_timestamps,
+                  tracker.last_refresh_check, tracker.score_poll_due, tracker.live_scoreboard):
+        cache.pop(week_key, None)
+    del tracker.fake_upstream, tracker.enrichment_started
+
+
+def test_concurrent_requests_during_refresh_and_score_polls(tracker):
+    errors = []
+    refresh_done = threading.Event()
+    urls = [f'/api/games/{WEEK}?fields=id,home_score,{",".join(SECTIONS)}',
+            f'/api/games/{WEEK}?view=scores',
+            f'/api/games?weeks={WEEK}&fields=id,{",".join(SECTIONS)}']
+
+    def hit(url):
+        client = app_module.app.test_client()
+        try:
+            for _ in range(3):
+                response = client.get(url)
+                body = response.get_json()
+                response.close()
+                if response.status_code != 200 or body is None:
+                    errors.append((url, response.status_code))
+        except Exception as e:
+            errors.append((url, repr(e)))
+
+    def refresh():
+        try:
+            tracker.fake_upstream['date'] = '2025-09-21T20:25Z'  # a schedule change that re-enriches weather
+            tracker.get_games_for_week(WEEK, ['betting'])
+        except Exception as e:
+            errors.append(('refresh', repr(e)))
+        finally:
+            refresh_done.set()
+
+    def poll():
+        try:
+            refresh_done.wait(10)
+            tracker.enrichment_started.wait(10)
+            for _ in range(5):
+                tracker.fake_upstream['home_score'] += 7
+                tracker.score_poll_due.pop(str(WEEK), None)
+                tracker.poll_week_scores(WEEK)
+                time.sleep(0.05)
+        except Exception as e:
+            errors.append(('poll', repr(e)))
+
+    threads = [threading.Thread(target=refresh), threading.Thread(target=poll)]
+    threads += [threading.Thread(target=hit, args=(url,)) for url in urls for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert errors == []
+
+    games = tracker.weekly_games_cache[str(WEEK)]
+    applied = tracker.get_week_sections(str(WEEK))
+    final_score = tracker.fake_upstream['home_score']
+    assert final_score == 35
+    for game in games:
+        # Both the poller's scores and the lazy enrichment survive
+        assert game['home_score'] == final_score
+        assert game['home_team']['score'] == final_score
+        for section in SECTIONS:
+            assert section in applied
+            assert game.get(section) == {'section': section}
+    assert next(game for game in games if game['id'] == '401770000')['date'] == '2025-09-21T20:25Z'
@@ -0,0 +1,75 @@
+"""Enrichment that loses upstream calls is marked on the game and retried per section."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+WEEK = 4
+
+
+def test_rate_limited_sections_are_marked_and_retried(monkeypatch):
+    tracker = app_module.nfl_tracker
+    games = [{'id': f'40178000{i}', 'home_team': {'abbr': f'H{i}'}, 'away_team': {'abbr': f'A{i}'}}
+             for i in range(3)]
+    limited = {'analytics': True}
+    queued = []
+
+    def get_team_analytics_for_game(game):
+        if limited['analytics'] and game['id'] != games[0]['id']:
+            tracker.note_upstream_failure()  # what http_request does when the token bucket is empty
+            return {}
+        return {'ok': True}
+
+    monkeypatch.setattr(tracker, 'get_injuries_for_teams', lambda teams: {})
+    monkeypatch.setattr(tracker, 'get_injury_data_for_game', lambda game: {'ok': True})
+    monkeypatch.setattr(tracker, 'get_team_analytics_for_game', get_team_analytics_for_game)
+    monkeypatch.setattr(tracker, 'prefetch_urls', lambda urls: None)
+    monkeypatch.setattr(tracker, 'schedule_fetch_retry', lambda week, games=None, **kwargs: queued.append(games))
+    monkeypatch.setattr(tracker, 'mark_week_dirty', lambda week_key: None)
+
+    enriched = tracker.enhance_games_data([dict(game) for game in games], ['injuries', 'analytics'], WEEK)
+    assert 'missing_sections' not in enriched[0]
+    assert [game.get('missing_sections') for game in enriched[1:]] == [['analytics'], ['analytics']]
+    assert queued == [{games[1]['id']: ['analytics'], games[2]['id']: ['analytics']}]
+    payload = app_module.project_game(enriched[1], ['id', 'injuries'])
+    assert payload['missing_sections'] == ['analytics']
+
+    # The background retry re-runs only the missing section and clears the marker
+    limited['analytics'] = False
+    monkeypatch.setitem(tracker.weekly_games_cache, str(WEEK), enriched)
+    monkeypatch.setattr(tracker, 'update_week_hashes', lambda week_key, games: None)
+    monkeypatch.setattr(tracker, 'get_injury_data_for_game', lambda game: {'refetched': True})
+    tracker.retry_week_enrichment(str(WEEK), queued[0])
+    published = tracker.weekly_games_cache[str(WEEK)]
+    assert all('missing_sections' not in game and game['analytics'] == {'ok': True} for game in published)
+    assert all(game['injuries'] == {'ok': True} for game in published)
+
+
+def test_refresh_reenriches_sections_past_their_ttl(monkeypatch):
+    tracker = app_module.nfl_tracker
+    now = app_module.time.time()
+    cached = {'id': '401780010', 'venue': 'Arrowhead', 'date': '2025-10-05T17:00Z',
+              'home_team': {'id': '12', 'abbr': 'KC'}, 'away_team': {'id': '6', 'abbr': 'DAL'},
+              'weather': 'old', 'injuries': 'old', 'news': 'old', 'analytics': 'old',
+              'missing_sections': ['analytics'],
+              'enriched_at': {'weather': now, 'injuries': now - 3600, 'news': now - 3600}}
+    fresh = {key: cached[key] for key in ('id', 'venue', 'date', 'home_team', 'away_team')}
+    rerun = []
+
+    def enhance_games_data(games, sections=None, week=None):
+        for game in games:
+            for section in sections:
+                rerun.append(section)
+                game[section] = 'new'
+        return games
+
+    monkeypatch.setitem(tracker.weekly_games_cache, str(WEEK), [cached])
+    monkeypatch.setattr(tracker, 'enhance_games_data', enhance_games_data)
+
+    merged, changes = tracker.merge_week_games(WEEK, [fresh], ['betting', 'weather', 'injuries', 'news', 'analytics'])
+    assert sorted(rerun) == ['injuries', 'news']
+    assert merged[0]['weather'] == 'old' and merged[0]['injuries'] == 'new' and merged[0]['news'] == 'new'
+    assert merged[0]['missing_sections'] == ['analytics']  # still queued for its retry
+    assert changes[0]['type'] == 'refreshed'
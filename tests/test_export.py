@@ -0,0 +1,30 @@
+"""Season export cursors."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+def test_cursor_resumes_after_reorder_and_trim(monkeypatch):
+    tracker = app_module.nfl_tracker
+    games = [{'id': game_id, 'status': 'final'} for game_id in ('401', '402', '403')]
+    odds = {'401': [{'timestamp': f'2025-09-0{day}T12:00:00'} for day in range(1, 5)]}
+    monkeypatch.setattr(tracker, 'weekly_games_cache', {'1': games})
+    monkeypatch.setattr(tracker, 'historical_odds', odds)
+    monkeypatch.setattr(tracker, 'get_cached_eliminator_analysis', lambda game: {})
+
+    records = list(tracker.iter_season_export(record_types=['game', 'odds']))
+    game_cursor = records[0]['cursor']
+    odds_cursor = records[4]['cursor']  # second odds snapshot
+    assert [r['game_id'] for r in records[:3]] == ['401', '402', '403']
+
+    # A refresh reorders the week and the odds history drops its oldest snapshots
+    tracker.weekly_games_cache['1'] = list(reversed(games))
+    odds['401'] = odds['401'][2:]
+
+    resumed = list(tracker.iter_season_export(game_cursor, ['game', 'odds']))
+    assert [r['game_id'] for r in resumed if r['type'] == 'game'] == ['402', '403']
+    resumed = list(tracker.iter_season_export(odds_cursor, ['odds']))
+    assert [r['data']['timestamp'] for r in resumed] == ['2025-09-03T12:00:00', '2025-09-04T12:00:00']
@@ -0,0 +1,21 @@
+"""?fields= validation on the games endpoints."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+def test_unknown_fields_are_rejected(monkeypatch):
+    tracker = app_module.nfl_tracker
+    monkeypatch.setattr(tracker, 'get_games_for_week', lambda week, sections=None: [{'id': '401', 'spread': -3}])
+    client = app_module.app.test_client()
+
+    for url in ('/api/games/1?fields=zzz', '/api/games/1?fields=spread,zzz', '/api/games?weeks=1&fields=zzz'):
+        response = client.get(url)
+        assert response.status_code == 400
+        assert 'zzz' in response.get_json()['error']
+
+    response = client.get('/api/games/1?fields=spread,weather')
+    assert response.status_code == 200
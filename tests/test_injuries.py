@@ -0,0 +1,87 @@
+"""Injury reports come from one league-wide fetch per TTL."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+REPORT = {'injuries': [
+    {'id': '12', 'displayName': 'Kansas City Chiefs', 'injuries': [
+        {'status': 'Out', 'shortComment': 'Hamstring, out Sunday',
+         'athlete': {'displayName': 'A Player', 'position': {'abbreviation': 'WR'}},
+         'details': {'type': 'Hamstring', 'detail': 'Strain'}}]},
+    {'id': '6', 'displayName': 'Dallas Cowboys', 'injuries': [
+        {'status': 'Questionable', 'athlete': {'displayName': 'B Player', 'position': {'abbreviation': 'CB'}},
+         'details': {'type': 'Ankle', 'detail': 'Sprain'}}]},
+]}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def json(self):
+        return REPORT
+
+
+def test_cold_week_costs_one_injury_fetch(monkeypatch):
+    tracker = app_module.nfl_tracker
+    calls = []
+    monkeypatch.setattr(tracker, 'team_enrichment_cache', {})
+    monkeypatch.setattr(tracker, 'injury_ref_cache', {})
+    monkeypatch.setattr(tracker, 'upstream_allowed', lambda: True)
+    monkeypatch.setattr(tracker, 'http_get', lambda url, **kwargs: calls.append(url) or FakeResponse())
+
+    injuries = tracker.get_injuries_for_teams({'KC': '12', 'DAL': '6', 'BUF': '2', 'SF': None})
+    assert calls == [tracker.league_injuries_url]
+    assert injuries['KC'] == [{'player_name': 'A Player', 'position': 'WR', 'status': 'Out',
+                               'description': 'Hamstring, out Sunday', 'type': 'Hamstring', 'severity': 5}]
+    assert injuries['DAL'][0]['status'] == 'Questionable'
+    assert injuries['BUF'] == [] and injuries['SF'] == []
+
+    # Every other team was cached by the same fetch
+    assert tracker.get_injuries_for_teams({'GB': '9', 'KC': '12'})['KC'] == injuries['KC']
+    assert len(calls) == 1
+
+
+def test_league_refresh_resolves_only_changed_refs(monkeypatch):
+    tracker = app_module.nfl_tracker
+    parsed = []
+    parse_league_injury = tracker.parse_league_injury
+    core_ref = 'http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/athletes/9/injuries/77'
+    core_item = {'status': 'Doubtful', 'athlete': {'displayName': 'C Player', 'position': {'abbreviation': 'QB'}},
+                 'details': {'type': 'Shoulder'}}
+    listed = {'injuries': [
+        {'id': '12', 'injuries': [dict(REPORT['injuries'][0]['injuries'][0], id='1'), {'$ref': core_ref}]},
+        {'id': '6', 'injuries': [dict(REPORT['injuries'][1]['injuries'][0], id='2')]},
+    ]}
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, url):
+            self.url = url
+
+        def json(self):
+            return core_item if self.url == core_ref else listed
+
+    fetched = []
+    monkeypatch.setattr(tracker, 'team_enrichment_cache', {})
+    monkeypatch.setattr(tracker, 'injury_ref_cache', {})
+    monkeypatch.setattr(tracker, 'prefetch_urls', lambda urls: None)
+    monkeypatch.setattr(tracker, 'http_get', lambda url, **kwargs: fetched.append(url) or Response(url))
+    monkeypatch.setattr(tracker, 'parse_league_injury', lambda item: parsed.append(item) or parse_league_injury(item))
+
+    report = tracker.fetch_league_injuries()
+    assert [injury['player_name'] for injury in report['12']] == ['A Player', 'C Player']
+    assert len(parsed) == 3 and fetched.count(core_ref) == 1
+    dallas_cached_at = tracker.team_enrichment_cache[('injuries', '6')][0]
+
+    # Next fetch: KC's player is upgraded and the $ref item is gone; Dallas is unchanged
+    listed['injuries'][0]['injuries'] = [dict(listed['injuries'][0]['injuries'][0], status='Questionable')]
+    parsed.clear()
+    report = tracker.fetch_league_injuries()
+    assert [injury['status'] for injury in report['12']] == ['Questionable']
+    assert [item['id'] for item in parsed] == ['1']
+    assert core_ref not in tracker.injury_ref_cache
+    assert tracker.team_enrichment_cache[('injuries', '6')][0] == dallas_cached_at
@@ -0,0 +1,50 @@
+"""News tagging and per-game lookup."""
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+def test_washington_game_finds_its_news(monkeypatch):
+    tracker = app_module.nfl_tracker
+    headlines = ['Commanders activate WR from injured reserve', 'Cowboys hold walkthrough', 'Chiefs sign K']
+    articles = [{'id': f'espn:{i}', 'headline': headline, 'teams': sorted(tracker.find_team_mentions(headline))}
+                for i, headline in enumerate(headlines)]
+    monkeypatch.setattr(tracker, 'news_cache', {'news_items': articles})
+    monkeypatch.setattr(tracker, 'news_cache_time', datetime.now())
+
+    # ESPN scoreboards abbreviate Washington as WSH
+    game = {'home_team': {'abbr': 'WSH'}, 'away_team': {'abbr': 'DAL'}}
+    assert [article['headline'] for article in tracker.get_game_news(game)] == headlines[:2]
+    assert tracker.find_team_mentions('WSH at DAL') == {'WAS', 'DAL'}
+
+
+def test_concurrent_readers_ingest_once(monkeypatch):
+    tracker = app_module.nfl_tracker
+    fetches = []
+
+    def fetch_site_news_items():
+        fetches.append('site')
+        time.sleep(0.1)  # slow upstream, so readers pile up behind the first ingest
+        return [{'guid': 'espn:1', 'title': 'Chiefs sign K', 'link': 'https://espn.com/1', 'published': ''}]
+
+    monkeypatch.setattr(tracker, 'news_cache', {})
+    monkeypatch.setattr(tracker, 'news_cache_time', None)
+    monkeypatch.setattr(tracker, 'upstream_allowed', lambda: True)
+    monkeypatch.setattr(tracker, 'fetch_site_news_items', fetch_site_news_items)
+    monkeypatch.setattr(tracker, 'fetch_rss_news_items', lambda: [])
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(tracker.get_nfl_news_feed())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert fetches == ['site']
+    assert all(len(items) == 1 for items in results) and len(results) == 8
@@ -0,0 +1,59 @@
+"""Startup warm-up retries steps that did not warm their cache."""
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+WEEK = 5
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_failing_upstream_keeps_warmup_retrying(monkeypatch):
+    tracker = app_module.nfl_tracker
+    upstream = {'up': False}
+
+    def update_team_records_weekly():
+        if upstream['up']:
+            tracker.team_records_last_updated = datetime.now()
+
+    def get_games_for_week(week, sections=None):
+        # Like the real method: failures are logged and come back as no games
+        if upstream['up']:
+            tracker.weekly_games_cache[str(week)] = [{'id': '401'}]
+        return tracker.weekly_games_cache.get(str(week), [])
+
+    monkeypatch.setattr(tracker, 'process_mode', 'standalone')
+    monkeypatch.setattr(tracker, 'warmup_status', {'state': 'pending', 'steps': {}, 'attempts': 0,
+                                                   'next_retry_at': None, 'started_at': None, 'finished_at': None})
+    monkeypatch.setattr(tracker, 'weekly_games_cache', {})
+    monkeypatch.setattr(tracker, 'team_records_last_updated', None)
+    monkeypatch.setattr(tracker, 'current_week_cache', WEEK)
+    monkeypatch.setattr(tracker, 'get_current_week', lambda: WEEK)
+    monkeypatch.setattr(tracker, 'should_perform_daily_refresh', lambda: False)
+    monkeypatch.setattr(tracker, 'update_team_records_weekly', update_team_records_weekly)
+    monkeypatch.setattr(tracker, 'get_games_for_week', get_games_for_week)
+
+    warmup = threading.Thread(target=tracker.run_startup_warmup, daemon=True)
+    warmup.start()
+    assert wait_for(lambda: tracker.warmup_status['state'] == 'retrying')
+    assert tracker.warmup_status['steps'] == {'team_records': 'failed', 'current_week': 'failed'}
+    assert not tracker.is_ready()
+
+    # Upstream recovers: the next retry warms both caches
+    upstream['up'] = True
+    tracker.warmup_retry_event.set()
+    warmup.join(5)
+    assert tracker.warmup_status['state'] == 'ready'
+    assert tracker.warmup_status['steps'] == {'team_records': 'done', 'current_week': 'done'}
+    assert tracker.is_ready()